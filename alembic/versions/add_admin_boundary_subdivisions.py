@@ -0,0 +1,59 @@
+"""add subdivided administrative boundary geometries
+
+Revision ID: add_admin_boundary_subdivisions
+Revises: add_admin_statistics_materialized_indexes
+Create Date: 2026-10-16 16:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import geoalchemy2 as ga
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_admin_boundary_subdivisions'
+down_revision = 'add_admin_statistics_materialized_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('administrative_boundary_subdivisions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('admin_id', sa.String(), nullable=False),
+        sa.Column('geom', ga.Geometry(geometry_type='POLYGON', srid=4326, spatial_index=False), nullable=False),
+        sa.ForeignKeyConstraint(['admin_id'], ['administrative_boundaries.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('admin_boundary_subdivisions_geom_idx', 'administrative_boundary_subdivisions', ['geom'], unique=False, postgresql_using='gist')
+    op.create_index('admin_boundary_subdivisions_admin_idx', 'administrative_boundary_subdivisions', ['admin_id'], unique=False)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION administrative_boundaries_subdivide() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM administrative_boundary_subdivisions WHERE admin_id = NEW.id;
+            INSERT INTO administrative_boundary_subdivisions (admin_id, geom)
+            SELECT NEW.id, ST_Subdivide(NEW.geom, 256);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER administrative_boundaries_subdivide_trg
+        AFTER INSERT OR UPDATE OF geom ON administrative_boundaries
+        FOR EACH ROW EXECUTE FUNCTION administrative_boundaries_subdivide()
+    """)
+
+    # Backfill existing boundaries
+    op.execute("""
+        INSERT INTO administrative_boundary_subdivisions (admin_id, geom)
+        SELECT id, ST_Subdivide(geom, 256) FROM administrative_boundaries
+    """)
+
+
+def downgrade():
+    op.execute('DROP TRIGGER IF EXISTS administrative_boundaries_subdivide_trg ON administrative_boundaries')
+    op.execute('DROP FUNCTION IF EXISTS administrative_boundaries_subdivide()')
+    op.drop_index('admin_boundary_subdivisions_admin_idx', table_name='administrative_boundary_subdivisions')
+    op.drop_index('admin_boundary_subdivisions_geom_idx', table_name='administrative_boundary_subdivisions')
+    op.drop_table('administrative_boundary_subdivisions')
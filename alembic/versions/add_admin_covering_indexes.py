@@ -0,0 +1,44 @@
+"""add covering indexes for admin dashboard lookups
+
+Revision ID: add_admin_covering_indexes
+Revises: add_admin_stats_level_rate_index
+Create Date: 2026-10-16 17:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_admin_covering_indexes'
+down_revision = 'add_admin_stats_level_rate_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY and VACUUM cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bs_admin_cover
+            ON building_statistics (admin_id)
+            INCLUDE (total_buildings, electrified_buildings, electrification_rate,
+                     avg_consumption_kwh_month, avg_energy_demand_kwh_year)
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ab_parent_cover
+            ON administrative_boundaries (parent_id)
+            INCLUDE (id, name, level, level_num)
+        """)
+        # Covered by the leading column of ix_ab_parent_cover
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS admin_boundaries_parent_idx')
+        # Index-only scans need the visibility map to be current
+        op.execute('VACUUM (ANALYZE) building_statistics')
+        op.execute('VACUUM (ANALYZE) administrative_boundaries')
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS admin_boundaries_parent_idx ON administrative_boundaries (parent_id)')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_ab_parent_cover')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_bs_admin_cover')
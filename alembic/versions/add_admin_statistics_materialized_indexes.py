@@ -0,0 +1,65 @@
+"""rebuild admin statistics views with a unique index on the materialized view
+
+Revision ID: add_admin_statistics_materialized_indexes
+Revises: add_building_statistics_std_consumption
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_admin_statistics_materialized_indexes'
+down_revision = 'add_building_statistics_std_consumption'
+branch_labels = None
+depends_on = None
+
+
+def _create_views(std_column):
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS admin_statistics_materialized')
+    op.execute('DROP VIEW IF EXISTS admin_statistics_view')
+    op.execute(f"""
+        CREATE VIEW admin_statistics_view AS
+        SELECT
+            ab.id,
+            ab.name,
+            ab.level,
+            ab.level_num,
+            ab.parent_id,
+            bs.total_buildings,
+            bs.electrified_buildings,
+            bs.high_confidence_50,
+            bs.high_confidence_60,
+            bs.high_confidence_70,
+            bs.high_confidence_80,
+            bs.high_confidence_85,
+            bs.high_confidence_90,
+            bs.unelectrified_buildings,
+            bs.electrification_rate,
+            bs.high_confidence_rate_50,
+            bs.high_confidence_rate_60,
+            bs.high_confidence_rate_70,
+            bs.high_confidence_rate_80,
+            bs.high_confidence_rate_85,
+            bs.high_confidence_rate_90,
+            bs.avg_consumption_kwh_month,
+            bs.avg_energy_demand_kwh_year,
+            {std_column}
+            ab.geom
+        FROM administrative_boundaries ab
+        JOIN building_statistics bs ON ab.id = bs.admin_id
+    """)
+    op.execute('CREATE MATERIALIZED VIEW admin_statistics_materialized AS SELECT * FROM admin_statistics_view')
+    op.execute('CREATE INDEX admin_stats_mat_level_idx ON admin_statistics_materialized (level)')
+    op.execute('CREATE INDEX admin_stats_mat_geom_idx ON admin_statistics_materialized USING gist (geom)')
+
+
+def upgrade():
+    _create_views('bs.avg_std_consumption_kwh_month,')
+    # The unique index lets REFRESH MATERIALIZED VIEW CONCURRENTLY run
+    op.execute('CREATE UNIQUE INDEX admin_stats_mat_id_idx ON admin_statistics_materialized (id)')
+
+
+def downgrade():
+    _create_views('')
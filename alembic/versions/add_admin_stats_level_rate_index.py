@@ -0,0 +1,32 @@
+"""index admin_statistics_materialized by level and electrification rate
+
+Revision ID: add_admin_stats_level_rate_index
+Revises: use_arrays_for_high_confidence_stats
+Create Date: 2026-10-16 17:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_admin_stats_level_rate_index'
+down_revision = 'use_arrays_for_high_confidence_stats'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Serves the top/least electrified regions as an index-only scan; the
+    # level prefix also covers everything admin_stats_mat_level_idx did
+    op.execute("""
+        CREATE INDEX admin_stats_mat_level_rate_idx
+        ON admin_statistics_materialized (level, electrification_rate)
+        INCLUDE (name, total_buildings)
+    """)
+    op.execute('DROP INDEX IF EXISTS admin_stats_mat_level_idx')
+
+
+def downgrade():
+    op.execute('CREATE INDEX admin_stats_mat_level_idx ON admin_statistics_materialized (level)')
+    op.execute('DROP INDEX IF EXISTS admin_stats_mat_level_rate_idx')
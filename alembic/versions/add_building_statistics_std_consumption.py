@@ -0,0 +1,25 @@
+"""add average consumption std dev to building statistics
+
+Revision ID: add_building_statistics_std_consumption
+Revises: use_brin_for_year_indexes
+Create Date: 2026-10-16 15:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_building_statistics_std_consumption'
+down_revision = 'use_brin_for_year_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Filled in by scripts/refresh_building_statistics.py
+    op.add_column('building_statistics', sa.Column('avg_std_consumption_kwh_month', sa.Float(), server_default='0', nullable=True))
+
+
+def downgrade():
+    op.drop_column('building_statistics', 'avg_std_consumption_kwh_month')
@@ -0,0 +1,48 @@
+"""add (year, grid_node_id) cluster index to buildings_energy
+
+Revision ID: add_buildings_energy_year_grid_cluster_index
+Revises: add_project_area_geometry_display
+Create Date: 2026-10-16 18:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_buildings_energy_year_grid_cluster_index'
+down_revision = 'add_project_area_geometry_display'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_be_year_grid
+            ON buildings_energy (year, grid_node_id)
+        """)
+    # The CLUSTER itself takes an exclusive lock and is left to
+    # scripts/cluster_buildings_energy.py; this only records the index it uses
+    op.execute('ALTER TABLE buildings_energy CLUSTER ON ix_be_year_grid')
+    # Vacuum more often so updated rows reuse space near their neighbours
+    # instead of drifting to the end of the heap
+    op.execute("""
+        ALTER TABLE buildings_energy SET (
+            autovacuum_vacuum_scale_factor = 0.05,
+            autovacuum_analyze_scale_factor = 0.02
+        )
+    """)
+
+
+def downgrade():
+    op.execute("""
+        ALTER TABLE buildings_energy RESET (
+            autovacuum_vacuum_scale_factor,
+            autovacuum_analyze_scale_factor
+        )
+    """)
+    op.execute('ALTER TABLE buildings_energy SET WITHOUT CLUSTER')
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_be_year_grid')
@@ -0,0 +1,40 @@
+"""generate project area size and building centroid coordinates
+
+Revision ID: add_generated_area_and_centroid_columns
+Revises: use_lz4_for_properties_compression
+Create Date: 2026-10-16 19:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_generated_area_and_centroid_columns'
+down_revision = 'use_lz4_for_properties_compression'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # A plain column cannot be turned into a generated one, so it is
+    # re-added; the values are recomputed on the spheroid for every row
+    op.execute('ALTER TABLE project_areas DROP COLUMN IF EXISTS area_sq_km')
+    op.execute("""
+        ALTER TABLE project_areas
+        ADD COLUMN area_sq_km double precision
+        GENERATED ALWAYS AS (ST_Area(geometry::geography) / 1000000) STORED
+    """)
+    # One ALTER so buildings_energy is rewritten once for both columns
+    op.execute("""
+        ALTER TABLE buildings_energy
+        ADD COLUMN IF NOT EXISTS lon double precision GENERATED ALWAYS AS (ST_X(ST_Centroid(geom))) STORED,
+        ADD COLUMN IF NOT EXISTS lat double precision GENERATED ALWAYS AS (ST_Y(ST_Centroid(geom))) STORED
+    """)
+
+
+def downgrade():
+    op.execute('ALTER TABLE buildings_energy DROP COLUMN IF EXISTS lat, DROP COLUMN IF EXISTS lon')
+    op.execute('ALTER TABLE project_areas DROP COLUMN IF EXISTS area_sq_km')
+    op.add_column('project_areas', sa.Column('area_sq_km', sa.Float(), nullable=True))
+    op.execute('UPDATE project_areas SET area_sq_km = ST_Area(geometry::geography) / 1000000')
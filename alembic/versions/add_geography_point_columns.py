@@ -0,0 +1,43 @@
+"""add geography point columns for distance queries
+
+Revision ID: add_geography_point_columns
+Revises: add_unelectrified_building_geom_indexes
+Create Date: 2026-10-16 16:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import geoalchemy2 as ga
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_geography_point_columns'
+down_revision = 'add_unelectrified_building_geom_indexes'
+branch_labels = None
+depends_on = None
+
+
+# (table, new column, generation expression, index). Stored generated
+# columns so every insert path fills them; adding one rewrites the table.
+GEOGRAPHY_COLUMNS = [
+    ('grid_nodes', 'location_geog', 'location::geography', 'idx_grid_nodes_location_geog'),
+    ('power_plants', 'location_geog', 'location::geography', 'idx_power_plants_location_geog'),
+    ('buildings_energy', 'centroid', 'ST_Centroid(geom)::geography', 'idx_buildings_energy_centroid'),
+    ('unelectrified_clusters', 'centroid', 'ST_Centroid(area)::geography', 'unelectrified_clusters_centroid_idx'),
+]
+
+
+def upgrade():
+    for table_name, column_name, expression, index_name in GEOGRAPHY_COLUMNS:
+        op.add_column(table_name, sa.Column(
+            column_name,
+            ga.Geography(geometry_type='POINT', srid=4326, spatial_index=False),
+            sa.Computed(expression, persisted=True),
+        ))
+        op.create_index(index_name, table_name, [column_name], unique=False, postgresql_using='gist')
+
+
+def downgrade():
+    for table_name, column_name, expression, index_name in GEOGRAPHY_COLUMNS:
+        op.drop_index(index_name, table_name=table_name)
+        op.drop_column(table_name, column_name)
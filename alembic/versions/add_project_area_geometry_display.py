@@ -0,0 +1,32 @@
+"""add display geometry to project areas
+
+Revision ID: add_project_area_geometry_display
+Revises: add_admin_covering_indexes
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_project_area_geometry_display'
+down_revision = 'add_admin_covering_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Coarser than geometry_simplified (which feeds the stats joins); only
+    # serialized for map rendering, so it gets no spatial index
+    op.execute("""
+        ALTER TABLE project_areas
+        ADD COLUMN IF NOT EXISTS geometry_display geometry(MULTIPOLYGON, 4326)
+        GENERATED ALWAYS AS (
+            ST_SimplifyPreserveTopology(geometry, COALESCE(simplification_tolerance, 0.0005))
+        ) STORED
+    """)
+
+
+def downgrade():
+    op.execute('ALTER TABLE project_areas DROP COLUMN IF EXISTS geometry_display')
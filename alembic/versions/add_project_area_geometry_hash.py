@@ -0,0 +1,31 @@
+"""add generated geometry hash to project areas
+
+Revision ID: add_project_area_geometry_hash
+Revises: use_integer_grid_keys
+Create Date: 2026-10-16 19:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_project_area_geometry_hash'
+down_revision = 'use_integer_grid_keys'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Hashed once by PostgreSQL on every write, never in the API
+    op.execute("""
+        ALTER TABLE project_areas
+        ADD COLUMN IF NOT EXISTS geometry_hash text
+        GENERATED ALWAYS AS (md5(ST_AsBinary(geometry))) STORED
+    """)
+    op.create_index('project_areas_geometry_hash_idx', 'project_areas', ['geometry_hash'])
+
+
+def downgrade():
+    op.drop_index('project_areas_geometry_hash_idx', table_name='project_areas')
+    op.execute('ALTER TABLE project_areas DROP COLUMN IF EXISTS geometry_hash')
@@ -0,0 +1,34 @@
+"""add simplified geometry to project areas
+
+Revision ID: add_project_area_geometry_simplified
+Revises: add_unaccent_extension
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_project_area_geometry_simplified'
+down_revision = 'add_unaccent_extension'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Generated column so every insert path (drawn, uploads, enhanced) fills it
+    op.execute("""
+        ALTER TABLE project_areas
+        ADD COLUMN IF NOT EXISTS geometry_simplified geometry(MULTIPOLYGON, 4326)
+        GENERATED ALWAYS AS (ST_SimplifyPreserveTopology(geometry, 0.00001)) STORED
+    """)
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS project_areas_geom_simplified_idx '
+        'ON project_areas USING gist (geometry_simplified)'
+    )
+
+
+def downgrade():
+    op.execute('DROP INDEX IF EXISTS project_areas_geom_simplified_idx')
+    op.execute('ALTER TABLE project_areas DROP COLUMN IF EXISTS geometry_simplified')
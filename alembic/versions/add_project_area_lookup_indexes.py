@@ -0,0 +1,38 @@
+"""add composite and partial project area lookup indexes
+
+Revision ID: add_project_area_lookup_indexes
+Revises: add_village_name_trgm_index
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_project_area_lookup_indexes'
+down_revision = 'add_village_name_trgm_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS project_areas_project_id_id_idx
+            ON project_areas (project_id, id)
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS project_areas_pid_completed_idx
+            ON project_areas (project_id) WHERE processing_status = 'completed'
+        """)
+        # Covered by the leading column of the composite index
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS project_areas_project_idx')
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS project_areas_project_idx ON project_areas (project_id)')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS project_areas_pid_completed_idx')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS project_areas_project_id_id_idx')
@@ -0,0 +1,64 @@
+"""add subdivided project area geometries
+
+Revision ID: add_project_area_subdivisions
+Revises: add_project_area_geometry_simplified
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import geoalchemy2 as ga
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_project_area_subdivisions'
+down_revision = 'add_project_area_geometry_simplified'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('project_area_subdivisions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('area_id', sa.String(), nullable=False),
+        sa.Column('geom', ga.Geometry(geometry_type='POLYGON', srid=4326, spatial_index=False), nullable=False),
+        sa.ForeignKeyConstraint(['area_id'], ['project_areas.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('project_area_subdivisions_geom_idx', 'project_area_subdivisions', ['geom'], unique=False, postgresql_using='gist')
+    op.create_index('project_area_subdivisions_area_idx', 'project_area_subdivisions', ['area_id'], unique=False)
+
+    # Keep the pieces in sync with every insert path and geometry update
+    op.execute("""
+        CREATE OR REPLACE FUNCTION project_areas_subdivide() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM project_area_subdivisions WHERE area_id = NEW.id;
+            INSERT INTO project_area_subdivisions (area_id, geom)
+            SELECT NEW.id, ST_Subdivide(NEW.geometry_simplified, 256);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER project_areas_subdivide_trg
+        AFTER INSERT OR UPDATE OF geometry ON project_areas
+        FOR EACH ROW EXECUTE FUNCTION project_areas_subdivide()
+    """)
+
+    # Backfill existing areas
+    op.execute("""
+        INSERT INTO project_area_subdivisions (area_id, geom)
+        SELECT id, ST_Subdivide(geometry_simplified, 256) FROM project_areas
+    """)
+
+    # Large geometries are read far more than written; skip pglz decompression
+    op.execute('ALTER TABLE project_areas ALTER COLUMN geometry SET STORAGE EXTERNAL')
+
+
+def downgrade():
+    op.execute('ALTER TABLE project_areas ALTER COLUMN geometry SET STORAGE MAIN')
+    op.execute('DROP TRIGGER IF EXISTS project_areas_subdivide_trg ON project_areas')
+    op.execute('DROP FUNCTION IF EXISTS project_areas_subdivide()')
+    op.drop_index('project_area_subdivisions_area_idx', table_name='project_area_subdivisions')
+    op.drop_index('project_area_subdivisions_geom_idx', table_name='project_area_subdivisions')
+    op.drop_table('project_area_subdivisions')
@@ -0,0 +1,85 @@
+"""add precomputed project and project area building stats
+
+Revision ID: add_project_stats_materialized_views
+Revises: add_project_area_subdivisions
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_project_stats_materialized_views'
+down_revision = 'add_project_area_subdivisions'
+branch_labels = None
+depends_on = None
+
+
+STATS_COLUMNS = """
+        COUNT(*) AS total_buildings,
+        COUNT(*) FILTER (WHERE be.predicted_electrified = 1) AS electrified_buildings,
+        COUNT(*) FILTER (WHERE be.predicted_electrified = 0 OR be.predicted_electrified IS NULL) AS unelectrified_buildings,
+        AVG(be.consumption_kwh_month) AS avg_consumption_kwh_month,
+        AVG(be.energy_demand_kwh) AS avg_energy_demand_kwh_year"""
+
+
+def upgrade():
+    # Each row records the area state it was computed from so the API can
+    # tell a stale row apart and fall back to the live query
+    op.execute(f"""
+        CREATE MATERIALIZED VIEW project_area_stats_mv AS
+        SELECT
+            pa.id AS area_id,
+            pa.project_id,
+            COALESCE(pa.updated_at, pa.created_at) AS area_modified_at,
+            st.*
+        FROM project_areas pa
+        CROSS JOIN LATERAL (
+            SELECT {STATS_COLUMNS}
+            FROM buildings_energy be
+            WHERE be.id IN (
+                SELECT b.id
+                FROM project_area_subdivisions s
+                JOIN buildings_energy b ON s.geom && b.geom AND ST_Intersects(s.geom, b.geom)
+                WHERE s.area_id = pa.id
+            )
+        ) st
+    """)
+    op.execute('CREATE UNIQUE INDEX project_area_stats_mv_area_idx ON project_area_stats_mv (area_id)')
+
+    # Project totals are computed separately so buildings covered by
+    # overlapping areas are still counted once
+    op.execute(f"""
+        CREATE MATERIALIZED VIEW project_stats_mv AS
+        SELECT
+            p.project_id,
+            p.areas_modified_at,
+            p.area_count,
+            st.*
+        FROM (
+            SELECT
+                project_id,
+                MAX(COALESCE(updated_at, created_at)) AS areas_modified_at,
+                COUNT(id) AS area_count
+            FROM project_areas
+            GROUP BY project_id
+        ) p
+        CROSS JOIN LATERAL (
+            SELECT {STATS_COLUMNS}
+            FROM buildings_energy be
+            WHERE be.id IN (
+                SELECT b.id
+                FROM project_areas pa
+                JOIN project_area_subdivisions s ON s.area_id = pa.id
+                JOIN buildings_energy b ON s.geom && b.geom AND ST_Intersects(s.geom, b.geom)
+                WHERE pa.project_id = p.project_id
+            )
+        ) st
+    """)
+    op.execute('CREATE UNIQUE INDEX project_stats_mv_project_idx ON project_stats_mv (project_id)')
+
+
+def downgrade():
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS project_stats_mv')
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS project_area_stats_mv')
@@ -0,0 +1,64 @@
+"""add typed columns for frequently read JSONB properties
+
+Revision ID: add_typed_grid_property_columns
+Revises: add_geography_point_columns
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_typed_grid_property_columns'
+down_revision = 'add_geography_point_columns'
+branch_labels = None
+depends_on = None
+
+
+def _number(key):
+    # Non-numeric values become NULL instead of failing the write
+    return (f"CASE WHEN jsonb_typeof(properties->'{key}') = 'number' "
+            f"THEN (properties->>'{key}')::double precision END")
+
+
+def _text(key):
+    return f"properties->>'{key}'"
+
+
+# (table, column, type, expression). Stored generated columns are filled for
+# existing rows when added and kept in sync with every later write.
+PROPERTY_COLUMNS = [
+    ('grid_nodes', 'voltage_kv', sa.Float(), _number('voltage_kv')),
+    ('grid_nodes', 'status', sa.String(), _text('status')),
+    ('grid_lines', 'voltage_kv', sa.Float(), _number('voltage_kv')),
+    ('grid_lines', 'status', sa.String(), _text('status')),
+    ('power_plants', 'plant_type', sa.String(), _text('plant_type')),
+    ('power_plants', 'capacity_mw', sa.Float(), _number('capacity_mw')),
+    ('power_plants', 'status', sa.String(), _text('status')),
+    ('unelectrified_clusters', 'distance_to_grid_km', sa.Float(), _number('distance_to_grid_km')),
+]
+
+# jsonb_path_ops only supports containment (@>) and jsonpath, and is much
+# smaller than the default jsonb_ops
+PROPERTY_INDEXES = [
+    ('idx_grid_nodes_properties', 'grid_nodes'),
+    ('idx_grid_lines_properties', 'grid_lines'),
+    ('idx_power_plants_properties', 'power_plants'),
+    ('unelectrified_clusters_properties_idx', 'unelectrified_clusters'),
+]
+
+
+def upgrade():
+    for table_name, column_name, column_type, expression in PROPERTY_COLUMNS:
+        op.add_column(table_name, sa.Column(column_name, column_type, sa.Computed(expression, persisted=True)))
+    for index_name, table_name in PROPERTY_INDEXES:
+        op.create_index(index_name, table_name, ['properties'], unique=False,
+                        postgresql_using='gin', postgresql_ops={'properties': 'jsonb_path_ops'})
+
+
+def downgrade():
+    for index_name, table_name in PROPERTY_INDEXES:
+        op.drop_index(index_name, table_name=table_name)
+    for table_name, column_name, column_type, expression in PROPERTY_COLUMNS:
+        op.drop_column(table_name, column_name)
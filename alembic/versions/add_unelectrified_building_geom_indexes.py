@@ -0,0 +1,32 @@
+"""add partial GiST indexes on unelectrified building geometries
+
+Revision ID: add_unelectrified_building_geom_indexes
+Revises: add_admin_boundary_subdivisions
+Create Date: 2026-10-16 16:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_unelectrified_building_geom_indexes'
+down_revision = 'add_admin_boundary_subdivisions'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('idx_buildings_energy_geom_no_access', 'buildings_energy', ['geom'], unique=False,
+                    postgresql_using='gist', postgresql_where=sa.text('has_access = false'))
+    op.create_index('idx_buildings_energy_geom_predicted_unelectrified', 'buildings_energy', ['geom'], unique=False,
+                    postgresql_using='gist', postgresql_where=sa.text('predicted_electrified = 0'))
+    # A btree on a boolean is never selective enough to be chosen; the
+    # partial index covers the unelectrified lookups it was meant for
+    op.drop_index('idx_buildings_energy_has_access', table_name='buildings_energy')
+
+
+def downgrade():
+    op.create_index('idx_buildings_energy_has_access', 'buildings_energy', ['has_access'], unique=False)
+    op.drop_index('idx_buildings_energy_geom_predicted_unelectrified', table_name='buildings_energy')
+    op.drop_index('idx_buildings_energy_geom_no_access', table_name='buildings_energy')
@@ -0,0 +1,39 @@
+"""add trigram index on unaccented village names
+
+Revision ID: add_village_name_trgm_index
+Revises: add_project_stats_materialized_views
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_village_name_trgm_index'
+down_revision = 'add_project_stats_materialized_views'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # unaccent() is only STABLE, so expression indexes need an immutable wrapper
+    # with the dictionary pinned
+    op.execute("""
+        CREATE OR REPLACE FUNCTION immutable_unaccent(text) RETURNS text AS $$
+            SELECT public.unaccent('public.unaccent'::regdictionary, $1)
+        $$ LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    """)
+
+    # Serves the ILIKE '%...%' village typeahead
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS village_points_name_trgm_idx
+        ON village_points USING gin (immutable_unaccent(name) gin_trgm_ops)
+    """)
+
+
+def downgrade():
+    op.execute('DROP INDEX IF EXISTS village_points_name_trgm_idx')
+    op.execute('DROP FUNCTION IF EXISTS immutable_unaccent(text)')
@@ -0,0 +1,90 @@
+"""store high-confidence building statistics as arrays
+
+Revision ID: use_arrays_for_high_confidence_stats
+Revises: add_typed_grid_property_columns
+Create Date: 2026-10-16 17:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'use_arrays_for_high_confidence_stats'
+down_revision = 'add_typed_grid_property_columns'
+branch_labels = None
+depends_on = None
+
+
+THRESHOLDS = (50, 60, 70, 80, 85, 90)
+
+
+def _create_views(count_columns, rate_columns):
+    # The views keep exposing one column per threshold so the admin
+    # statistics tiles and the metrics queries are unchanged
+    op.execute(f"""
+        CREATE VIEW admin_statistics_view AS
+        SELECT
+            ab.id,
+            ab.name,
+            ab.level,
+            ab.level_num,
+            ab.parent_id,
+            bs.total_buildings,
+            bs.electrified_buildings,
+            {', '.join(count_columns)},
+            bs.unelectrified_buildings,
+            bs.electrification_rate,
+            {', '.join(rate_columns)},
+            bs.avg_consumption_kwh_month,
+            bs.avg_energy_demand_kwh_year,
+            bs.avg_std_consumption_kwh_month,
+            ab.geom
+        FROM administrative_boundaries ab
+        JOIN building_statistics bs ON ab.id = bs.admin_id
+    """)
+    op.execute('CREATE MATERIALIZED VIEW admin_statistics_materialized AS SELECT * FROM admin_statistics_view')
+    op.execute('CREATE UNIQUE INDEX admin_stats_mat_id_idx ON admin_statistics_materialized (id)')
+    op.execute('CREATE INDEX admin_stats_mat_level_idx ON admin_statistics_materialized (level)')
+    op.execute('CREATE INDEX admin_stats_mat_geom_idx ON admin_statistics_materialized USING gist (geom)')
+
+
+def _drop_views():
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS admin_statistics_materialized')
+    op.execute('DROP VIEW IF EXISTS admin_statistics_view')
+
+
+def upgrade():
+    _drop_views()
+    op.add_column('building_statistics', sa.Column('hc_counts', postgresql.ARRAY(sa.Integer(), dimensions=1), nullable=True))
+    op.add_column('building_statistics', sa.Column('hc_rates', postgresql.ARRAY(sa.Float(), dimensions=1), nullable=True))
+    op.execute(f"""
+        UPDATE building_statistics SET
+            hc_counts = ARRAY[{', '.join(f'high_confidence_{t}' for t in THRESHOLDS)}],
+            hc_rates = ARRAY[{', '.join(f'high_confidence_rate_{t}' for t in THRESHOLDS)}]
+    """)
+    for t in THRESHOLDS:
+        op.drop_column('building_statistics', f'high_confidence_{t}')
+        op.drop_column('building_statistics', f'high_confidence_rate_{t}')
+    _create_views(
+        [f'bs.hc_counts[{i}] AS high_confidence_{t}' for i, t in enumerate(THRESHOLDS, start=1)],
+        [f'bs.hc_rates[{i}] AS high_confidence_rate_{t}' for i, t in enumerate(THRESHOLDS, start=1)],
+    )
+
+
+def downgrade():
+    _drop_views()
+    for t in THRESHOLDS:
+        op.add_column('building_statistics', sa.Column(f'high_confidence_{t}', sa.Integer(), server_default='0', nullable=True))
+        op.add_column('building_statistics', sa.Column(f'high_confidence_rate_{t}', sa.Float(), server_default='0', nullable=True))
+    op.execute(f"""
+        UPDATE building_statistics SET
+            {', '.join(f'high_confidence_{t} = hc_counts[{i}], high_confidence_rate_{t} = hc_rates[{i}]' for i, t in enumerate(THRESHOLDS, start=1))}
+    """)
+    op.drop_column('building_statistics', 'hc_rates')
+    op.drop_column('building_statistics', 'hc_counts')
+    _create_views(
+        [f'bs.high_confidence_{t}' for t in THRESHOLDS],
+        [f'bs.high_confidence_rate_{t}' for t in THRESHOLDS],
+    )
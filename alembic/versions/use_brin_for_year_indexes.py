@@ -0,0 +1,45 @@
+"""use BRIN indexes for snapshot year columns
+
+Revision ID: use_brin_for_year_indexes
+Revises: use_spgist_for_grid_point_indexes
+Create Date: 2026-10-16 15:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'use_brin_for_year_indexes'
+down_revision = 'use_spgist_for_grid_point_indexes'
+branch_labels = None
+depends_on = None
+
+
+# (table, old btree index, new BRIN index). Rows are bulk loaded one
+# snapshot year at a time, so year follows physical order and a BRIN
+# summary is a tiny fraction of the btree size. minmax_multi needs PostgreSQL >= 14.
+YEAR_INDEXES = [
+    ('buildings_energy', 'idx_buildings_energy_year', 'idx_buildings_energy_year_brin'),
+    ('grid_nodes', 'idx_grid_nodes_year', 'idx_grid_nodes_year_brin'),
+    ('grid_lines', 'idx_grid_lines_year', 'idx_grid_lines_year_brin'),
+    ('power_plants', 'idx_power_plants_year', 'idx_power_plants_year_brin'),
+    ('unelectrified_clusters', 'unelectrified_clusters_year_idx', 'unelectrified_clusters_year_brin_idx'),
+]
+
+
+def upgrade():
+    for table_name, btree_name, brin_name in YEAR_INDEXES:
+        op.create_index(
+            brin_name, table_name, ['year'], unique=False,
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_ops={'year': 'int4_minmax_multi_ops'},
+        )
+        op.execute(f'DROP INDEX IF EXISTS {btree_name}')
+
+
+def downgrade():
+    for table_name, btree_name, brin_name in YEAR_INDEXES:
+        op.create_index(btree_name, table_name, ['year'], unique=False)
+        op.execute(f'DROP INDEX IF EXISTS {brin_name}')
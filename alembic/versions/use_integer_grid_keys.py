@@ -0,0 +1,70 @@
+"""use integer keys for grid tables and buildings_energy.grid_node_id
+
+Revision ID: use_integer_grid_keys
+Revises: add_generated_area_and_centroid_columns
+Create Date: 2026-10-16 19:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'use_integer_grid_keys'
+down_revision = 'add_generated_area_and_centroid_columns'
+branch_labels = None
+depends_on = None
+
+
+# (table, serial primary key); each dataset is a few thousand rows
+GRID_KEYS = [
+    ('grid_nodes', 'node_id'),
+    ('grid_lines', 'line_id'),
+    ('power_plants', 'plant_id'),
+]
+
+# Node references on grid_lines created by the 2025 grid import scripts
+LINE_NODE_COLUMNS = ['from_node_id', 'to_node_id']
+
+
+def _set_key_types(key_type):
+    for table_name, column in GRID_KEYS:
+        op.execute(f'ALTER TABLE {table_name} ALTER COLUMN {column} TYPE {key_type}')
+        # The serial sequence has its own type and limit
+        op.execute(f"""
+            DO $$
+            DECLARE seq text := pg_get_serial_sequence('{table_name}', '{column}');
+            BEGIN
+                IF seq IS NOT NULL THEN
+                    EXECUTE format('ALTER SEQUENCE %s AS {key_type}', seq);
+                END IF;
+            END $$
+        """)
+    columns = {c['name'] for c in sa.inspect(op.get_bind()).get_columns('grid_lines')}
+    for column in LINE_NODE_COLUMNS:
+        if column in columns:
+            op.execute(f'ALTER TABLE grid_lines ALTER COLUMN {column} TYPE {key_type}')
+
+
+def upgrade():
+    _set_key_types('integer')
+    # Non-numeric ids and ids with no matching node cannot be kept under the FK
+    op.execute(r"""
+        ALTER TABLE buildings_energy ALTER COLUMN grid_node_id TYPE integer
+        USING CASE WHEN grid_node_id ~ '^\d{1,9}$' THEN grid_node_id::integer END
+    """)
+    op.execute("""
+        UPDATE buildings_energy b SET grid_node_id = NULL
+        WHERE b.grid_node_id IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM grid_nodes n WHERE n.node_id = b.grid_node_id)
+    """)
+    op.create_foreign_key(
+        'buildings_energy_grid_node_id_fkey', 'buildings_energy', 'grid_nodes',
+        ['grid_node_id'], ['node_id'], ondelete='SET NULL'
+    )
+
+
+def downgrade():
+    op.drop_constraint('buildings_energy_grid_node_id_fkey', 'buildings_energy', type_='foreignkey')
+    op.execute('ALTER TABLE buildings_energy ALTER COLUMN grid_node_id TYPE varchar USING grid_node_id::varchar')
+    _set_key_types('bigint')
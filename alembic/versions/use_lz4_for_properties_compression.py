@@ -0,0 +1,31 @@
+"""use lz4 TOAST compression for JSONB properties columns
+
+Revision ID: use_lz4_for_properties_compression
+Revises: use_real_for_building_statistics_rates
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'use_lz4_for_properties_compression'
+down_revision = 'use_real_for_building_statistics_rates'
+branch_labels = None
+depends_on = None
+
+
+# Needs PostgreSQL >= 14 built with lz4. Only values written after this are
+# compressed with lz4; existing rows keep pglz until they are re-imported.
+TABLES = ['grid_nodes', 'grid_lines', 'power_plants', 'unelectrified_clusters']
+
+
+def upgrade():
+    for table_name in TABLES:
+        op.execute(f'ALTER TABLE {table_name} ALTER COLUMN properties SET COMPRESSION lz4')
+
+
+def downgrade():
+    for table_name in TABLES:
+        op.execute(f'ALTER TABLE {table_name} ALTER COLUMN properties SET COMPRESSION default')
@@ -0,0 +1,44 @@
+"""replace the predicted_electrified btree with partial indexes
+
+Revision ID: use_partial_indexes_for_building_flags
+Revises: add_buildings_energy_year_grid_cluster_index
+Create Date: 2026-10-16 18:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'use_partial_indexes_for_building_flags'
+down_revision = 'add_buildings_energy_year_grid_cluster_index'
+branch_labels = None
+depends_on = None
+
+
+# (partial index, predicate); only the minority subsets queries ask for are indexed
+PARTIAL_INDEXES = [
+    ('ix_be_no_access', 'has_access = false'),
+    ('ix_be_unelec', 'predicted_electrified = 0'),
+]
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        for index_name, predicate in PARTIAL_INDEXES:
+            op.execute(f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name}
+                ON buildings_energy (id) WHERE {predicate}
+            """)
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_buildings_energy_predicted_electrified')
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_buildings_energy_predicted_electrified
+            ON buildings_energy (predicted_electrified)
+        """)
+        for index_name, _ in PARTIAL_INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {index_name}')
@@ -0,0 +1,82 @@
+"""store building statistics rates and averages as real
+
+Revision ID: use_real_for_building_statistics_rates
+Revises: use_partial_indexes_for_building_flags
+Create Date: 2026-10-16 18:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'use_real_for_building_statistics_rates'
+down_revision = 'use_partial_indexes_for_building_flags'
+branch_labels = None
+depends_on = None
+
+
+THRESHOLDS = (50, 60, 70, 80, 85, 90)
+
+# (column, real type, double precision type)
+COLUMNS = [
+    ('electrification_rate', 'real', 'double precision'),
+    ('hc_rates', 'real[]', 'double precision[]'),
+    ('avg_consumption_kwh_month', 'real', 'double precision'),
+    ('avg_energy_demand_kwh_year', 'real', 'double precision'),
+    ('avg_std_consumption_kwh_month', 'real', 'double precision'),
+]
+
+
+def _create_views():
+    count_columns = ', '.join(f'bs.hc_counts[{i}] AS high_confidence_{t}' for i, t in enumerate(THRESHOLDS, start=1))
+    rate_columns = ', '.join(f'bs.hc_rates[{i}] AS high_confidence_rate_{t}' for i, t in enumerate(THRESHOLDS, start=1))
+    op.execute(f"""
+        CREATE VIEW admin_statistics_view AS
+        SELECT
+            ab.id,
+            ab.name,
+            ab.level,
+            ab.level_num,
+            ab.parent_id,
+            bs.total_buildings,
+            bs.electrified_buildings,
+            {count_columns},
+            bs.unelectrified_buildings,
+            bs.electrification_rate,
+            {rate_columns},
+            bs.avg_consumption_kwh_month,
+            bs.avg_energy_demand_kwh_year,
+            bs.avg_std_consumption_kwh_month,
+            ab.geom
+        FROM administrative_boundaries ab
+        JOIN building_statistics bs ON ab.id = bs.admin_id
+    """)
+    op.execute('CREATE MATERIALIZED VIEW admin_statistics_materialized AS SELECT * FROM admin_statistics_view')
+    op.execute('CREATE UNIQUE INDEX admin_stats_mat_id_idx ON admin_statistics_materialized (id)')
+    op.execute("""
+        CREATE INDEX admin_stats_mat_level_rate_idx
+        ON admin_statistics_materialized (level, electrification_rate)
+        INCLUDE (name, total_buildings)
+    """)
+    op.execute('CREATE INDEX admin_stats_mat_geom_idx ON admin_statistics_materialized USING gist (geom)')
+
+
+def _drop_views():
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS admin_statistics_materialized')
+    op.execute('DROP VIEW IF EXISTS admin_statistics_view')
+
+
+def upgrade():
+    # The views depend on the column types, so they are rebuilt around the change
+    _drop_views()
+    for column, real_type, _ in COLUMNS:
+        op.execute(f'ALTER TABLE building_statistics ALTER COLUMN {column} TYPE {real_type} USING {column}::{real_type}')
+    _create_views()
+
+
+def downgrade():
+    _drop_views()
+    for column, _, double_type in COLUMNS:
+        op.execute(f'ALTER TABLE building_statistics ALTER COLUMN {column} TYPE {double_type} USING {column}::{double_type}')
+    _create_views()
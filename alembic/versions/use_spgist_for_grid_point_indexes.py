@@ -0,0 +1,35 @@
+"""use SP-GiST for grid node and power plant point indexes
+
+Revision ID: use_spgist_for_grid_point_indexes
+Revises: add_project_area_lookup_indexes
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'use_spgist_for_grid_point_indexes'
+down_revision = 'add_project_area_lookup_indexes'
+branch_labels = None
+depends_on = None
+
+
+# SP-GiST support for geometry requires PostGIS >= 3
+POINT_INDEXES = [
+    ('idx_grid_nodes_geom', 'grid_nodes'),
+    ('idx_power_plants_geom', 'power_plants'),
+]
+
+
+def upgrade():
+    for index_name, table_name in POINT_INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {index_name}')
+        op.create_index(index_name, table_name, ['location'], unique=False, postgresql_using='spgist')
+
+
+def downgrade():
+    for index_name, table_name in POINT_INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {index_name}')
+        op.create_index(index_name, table_name, ['location'], unique=False, postgresql_using='gist')
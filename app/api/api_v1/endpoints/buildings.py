@@ -57,6 +57,7 @@ def read_buildings_in_bbox(
     miny: float = Query(..., description="Minimum latitude"),
     maxx: float = Query(..., description="Maximum longitude"),
     maxy: float = Query(..., description="Maximum latitude"),
+    has_access: Optional[bool] = None,
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
@@ -72,6 +73,9 @@ def read_buildings_in_bbox(
     query = db.query(BuildingsEnergy).filter(
         func.ST_Intersects(BuildingsEnergy.geom, wkt_bbox)
     )
+    # has_access=false is served by the partial GiST index on unelectrified buildings
+    if has_access is not None:
+        query = query.filter(BuildingsEnergy.has_access == has_access)
     
     buildings = query.offset(skip).limit(limit).all()
     
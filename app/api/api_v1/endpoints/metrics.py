@@ -12,6 +12,7 @@ router = APIRouter()
 
 @router.get("/national", response_model=schemas.metrics.NationalMetricsResponse)
 def get_national_metrics(
+    approx: bool = Query(False, description="Pick the top/least electrified regions from a block sample of the statistics view"),
     db: Session = Depends(get_db),
 ) -> Any:
     """
@@ -19,6 +20,10 @@ def get_national_metrics(
     Returns overall statistics for the entire country.
     """
     try:
+        # SYSTEM sampling reads whole random pages, so approx mode may return
+        # fewer regions (or none, in which case it falls back to exact)
+        sample = "TABLESAMPLE SYSTEM (5)" if approx else ""
+
         # Get total buildings and electrification rates using raw SQL for complex calculations
         national_stats_query = """
         SELECT 
@@ -62,10 +67,8 @@ def get_national_metrics(
             END as high_confidence_rate_90,
             AVG(avg_consumption_kwh_month) as avg_consumption_kwh_month,
             AVG(avg_energy_demand_kwh_year) as avg_energy_demand_kwh_year
-        FROM building_statistics
-        WHERE admin_id IN (
-            SELECT id FROM administrative_boundaries WHERE level = 'region'
-        )
+        FROM admin_statistics_materialized
+        WHERE level = 'region'
         """
         
         national_stats_result = db.execute(text(national_stats_query)).fetchone()
@@ -76,21 +79,21 @@ def get_national_metrics(
         # Get top electrified regions
         top_regions_query = """
         SELECT 
-            ab.name,
-            bs.electrification_rate,
-            bs.total_buildings
+            stats.name,
+            stats.electrification_rate,
+            stats.total_buildings
         FROM 
-            building_statistics bs
-        JOIN 
-            administrative_boundaries ab ON bs.admin_id = ab.id
+            admin_statistics_materialized stats {sample}
         WHERE 
-            ab.level = 'region'
+            stats.level = 'region'
         ORDER BY 
-            bs.electrification_rate DESC
+            stats.electrification_rate DESC
         LIMIT 3
         """
         
-        top_regions_result = db.execute(text(top_regions_query)).fetchall()
+        top_regions_result = db.execute(text(top_regions_query.format(sample=sample))).fetchall()
+        if approx and not top_regions_result:
+            top_regions_result = db.execute(text(top_regions_query.format(sample=""))).fetchall()
         top_regions = [
             {
                 "name": row[0],
@@ -103,21 +106,21 @@ def get_national_metrics(
         # Get least electrified regions
         least_regions_query = """
         SELECT 
-            ab.name,
-            bs.electrification_rate,
-            bs.total_buildings
+            stats.name,
+            stats.electrification_rate,
+            stats.total_buildings
         FROM 
-            building_statistics bs
-        JOIN 
-            administrative_boundaries ab ON bs.admin_id = ab.id
+            admin_statistics_materialized stats {sample}
         WHERE 
-            ab.level = 'region'
+            stats.level = 'region'
         ORDER BY 
-            bs.electrification_rate ASC
+            stats.electrification_rate ASC
         LIMIT 3
         """
         
-        least_regions_result = db.execute(text(least_regions_query)).fetchall()
+        least_regions_result = db.execute(text(least_regions_query.format(sample=sample))).fetchall()
+        if approx and not least_regions_result:
+            least_regions_result = db.execute(text(least_regions_query.format(sample=""))).fetchall()
         least_regions = [
             {
                 "name": row[0],
@@ -130,16 +133,14 @@ def get_national_metrics(
         # Get confidence gap analysis
         confidence_gap_query = """
         SELECT 
-            ab.name,
-            bs.electrification_rate,
-            bs.high_confidence_rate_90,
-            (bs.electrification_rate - bs.high_confidence_rate_90) as confidence_gap
+            stats.name,
+            stats.electrification_rate,
+            stats.high_confidence_rate_90,
+            (stats.electrification_rate - stats.high_confidence_rate_90) as confidence_gap
         FROM 
-            building_statistics bs
-        JOIN 
-            administrative_boundaries ab ON bs.admin_id = ab.id
+            admin_statistics_materialized stats
         WHERE 
-            ab.level = 'region'
+            stats.level = 'region'
         ORDER BY 
             confidence_gap DESC
         LIMIT 3
@@ -222,25 +223,23 @@ def get_region_metrics(
         # Get region statistics
         region_query = """
         SELECT 
-            bs.total_buildings,
-            bs.electrified_buildings,
-            bs.unelectrified_buildings,
-            bs.electrification_rate,
-            bs.high_confidence_rate_50,
-            bs.high_confidence_rate_60,
-            bs.high_confidence_rate_70,
-            bs.high_confidence_rate_80,
-            bs.high_confidence_rate_85,
-            bs.high_confidence_rate_90,
-            bs.avg_consumption_kwh_month,
-            bs.avg_energy_demand_kwh_year
+            stats.total_buildings,
+            stats.electrified_buildings,
+            stats.unelectrified_buildings,
+            stats.electrification_rate,
+            stats.high_confidence_rate_50,
+            stats.high_confidence_rate_60,
+            stats.high_confidence_rate_70,
+            stats.high_confidence_rate_80,
+            stats.high_confidence_rate_85,
+            stats.high_confidence_rate_90,
+            stats.avg_consumption_kwh_month,
+            stats.avg_energy_demand_kwh_year
         FROM 
-            building_statistics bs
-        JOIN 
-            administrative_boundaries ab ON bs.admin_id = ab.id
+            admin_statistics_materialized stats
         WHERE 
-            ab.level = 'region' AND
-            ab.name = :region_name
+            stats.level = 'region' AND
+            stats.name = :region_name
         """
         
         region_result = db.execute(text(region_query), {"region_name": region_name}).fetchone()
@@ -251,21 +250,19 @@ def get_region_metrics(
         # Get departments in this region
         departments_query = """
         SELECT 
-            ab.name,
-            bs.electrification_rate,
-            bs.high_confidence_rate_90,
-            bs.total_buildings
+            stats.name,
+            stats.electrification_rate,
+            stats.high_confidence_rate_90,
+            stats.total_buildings
         FROM 
-            building_statistics bs
-        JOIN 
-            administrative_boundaries ab ON bs.admin_id = ab.id
+            admin_statistics_materialized stats
         JOIN 
-            administrative_boundaries parent ON ab.parent_id = parent.id
+            administrative_boundaries parent ON stats.parent_id = parent.id
         WHERE 
-            ab.level = 'department' AND
+            stats.level = 'department' AND
             parent.name = :region_name
         ORDER BY 
-            bs.electrification_rate DESC
+            stats.electrification_rate DESC
         """
         
         departments_result = db.execute(text(departments_query), {"region_name": region_name}).fetchall()
@@ -332,22 +329,20 @@ def get_priority_zones(
         # Get priority zones based on building density and low electrification
         priority_zones_query = """
         SELECT 
-            ab.name,
-            ab.level,
-            bs.total_buildings,
-            bs.electrification_rate,
-            bs.high_confidence_rate_90,
-            (bs.electrification_rate - bs.high_confidence_rate_90) as confidence_gap
+            stats.name,
+            stats.level,
+            stats.total_buildings,
+            stats.electrification_rate,
+            stats.high_confidence_rate_90,
+            (stats.electrification_rate - stats.high_confidence_rate_90) as confidence_gap
         FROM 
-            building_statistics bs
-        JOIN 
-            administrative_boundaries ab ON bs.admin_id = ab.id
+            admin_statistics_materialized stats
         WHERE 
-            ab.level = 'commune' AND
-            bs.total_buildings > 100
+            stats.level = 'commune' AND
+            stats.total_buildings > 100
         ORDER BY 
-            bs.electrification_rate ASC,
-            bs.total_buildings DESC
+            stats.electrification_rate ASC,
+            stats.total_buildings DESC
         LIMIT 10
         """
         
@@ -367,19 +362,17 @@ def get_priority_zones(
         # Get verification priority zones (high confidence gap)
         verification_zones_query = """
         SELECT 
-            ab.name,
-            ab.level,
-            bs.total_buildings,
-            bs.electrification_rate,
-            bs.high_confidence_rate_90,
-            (bs.electrification_rate - bs.high_confidence_rate_90) as confidence_gap
+            stats.name,
+            stats.level,
+            stats.total_buildings,
+            stats.electrification_rate,
+            stats.high_confidence_rate_90,
+            (stats.electrification_rate - stats.high_confidence_rate_90) as confidence_gap
         FROM 
-            building_statistics bs
-        JOIN 
-            administrative_boundaries ab ON bs.admin_id = ab.id
+            admin_statistics_materialized stats
         WHERE 
-            ab.level = 'commune' AND
-            bs.total_buildings > 50
+            stats.level = 'commune' AND
+            stats.total_buildings > 50
         ORDER BY 
             confidence_gap DESC
         LIMIT 10
@@ -401,19 +394,17 @@ def get_priority_zones(
         # Get high demand zones
         high_demand_zones_query = """
         SELECT 
-            ab.name,
-            ab.level,
-            bs.total_buildings,
-            bs.electrification_rate,
-            bs.avg_energy_demand_kwh_year,
-            (bs.unelectrified_buildings * bs.avg_energy_demand_kwh_year) as total_unmet_demand
+            stats.name,
+            stats.level,
+            stats.total_buildings,
+            stats.electrification_rate,
+            stats.avg_energy_demand_kwh_year,
+            (stats.unelectrified_buildings * stats.avg_energy_demand_kwh_year) as total_unmet_demand
         FROM 
-            building_statistics bs
-        JOIN 
-            administrative_boundaries ab ON bs.admin_id = ab.id
+            admin_statistics_materialized stats
         WHERE 
-            ab.level = 'commune' AND
-            bs.electrification_rate < 80
+            stats.level = 'commune' AND
+            stats.electrification_rate < 80
         ORDER BY 
             total_unmet_demand DESC
         LIMIT 10
@@ -457,18 +448,16 @@ def get_all_regions(
     try:
         regions_query = """
         SELECT 
-            ab.name,
-            bs.total_buildings,
-            bs.electrification_rate,
-            bs.high_confidence_rate_90
+            stats.name,
+            stats.total_buildings,
+            stats.electrification_rate,
+            stats.high_confidence_rate_90
         FROM 
-            building_statistics bs
-        JOIN 
-            administrative_boundaries ab ON bs.admin_id = ab.id
+            admin_statistics_materialized stats
         WHERE 
-            ab.level = 'region'
+            stats.level = 'region'
         ORDER BY 
-            ab.name
+            stats.name
         """
         
         regions_result = db.execute(text(regions_query)).fetchall()
@@ -503,138 +492,135 @@ def get_consumption_uncertainty_analysis(
     This helps identify areas where energy demand estimation needs improvement.
     """
     try:
-        # Define a simpler query for the consumption standard deviation analysis
+        # Read the per-commune averages kept up to date by
+        # scripts/refresh_building_statistics.py instead of scanning buildings
         commune_query = """
-        WITH building_samples AS (
-            -- Sample buildings to improve query performance
+        WITH commune_stats AS (
             SELECT 
-                id, geom, consumption_kwh_month, std_consumption_kwh_month, has_access
-            FROM 
-                buildings_energy
-            WHERE 
-                consumption_kwh_month IS NOT NULL
-                AND std_consumption_kwh_month IS NOT NULL
-            LIMIT 100000
-        ),
-        admin_hierarchy AS (
-            -- Get the administrative hierarchy information
-            SELECT 
-                commune.id AS commune_id, 
-                commune.name AS commune_name,
+                stats.name AS commune_name,
                 dept.name AS department_name,
                 region.name AS region_name,
-                commune.geom AS geom
+                stats.total_buildings,
+                stats.electrified_buildings,
+                stats.avg_consumption_kwh_month,
+                stats.avg_std_consumption_kwh_month,
+                CASE 
+                    WHEN stats.avg_consumption_kwh_month > 0 
+                    THEN stats.avg_std_consumption_kwh_month / stats.avg_consumption_kwh_month
+                    ELSE 0 
+                END AS std_dev_ratio
             FROM 
-                administrative_boundaries commune
+                admin_statistics_materialized stats
             JOIN 
-                administrative_boundaries dept ON commune.parent_id = dept.id
+                administrative_boundaries dept ON stats.parent_id = dept.id
             JOIN 
                 administrative_boundaries region ON dept.parent_id = region.id
             WHERE 
-                commune.level = 'commune'
+                stats.level = 'commune'
+                AND stats.total_buildings >= 10
+                AND stats.avg_std_consumption_kwh_month IS NOT NULL
         ),
-        commune_stats AS (
-            -- Calculate statistics per commune
+        thresholds AS (
             SELECT 
-                ah.commune_id,
-                ah.commune_name,
-                ah.department_name, 
-                ah.region_name,
-                COUNT(bs.id) AS total_buildings,
-                SUM(CASE WHEN bs.has_access = true THEN 1 ELSE 0 END) AS electrified_buildings,
-                AVG(bs.consumption_kwh_month) AS avg_consumption_kwh_month,
-                AVG(bs.std_consumption_kwh_month) AS avg_std_consumption_kwh_month,
+                percentile_cont(0.33) WITHIN GROUP (ORDER BY std_dev_ratio) AS percentile_33,
+                percentile_cont(0.67) WITHIN GROUP (ORDER BY std_dev_ratio) AS percentile_67,
+                AVG(std_dev_ratio) AS avg_ratio,
+                STDDEV(std_dev_ratio) AS stddev_ratio,
+                COUNT(*) AS total_communes
+            FROM commune_stats
+        ),
+        categorized AS (
+            SELECT 
+                cs.*,
                 CASE 
-                    WHEN AVG(bs.consumption_kwh_month) > 0 
-                    THEN AVG(bs.std_consumption_kwh_month) / AVG(bs.consumption_kwh_month)
-                    ELSE 0 
-                END AS std_dev_ratio
-            FROM 
-                admin_hierarchy ah
-            JOIN 
-                building_samples bs ON ST_Contains(ah.geom, bs.geom)
-            GROUP BY 
-                ah.commune_id, ah.commune_name, ah.department_name, ah.region_name
-            HAVING 
-                COUNT(bs.id) >= 10
+                    WHEN cs.std_dev_ratio >= COALESCE(t.percentile_67, 0) THEN 'high'
+                    WHEN cs.std_dev_ratio <= COALESCE(t.percentile_33, 0) THEN 'low'
+                    ELSE 'medium'
+                END AS uncertainty_category
+            FROM commune_stats cs
+            CROSS JOIN thresholds t
+        ),
+        ranked AS (
+            SELECT 
+                categorized.*,
+                ROW_NUMBER() OVER (PARTITION BY uncertainty_category ORDER BY std_dev_ratio DESC) AS category_rank
+            FROM categorized
+        ),
+        category_counts AS (
+            SELECT 
+                COUNT(*) FILTER (WHERE uncertainty_category = 'high') AS high_count,
+                COUNT(*) FILTER (WHERE uncertainty_category = 'medium') AS medium_count,
+                COUNT(*) FILTER (WHERE uncertainty_category = 'low') AS low_count
+            FROM categorized
         )
-        -- Calculate percentiles and return data
+        -- Only the communes shown per category leave the database
         SELECT 
-            commune_name,
-            department_name,
-            region_name,
-            total_buildings,
-            electrified_buildings,
-            avg_consumption_kwh_month,
-            avg_std_consumption_kwh_month,
-            std_dev_ratio,
-            (SELECT percentile_cont(0.33) WITHIN GROUP (ORDER BY std_dev_ratio) FROM commune_stats) AS percentile_33,
-            (SELECT percentile_cont(0.67) WITHIN GROUP (ORDER BY std_dev_ratio) FROM commune_stats) AS percentile_67,
-            (SELECT AVG(std_dev_ratio) FROM commune_stats) AS avg_ratio,
-            (SELECT STDDEV(std_dev_ratio) FROM commune_stats) AS stddev_ratio
+            r.commune_name,
+            r.department_name,
+            r.region_name,
+            r.total_buildings,
+            r.electrified_buildings,
+            r.avg_consumption_kwh_month,
+            r.avg_std_consumption_kwh_month,
+            r.std_dev_ratio,
+            r.uncertainty_category,
+            t.percentile_33,
+            t.percentile_67,
+            t.avg_ratio,
+            t.stddev_ratio,
+            t.total_communes,
+            c.high_count,
+            c.medium_count,
+            c.low_count
         FROM 
-            commune_stats
+            ranked r
+        CROSS JOIN thresholds t
+        CROSS JOIN category_counts c
+        WHERE 
+            r.category_rank <= 20
         ORDER BY 
-            std_dev_ratio DESC;
+            r.std_dev_ratio DESC;
         """
         
         result = db.execute(text(commune_query)).fetchall()
         
-        if not result or len(result) == 0:
+        if not result:
             raise HTTPException(status_code=404, detail="No commune data found")
         
-        # Get the percentile values from the first row
-        percentile_33 = float(result[0][8]) if result[0][8] is not None else 0.0
-        percentile_67 = float(result[0][9]) if result[0][9] is not None else 0.0
-        avg_ratio = float(result[0][10]) if result[0][10] is not None else 0.0
-        stddev_ratio = float(result[0][11]) if result[0][11] is not None else 0.0
-        
-        # Categorize communes based on percentiles
-        high_uncertainty = []
-        medium_uncertainty = []
-        low_uncertainty = []
+        # The thresholds and counts are repeated on every row
+        summary = result[0]
         
+        communes_by_category = {"high": [], "medium": [], "low": []}
         for row in result:
-            commune_info = {
-                "name": row[0],  # commune_name
-                "department_name": row[1],
-                "region_name": row[2],
-                "total_buildings": int(row[3]) if row[3] is not None else 0,
-                "electrified_buildings": int(row[4]) if row[4] is not None else 0,
-                "avg_consumption_kwh_month": float(row[5]) if row[5] is not None else 0.0,
-                "avg_std_consumption_kwh_month": float(row[6]) if row[6] is not None else 0.0,
-                "std_dev_ratio": float(row[7]) if row[7] is not None else 0.0,
-                "uncertainty_category": ""
-            }
-            
-            # Categorize based on std_dev_ratio
-            if commune_info["std_dev_ratio"] >= percentile_67:
-                commune_info["uncertainty_category"] = "high"
-                high_uncertainty.append(commune_info)
-            elif commune_info["std_dev_ratio"] <= percentile_33:
-                commune_info["uncertainty_category"] = "low"
-                low_uncertainty.append(commune_info)
-            else:
-                commune_info["uncertainty_category"] = "medium"
-                medium_uncertainty.append(commune_info)
+            communes_by_category[row.uncertainty_category].append({
+                "name": row.commune_name,
+                "department_name": row.department_name,
+                "region_name": row.region_name,
+                "total_buildings": int(row.total_buildings) if row.total_buildings is not None else 0,
+                "electrified_buildings": int(row.electrified_buildings) if row.electrified_buildings is not None else 0,
+                "avg_consumption_kwh_month": float(row.avg_consumption_kwh_month) if row.avg_consumption_kwh_month is not None else 0.0,
+                "avg_std_consumption_kwh_month": float(row.avg_std_consumption_kwh_month) if row.avg_std_consumption_kwh_month is not None else 0.0,
+                "std_dev_ratio": float(row.std_dev_ratio) if row.std_dev_ratio is not None else 0.0,
+                "uncertainty_category": row.uncertainty_category
+            })
         
         # Create statistics summary
         statistics = {
-            "total_communes_analyzed": len(result),
-            "percentile_33_threshold": percentile_33,
-            "percentile_67_threshold": percentile_67,
-            "average_std_dev_ratio": avg_ratio,
-            "std_dev_of_ratios": stddev_ratio,
-            "high_uncertainty_count": len(high_uncertainty),
-            "medium_uncertainty_count": len(medium_uncertainty),
-            "low_uncertainty_count": len(low_uncertainty)
+            "total_communes_analyzed": int(summary.total_communes),
+            "percentile_33_threshold": float(summary.percentile_33) if summary.percentile_33 is not None else 0.0,
+            "percentile_67_threshold": float(summary.percentile_67) if summary.percentile_67 is not None else 0.0,
+            "average_std_dev_ratio": float(summary.avg_ratio) if summary.avg_ratio is not None else 0.0,
+            "std_dev_of_ratios": float(summary.stddev_ratio) if summary.stddev_ratio is not None else 0.0,
+            "high_uncertainty_count": int(summary.high_count),
+            "medium_uncertainty_count": int(summary.medium_count),
+            "low_uncertainty_count": int(summary.low_count)
         }
         
         return {
             "timestamp": datetime.now().isoformat(),
-            "high_uncertainty_communes": high_uncertainty[:20] if high_uncertainty else [],
-            "medium_uncertainty_communes": medium_uncertainty[:20] if medium_uncertainty else [],
-            "low_uncertainty_communes": low_uncertainty[:20] if low_uncertainty else [],
+            "high_uncertainty_communes": communes_by_category["high"],
+            "medium_uncertainty_communes": communes_by_category["medium"],
+            "low_uncertainty_communes": communes_by_category["low"],
             "statistics": statistics
         }
     
@@ -662,7 +648,7 @@ def get_metrics_ranges(
         where_params = {}
         
         if admin_level:
-            where_clause = "WHERE ab.level = :admin_level"
+            where_clause = "WHERE stats.level = :admin_level"
             where_params["admin_level"] = admin_level
         
         # Build min calculation clause
@@ -673,46 +659,44 @@ def get_metrics_ranges(
         query = f"""
         SELECT 
             -- Basic building metrics
-            {min_clause}(bs.total_buildings){min_suffix} as min_total_buildings,
-            MAX(bs.total_buildings) as max_total_buildings,
-            {min_clause}(bs.electrified_buildings){min_suffix} as min_electrified_buildings,
-            MAX(bs.electrified_buildings) as max_electrified_buildings,
-            {min_clause}(bs.unelectrified_buildings){min_suffix} as min_unelectrified_buildings,
-            MAX(bs.unelectrified_buildings) as max_unelectrified_buildings,
+            {min_clause}(stats.total_buildings){min_suffix} as min_total_buildings,
+            MAX(stats.total_buildings) as max_total_buildings,
+            {min_clause}(stats.electrified_buildings){min_suffix} as min_electrified_buildings,
+            MAX(stats.electrified_buildings) as max_electrified_buildings,
+            {min_clause}(stats.unelectrified_buildings){min_suffix} as min_unelectrified_buildings,
+            MAX(stats.unelectrified_buildings) as max_unelectrified_buildings,
             
             -- Electrification rates
-            {min_clause}(bs.electrification_rate){min_suffix} as min_electrification_rate,
-            MAX(bs.electrification_rate) as max_electrification_rate,
+            {min_clause}(stats.electrification_rate){min_suffix} as min_electrification_rate,
+            MAX(stats.electrification_rate) as max_electrification_rate,
             
             -- High confidence rates
-            {min_clause}(bs.high_confidence_rate_50){min_suffix} as min_high_confidence_rate_50,
-            MAX(bs.high_confidence_rate_50) as max_high_confidence_rate_50,
-            {min_clause}(bs.high_confidence_rate_60){min_suffix} as min_high_confidence_rate_60,
-            MAX(bs.high_confidence_rate_60) as max_high_confidence_rate_60,
-            {min_clause}(bs.high_confidence_rate_70){min_suffix} as min_high_confidence_rate_70,
-            MAX(bs.high_confidence_rate_70) as max_high_confidence_rate_70,
-            {min_clause}(bs.high_confidence_rate_80){min_suffix} as min_high_confidence_rate_80,
-            MAX(bs.high_confidence_rate_80) as max_high_confidence_rate_80,
-            {min_clause}(bs.high_confidence_rate_85){min_suffix} as min_high_confidence_rate_85,
-            MAX(bs.high_confidence_rate_85) as max_high_confidence_rate_85,
-            {min_clause}(bs.high_confidence_rate_90){min_suffix} as min_high_confidence_rate_90,
-            MAX(bs.high_confidence_rate_90) as max_high_confidence_rate_90,
+            {min_clause}(stats.high_confidence_rate_50){min_suffix} as min_high_confidence_rate_50,
+            MAX(stats.high_confidence_rate_50) as max_high_confidence_rate_50,
+            {min_clause}(stats.high_confidence_rate_60){min_suffix} as min_high_confidence_rate_60,
+            MAX(stats.high_confidence_rate_60) as max_high_confidence_rate_60,
+            {min_clause}(stats.high_confidence_rate_70){min_suffix} as min_high_confidence_rate_70,
+            MAX(stats.high_confidence_rate_70) as max_high_confidence_rate_70,
+            {min_clause}(stats.high_confidence_rate_80){min_suffix} as min_high_confidence_rate_80,
+            MAX(stats.high_confidence_rate_80) as max_high_confidence_rate_80,
+            {min_clause}(stats.high_confidence_rate_85){min_suffix} as min_high_confidence_rate_85,
+            MAX(stats.high_confidence_rate_85) as max_high_confidence_rate_85,
+            {min_clause}(stats.high_confidence_rate_90){min_suffix} as min_high_confidence_rate_90,
+            MAX(stats.high_confidence_rate_90) as max_high_confidence_rate_90,
             
             -- Energy consumption and demand
-            {min_clause}(bs.avg_consumption_kwh_month){min_suffix} as min_avg_consumption_kwh_month,
-            MAX(bs.avg_consumption_kwh_month) as max_avg_consumption_kwh_month,
-            {min_clause}(bs.avg_energy_demand_kwh_year){min_suffix} as min_avg_energy_demand_kwh_year,
-            MAX(bs.avg_energy_demand_kwh_year) as max_avg_energy_demand_kwh_year,
+            {min_clause}(stats.avg_consumption_kwh_month){min_suffix} as min_avg_consumption_kwh_month,
+            MAX(stats.avg_consumption_kwh_month) as max_avg_consumption_kwh_month,
+            {min_clause}(stats.avg_energy_demand_kwh_year){min_suffix} as min_avg_energy_demand_kwh_year,
+            MAX(stats.avg_energy_demand_kwh_year) as max_avg_energy_demand_kwh_year,
             
             -- Calculated total consumption and demand
-            {min_clause}(bs.total_buildings * bs.avg_consumption_kwh_month){min_suffix} as min_total_monthly_consumption,
-            MAX(bs.total_buildings * bs.avg_consumption_kwh_month) as max_total_monthly_consumption,
-            {min_clause}(bs.total_buildings * bs.avg_energy_demand_kwh_year){min_suffix} as min_total_yearly_demand,
-            MAX(bs.total_buildings * bs.avg_energy_demand_kwh_year) as max_total_yearly_demand
+            {min_clause}(stats.total_buildings * stats.avg_consumption_kwh_month){min_suffix} as min_total_monthly_consumption,
+            MAX(stats.total_buildings * stats.avg_consumption_kwh_month) as max_total_monthly_consumption,
+            {min_clause}(stats.total_buildings * stats.avg_energy_demand_kwh_year){min_suffix} as min_total_yearly_demand,
+            MAX(stats.total_buildings * stats.avg_energy_demand_kwh_year) as max_total_yearly_demand
         FROM 
-            building_statistics bs
-        JOIN 
-            administrative_boundaries ab ON bs.admin_id = ab.id
+            admin_statistics_materialized stats
         {where_clause}
         """
         
@@ -853,47 +837,45 @@ def get_complete_metrics_ranges(
             query = f"""
             SELECT 
                 -- Basic building metrics
-                {min_clause}(bs.total_buildings){min_suffix} as min_total_buildings,
-                MAX(bs.total_buildings) as max_total_buildings,
-                {min_clause}(bs.electrified_buildings){min_suffix} as min_electrified_buildings,
-                MAX(bs.electrified_buildings) as max_electrified_buildings,
-                {min_clause}(bs.unelectrified_buildings){min_suffix} as min_unelectrified_buildings,
-                MAX(bs.unelectrified_buildings) as max_unelectrified_buildings,
+                {min_clause}(stats.total_buildings){min_suffix} as min_total_buildings,
+                MAX(stats.total_buildings) as max_total_buildings,
+                {min_clause}(stats.electrified_buildings){min_suffix} as min_electrified_buildings,
+                MAX(stats.electrified_buildings) as max_electrified_buildings,
+                {min_clause}(stats.unelectrified_buildings){min_suffix} as min_unelectrified_buildings,
+                MAX(stats.unelectrified_buildings) as max_unelectrified_buildings,
                 
                 -- Electrification rates
-                {min_clause}(bs.electrification_rate){min_suffix} as min_electrification_rate,
-                MAX(bs.electrification_rate) as max_electrification_rate,
+                {min_clause}(stats.electrification_rate){min_suffix} as min_electrification_rate,
+                MAX(stats.electrification_rate) as max_electrification_rate,
                 
                 -- High confidence rates
-                {min_clause}(bs.high_confidence_rate_50){min_suffix} as min_high_confidence_rate_50,
-                MAX(bs.high_confidence_rate_50) as max_high_confidence_rate_50,
-                {min_clause}(bs.high_confidence_rate_60){min_suffix} as min_high_confidence_rate_60,
-                MAX(bs.high_confidence_rate_60) as max_high_confidence_rate_60,
-                {min_clause}(bs.high_confidence_rate_70){min_suffix} as min_high_confidence_rate_70,
-                MAX(bs.high_confidence_rate_70) as max_high_confidence_rate_70,
-                {min_clause}(bs.high_confidence_rate_80){min_suffix} as min_high_confidence_rate_80,
-                MAX(bs.high_confidence_rate_80) as max_high_confidence_rate_80,
-                {min_clause}(bs.high_confidence_rate_85){min_suffix} as min_high_confidence_rate_85,
-                MAX(bs.high_confidence_rate_85) as max_high_confidence_rate_85,
-                {min_clause}(bs.high_confidence_rate_90){min_suffix} as min_high_confidence_rate_90,
-                MAX(bs.high_confidence_rate_90) as max_high_confidence_rate_90,
+                {min_clause}(stats.high_confidence_rate_50){min_suffix} as min_high_confidence_rate_50,
+                MAX(stats.high_confidence_rate_50) as max_high_confidence_rate_50,
+                {min_clause}(stats.high_confidence_rate_60){min_suffix} as min_high_confidence_rate_60,
+                MAX(stats.high_confidence_rate_60) as max_high_confidence_rate_60,
+                {min_clause}(stats.high_confidence_rate_70){min_suffix} as min_high_confidence_rate_70,
+                MAX(stats.high_confidence_rate_70) as max_high_confidence_rate_70,
+                {min_clause}(stats.high_confidence_rate_80){min_suffix} as min_high_confidence_rate_80,
+                MAX(stats.high_confidence_rate_80) as max_high_confidence_rate_80,
+                {min_clause}(stats.high_confidence_rate_85){min_suffix} as min_high_confidence_rate_85,
+                MAX(stats.high_confidence_rate_85) as max_high_confidence_rate_85,
+                {min_clause}(stats.high_confidence_rate_90){min_suffix} as min_high_confidence_rate_90,
+                MAX(stats.high_confidence_rate_90) as max_high_confidence_rate_90,
                 
                 -- Energy consumption and demand
-                {min_clause}(bs.avg_consumption_kwh_month){min_suffix} as min_avg_consumption_kwh_month,
-                MAX(bs.avg_consumption_kwh_month) as max_avg_consumption_kwh_month,
-                {min_clause}(bs.avg_energy_demand_kwh_year){min_suffix} as min_avg_energy_demand_kwh_year,
-                MAX(bs.avg_energy_demand_kwh_year) as max_avg_energy_demand_kwh_year,
+                {min_clause}(stats.avg_consumption_kwh_month){min_suffix} as min_avg_consumption_kwh_month,
+                MAX(stats.avg_consumption_kwh_month) as max_avg_consumption_kwh_month,
+                {min_clause}(stats.avg_energy_demand_kwh_year){min_suffix} as min_avg_energy_demand_kwh_year,
+                MAX(stats.avg_energy_demand_kwh_year) as max_avg_energy_demand_kwh_year,
                 
                 -- Calculated total consumption and demand
-                {min_clause}(bs.total_buildings * bs.avg_consumption_kwh_month){min_suffix} as min_total_monthly_consumption,
-                MAX(bs.total_buildings * bs.avg_consumption_kwh_month) as max_total_monthly_consumption,
-                {min_clause}(bs.total_buildings * bs.avg_energy_demand_kwh_year){min_suffix} as min_total_yearly_demand,
-                MAX(bs.total_buildings * bs.avg_energy_demand_kwh_year) as max_total_yearly_demand
+                {min_clause}(stats.total_buildings * stats.avg_consumption_kwh_month){min_suffix} as min_total_monthly_consumption,
+                MAX(stats.total_buildings * stats.avg_consumption_kwh_month) as max_total_monthly_consumption,
+                {min_clause}(stats.total_buildings * stats.avg_energy_demand_kwh_year){min_suffix} as min_total_yearly_demand,
+                MAX(stats.total_buildings * stats.avg_energy_demand_kwh_year) as max_total_yearly_demand
             FROM 
-                building_statistics bs
-            JOIN 
-                administrative_boundaries ab ON bs.admin_id = ab.id
-            WHERE ab.level = :admin_level
+                admin_statistics_materialized stats
+            WHERE stats.level = :admin_level
             """
             
             result = db.execute(text(query), {"admin_level": level}).fetchone()
@@ -1156,25 +1138,23 @@ def get_admin_metrics(
         # Get area statistics
         stats_query = """
         SELECT 
-            bs.total_buildings,
-            bs.electrified_buildings,
-            bs.unelectrified_buildings,
-            bs.electrification_rate,
-            bs.high_confidence_rate_50,
-            bs.high_confidence_rate_60,
-            bs.high_confidence_rate_70,
-            bs.high_confidence_rate_80,
-            bs.high_confidence_rate_85,
-            bs.high_confidence_rate_90,
-            bs.avg_consumption_kwh_month,
-            bs.avg_energy_demand_kwh_year
+            stats.total_buildings,
+            stats.electrified_buildings,
+            stats.unelectrified_buildings,
+            stats.electrification_rate,
+            stats.high_confidence_rate_50,
+            stats.high_confidence_rate_60,
+            stats.high_confidence_rate_70,
+            stats.high_confidence_rate_80,
+            stats.high_confidence_rate_85,
+            stats.high_confidence_rate_90,
+            stats.avg_consumption_kwh_month,
+            stats.avg_energy_demand_kwh_year
         FROM 
-            building_statistics bs
-        JOIN 
-            administrative_boundaries ab ON bs.admin_id = ab.id
+            admin_statistics_materialized stats
         WHERE 
-            ab.level = :admin_level AND
-            ab.name = :admin_name
+            stats.level = :admin_level AND
+            stats.name = :admin_name
         """
         
         stats_result = db.execute(
@@ -1193,22 +1173,20 @@ def get_admin_metrics(
         if admin_level != "commune":
             children_query = """
             SELECT 
-                ab.name,
-                bs.electrification_rate,
-                bs.high_confidence_rate_90,
-                bs.total_buildings
+                stats.name,
+                stats.electrification_rate,
+                stats.high_confidence_rate_90,
+                stats.total_buildings
             FROM 
-                building_statistics bs
-            JOIN 
-                administrative_boundaries ab ON bs.admin_id = ab.id
+                admin_statistics_materialized stats
             JOIN 
-                administrative_boundaries parent ON ab.parent_id = parent.id
+                administrative_boundaries parent ON stats.parent_id = parent.id
             WHERE 
                 parent.level = :parent_level AND
                 parent.name = :parent_name AND
-                ab.level = :child_level
+                stats.level = :child_level
             ORDER BY 
-                bs.electrification_rate DESC
+                stats.electrification_rate DESC
             """
             
             # Define child level based on current level
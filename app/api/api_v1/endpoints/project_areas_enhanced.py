@@ -1,28 +1,40 @@
-from typing import Any, List, Optional, Union, Dict
+from typing import Any, Dict, Iterator, List, Optional, Union
 from fastapi import APIRouter, Depends, HTTPException, Body, Query, UploadFile, File, Form
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import text, func
+from sqlalchemy import text
 from pydantic import BaseModel, Field
 import json
+import orjson
+import ijson
+import itertools
 import tempfile
 import os
 import zipfile
 import uuid
+import numpy as np
 
 from app.api import deps
-from app.models.projects import Project as ProjectModel, ProjectArea as ProjectAreaModel
+from app.models.projects import Project as ProjectModel
 from app.schemas.projects import ProjectArea, ProjectAreaCreate
+from app.schemas.geojson import GeoJSONInput
 from app.utils.geometry_processor import GeometryProcessor, GeometryProcessingError, ProcessedGeometry
-from geoalchemy2.shape import from_shape
-from shapely.geometry import shape
+from app.utils.project_areas import insert_project_areas, to_multipolygon_ewkb
+from app.utils.uploads import save_upload
+import shapely
 
 router = APIRouter()
 
+# GeoJSON uploads larger than this are streamed instead of parsed whole
+_GEOJSON_STREAM_THRESHOLD = 1024 * 1024
+
+# source_type values accepted by the project_areas table
+_VALID_SOURCE_TYPES = frozenset({'drawn', 'geojson_upload', 'shapefile'})
+
 
 class GeometryInputRequest(BaseModel):
     """Request model for geometry input"""
-    geometry: Union[Dict[str, Any], List[Dict[str, Any]]] = Field(..., description="Geometry input (Feature, FeatureCollection, or direct geometry)")
+    geometry: GeoJSONInput = Field(..., description="Geometry input (Feature, FeatureCollection, or direct geometry)")
     name: str = Field(..., description="Base name for created areas")
     area_type: str = Field("custom", description="Type of area (village, custom, etc.)")
     merge_overlapping: bool = Field(False, description="Whether to merge overlapping geometries")
@@ -31,7 +43,7 @@ class GeometryInputRequest(BaseModel):
 
 class GeometryAnalysisRequest(BaseModel):
     """Request model for geometry analysis"""
-    geometry_input: Union[Dict[str, Any], List[Dict[str, Any]]] = Field(..., description="Geometry to analyze")
+    geometry_input: GeoJSONInput = Field(..., description="Geometry to analyze")
     base_name: str = Field("Area", description="Base name for area estimation")
 
 
@@ -39,7 +51,7 @@ class GeometryValidationResponse(BaseModel):
     """Response model for geometry validation"""
     is_valid: bool
     error_message: str = ""
-    geometry_info: Dict[str, Any] = {}
+    geometry_info: Dict[str, Any] = Field(default_factory=dict)
 
 
 class GeometryInfoResponse(BaseModel):
@@ -49,22 +61,27 @@ class GeometryInfoResponse(BaseModel):
     supported_types: List[str]
     has_properties: bool
     will_create_areas: int
-    estimated_areas: List[Dict[str, Any]] = []
+    estimated_areas: List[Dict[str, Any]] = Field(default_factory=list)
 
 
 def get_area_calculation_func(db: Session):
-    """Create area calculation function using PostGIS"""
-    def calculate_area(geometry: Dict[str, Any]) -> float:
-        try:
-            area_query = db.execute(
-                text("SELECT ST_Area(ST_Transform(ST_GeomFromGeoJSON(:geojson), 3857))/1000000 as area_sq_km"),
-                {"geojson": json.dumps(geometry)}
-            ).fetchone()
-            return float(area_query.area_sq_km) if area_query and area_query.area_sq_km else 0.0
-        except Exception as e:
-            print(f"PostGIS area calculation failed: {e}")
-            return 0.0
-    return calculate_area
+    """Create batch area calculation function using PostGIS.
+
+    Only used for previews; the formula matches the generated
+    project_areas.area_sq_km column so estimates equal the stored values.
+    """
+    def calculate_areas(geometries: list) -> List[float]:
+        # One round-trip for all geometries instead of one query each
+        rows = db.execute(
+            text("""
+                SELECT ST_Area(ST_GeomFromGeoJSON(g)::geography)/1000000 as area_sq_km
+                FROM unnest(CAST(:geojsons AS text[])) WITH ORDINALITY AS t(g, ord)
+                ORDER BY ord
+            """),
+            {"geojsons": shapely.to_geojson(geometries).tolist()}
+        ).fetchall()
+        return [float(row.area_sq_km) if row.area_sq_km else 0.0 for row in rows]
+    return calculate_areas
 
 
 @router.post("/{project_id}/areas/enhanced", response_model=Union[ProjectArea, List[ProjectArea]])
@@ -90,9 +107,8 @@ def create_project_areas_enhanced(
         raise HTTPException(status_code=404, detail="Project not found")
     
     try:
-        # Initialize geometry processor with PostGIS area calculation
-        area_calc_func = get_area_calculation_func(db)
-        processor = GeometryProcessor(area_calculation_func=area_calc_func)
+        # area_sq_km is generated by PostGIS on insert
+        processor = GeometryProcessor(calculate_areas=False)
         
         # Process the geometry input
         processed_geometries = processor.process_geometry_input(
@@ -107,37 +123,19 @@ def create_project_areas_enhanced(
         if not processed_geometries:
             raise HTTPException(status_code=400, detail="No valid geometries could be processed")
         
-        # Create database records
-        created_areas = []
-        for processed_geom in processed_geometries:
-            # Convert to shapely for database storage
-            shapely_geom = shape(processed_geom.geometry)
-            wkb_element = from_shape(shapely_geom, srid=4326)
-            
-            # Create new area
-            db_area = ProjectAreaModel(
-                id=str(uuid.uuid4()),
-                project_id=project_id,
-                name=processed_geom.name,
-                area_type=processed_geom.source_info.get("area_type", request.area_type),
-                geometry=wkb_element,
-                area_metadata=processed_geom.metadata,
-                source_type="drawn",
-                processing_status="completed",
-                simplification_tolerance=request.simplification_tolerance,
-                area_sq_km=processed_geom.area_sq_km,
-                updated_at=func.now()
-            )
-            db.add(db_area)
-            created_areas.append(db_area)
+        # Create database records in one INSERT ... RETURNING
+        area_rows = _area_rows_from_processed(
+            processed_geometries,
+            project_id,
+            request.area_type,
+            "drawn",
+            simplification_tolerance=request.simplification_tolerance
+        )
+        created_areas = insert_project_areas(db, area_rows)
         
         # Commit all areas
         db.commit()
         
-        # Refresh areas to get timestamps
-        for area in created_areas:
-            db.refresh(area)
-        
         # Return single area or list based on count
         if len(created_areas) == 1:
             return created_areas[0]
@@ -178,10 +176,15 @@ async def upload_file_enhanced(
     filename = file.filename.lower()
     
     try:
+        geojson_data = None
+        features = None
         if filename.endswith(('.geojson', '.json')):
-            # Handle GeoJSON file
-            content = await file.read()
-            geojson_data = json.loads(content)
+            # Handle GeoJSON file; large FeatureCollections are streamed
+            # feature by feature instead of being parsed whole
+            if file.size is None or file.size > _GEOJSON_STREAM_THRESHOLD:
+                features = _stream_features(file)
+            if features is None:
+                geojson_data = orjson.loads(await file.read())
             source_type = "geojson_upload"
             
         elif filename.endswith('.zip'):
@@ -195,13 +198,9 @@ async def upload_file_enhanced(
                 detail="Unsupported file format. Only .geojson, .json, and .zip files are supported."
             )
         
-        # Initialize geometry processor
-        area_calc_func = get_area_calculation_func(db)
-        processor = GeometryProcessor(area_calculation_func=area_calc_func)
-        
-        # Process geometries
-        processed_geometries = processor.process_geometry_input(
-            geometry_input=geojson_data,
+        # area_sq_km is generated by PostGIS on insert
+        processor = GeometryProcessor(calculate_areas=False)
+        processing_options = dict(
             base_name=name,
             area_type=area_type,
             source_type="geojson_upload",
@@ -210,43 +209,35 @@ async def upload_file_enhanced(
             simplification_tolerance=simplification_tolerance
         )
         
+        # Process geometries
+        if features is not None:
+            processed_geometries = processor.process_feature_stream(features, **processing_options)
+        else:
+            processed_geometries = processor.process_geometry_input(geometry_input=geojson_data, **processing_options)
+        
         if not processed_geometries:
             raise HTTPException(status_code=400, detail="No valid geometries found in uploaded file")
         
-        # Create database records
-        created_areas = []
-        for processed_geom in processed_geometries:
-            shapely_geom = shape(processed_geom.geometry)
-            wkb_element = from_shape(shapely_geom, srid=4326)
-            
-            db_area = ProjectAreaModel(
-                id=str(uuid.uuid4()),
-                project_id=project_id,
-                name=processed_geom.name,
-                area_type=area_type,
-                geometry=wkb_element,
-                area_metadata=processed_geom.metadata,
-                source_type="geojson_upload",
-                original_filename=file.filename,
-                processing_status="completed",
-                simplification_tolerance=simplification_tolerance,
-                area_sq_km=processed_geom.area_sq_km,
-                updated_at=func.now()
-            )
-            db.add(db_area)
-            created_areas.append(db_area)
+        # Create database records in one INSERT ... RETURNING
+        area_rows = _area_rows_from_processed(
+            processed_geometries,
+            project_id,
+            area_type,
+            "geojson_upload",
+            file.filename,
+            simplification_tolerance=simplification_tolerance,
+            use_source_area_type=False
+        )
+        created_areas = insert_project_areas(db, area_rows)
         
         db.commit()
         
-        for area in created_areas:
-            db.refresh(area)
-        
         if len(created_areas) == 1:
             return created_areas[0]
         else:
             return created_areas
             
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, ijson.JSONError):
         raise HTTPException(status_code=400, detail="Invalid JSON in uploaded file")
     except GeometryProcessingError as e:
         raise HTTPException(status_code=400, detail=f"Geometry processing error: {str(e)}")
@@ -256,7 +247,7 @@ async def upload_file_enhanced(
 
 @router.post("/validate-geometry", response_model=GeometryValidationResponse)
 def validate_geometry(
-    geometry_input: Union[Dict[str, Any], List[Dict[str, Any]]] = Body(..., description="Geometry to validate")
+    geometry_input: GeoJSONInput = Body(..., description="Geometry to validate")
 ) -> GeometryValidationResponse:
     """
     Validate geometry input without creating areas.
@@ -294,7 +285,7 @@ def analyze_geometry(
         
         # Create processor for detailed analysis
         area_calc_func = get_area_calculation_func(db)
-        processor = GeometryProcessor(area_calculation_func=area_calc_func)
+        processor = GeometryProcessor(batch_area_calculation_func=area_calc_func)
         
         # Simulate processing to get area estimates
         estimated_areas = []
@@ -310,7 +301,7 @@ def analyze_geometry(
                 estimated_areas.append({
                     "name": processed_geom.name,
                     "area_sq_km": round(processed_geom.area_sq_km, 3),
-                    "geometry_type": processed_geom.geometry.get("type", "Unknown"),
+                    "geometry_type": processed_geom.shapely_geometry.geom_type,
                     "has_properties": bool(processed_geom.metadata.get("properties", {}))
                 })
                 
@@ -360,8 +351,14 @@ async def batch_upload_files(
     if not files:
         raise HTTPException(status_code=400, detail="No files provided")
     
+    # area_sq_km is generated by PostGIS on insert
+    processor = GeometryProcessor(calculate_areas=False)
+    
+    # Only merge_all needs every file's GeoJSON at once; otherwise each file
+    # is parsed, processed and reduced to EWKB rows before the next is read
     all_geometries = []
-    file_geometries = {}
+    area_rows = []
+    found_files = False
     
     try:
         # Process all files
@@ -370,24 +367,36 @@ async def batch_upload_files(
             
             if filename.endswith(('.geojson', '.json')):
                 content = await file.read()
-                geojson_data = json.loads(content)
+                geojson_data = orjson.loads(content)
+                del content
             elif filename.endswith('.zip'):
                 geojson_data = await _process_shapefile_upload(file)
             else:
                 continue  # Skip unsupported files
+            found_files = True
+            
+            if merge_all:
+                all_geometries.append(geojson_data)
+                continue
+            
+            processed_geometries = processor.process_geometry_input(
+                geometry_input=geojson_data,
+                base_name=f"{base_name} - {file.filename}",
+                area_type=area_type,
+                source_type="geojson_upload",
+                source_filename=file.filename,
+                merge_overlapping=merge_per_file,
+                simplification_tolerance=simplification_tolerance
+            )
             
-            file_geometries[file.filename] = geojson_data
-            all_geometries.append(geojson_data)
+            area_rows.extend(_area_rows_from_processed(
+                processed_geometries, project_id, area_type, "geojson_upload", file.filename,
+                use_source_area_type=False
+            ))
         
-        if not all_geometries:
+        if not found_files:
             raise HTTPException(status_code=400, detail="No valid geometry files found")
         
-        # Initialize processor
-        area_calc_func = get_area_calculation_func(db)
-        processor = GeometryProcessor(area_calculation_func=area_calc_func)
-        
-        created_areas = []
-        
         if merge_all:
             # Process all geometries together
             processed_geometries = processor.process_geometry_input(
@@ -399,46 +408,35 @@ async def batch_upload_files(
                 simplification_tolerance=simplification_tolerance
             )
             
-            for processed_geom in processed_geometries:
-                db_area = _create_area_from_processed(
-                    processed_geom, project_id, area_type, "geojson_upload", db
-                )
-                created_areas.append(db_area)
-        
-        else:
-            # Process each file separately
-            for filename, geojson_data in file_geometries.items():
-                file_base_name = f"{base_name} - {filename}"
-                
-                processed_geometries = processor.process_geometry_input(
-                    geometry_input=geojson_data,
-                    base_name=file_base_name,
-                    area_type=area_type,
-                    source_type="geojson_upload",
-                    source_filename=filename,
-                    merge_overlapping=merge_per_file,
-                    simplification_tolerance=simplification_tolerance
-                )
-                
-                for processed_geom in processed_geometries:
-                    db_area = _create_area_from_processed(
-                        processed_geom, project_id, area_type, "geojson_upload", db, filename
-                    )
-                    created_areas.append(db_area)
+            area_rows.extend(_area_rows_from_processed(
+                processed_geometries, project_id, area_type, "geojson_upload",
+                use_source_area_type=False
+            ))
         
-        # Commit all areas
+        # Create all areas in one INSERT ... RETURNING and commit
+        created_areas = insert_project_areas(db, area_rows)
         db.commit()
         
-        # Refresh areas
-        for area in created_areas:
-            db.refresh(area)
-        
         return created_areas
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Batch upload failed: {str(e)}")
 
 
+def _stream_features(file: UploadFile) -> Optional[Iterator[Dict[str, Any]]]:
+    """Stream a GeoJSON upload's 'features' array with ijson.
+    
+    Returns None (with the file rewound) when the document is not a
+    non-empty FeatureCollection, so the caller can parse it whole.
+    """
+    features = ijson.items(file.file, 'features.item', use_float=True)
+    first_feature = next(features, None)
+    if first_feature is None:
+        file.file.seek(0)
+        return None
+    return itertools.chain([first_feature], features)
+
+
 async def _process_shapefile_upload(file: UploadFile) -> Dict[str, Any]:
     """Process uploaded shapefile and return GeoJSON data"""
     import geopandas as gpd
@@ -449,9 +447,7 @@ async def _process_shapefile_upload(file: UploadFile) -> Dict[str, Any]:
     try:
         # Save and extract zip file
         zip_path = os.path.join(temp_dir, file.filename)
-        with open(zip_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        await save_upload(file, zip_path)
         
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
             zip_ref.extractall(temp_dir)
@@ -470,39 +466,51 @@ async def _process_shapefile_upload(file: UploadFile) -> Dict[str, Any]:
         
         # Convert to GeoJSON
         geojson_str = gdf.to_json()
-        return json.loads(geojson_str)
+        return orjson.loads(geojson_str)
         
     finally:
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
-def _create_area_from_processed(
-    processed_geom: ProcessedGeometry,
+def _area_rows_from_processed(
+    processed_geometries: List[ProcessedGeometry],
     project_id: str,
     area_type: str,
     source_type: str,
-    db: Session,
-    filename: Optional[str] = None
-) -> ProjectAreaModel:
-    """Helper function to create ProjectAreaModel from ProcessedGeometry"""
-    shapely_geom = shape(processed_geom.geometry)
-    wkb_element = from_shape(shapely_geom, srid=4326)
+    filename: Optional[str] = None,
+    simplification_tolerance: Optional[float] = None,
+    use_source_area_type: bool = True
+) -> List[Dict[str, Any]]:
+    """Helper function to build project_areas rows from ProcessedGeometry results.
+    
+    All geometries are encoded as EWKB in one vectorized GEOS call.
+    """
+    if not processed_geometries:
+        return []
+    
+    # Encoded straight from the processor's shapely geometries; no GeoJSON round trip
+    geoms = np.array([p.shapely_geometry for p in processed_geometries], dtype=object)
+    wkb_hexes = to_multipolygon_ewkb(geoms)
     
     # Ensure source_type is valid
-    valid_source_types = ['drawn', 'geojson_upload', 'shapefile']
-    if source_type not in valid_source_types:
+    if source_type not in _VALID_SOURCE_TYPES:
         source_type = 'drawn'
     
-    return ProjectAreaModel(
-        id=str(uuid.uuid4()),
-        project_id=project_id,
-        name=processed_geom.name,
-        area_type=area_type,
-        geometry=wkb_element,
-        area_metadata=processed_geom.metadata,
-        source_type=source_type,
-        original_filename=filename,
-        processing_status="completed",
-        area_sq_km=processed_geom.area_sq_km,
-        updated_at=func.now()
-    )
\ No newline at end of file
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "project_id": project_id,
+            "name": processed_geom.name,
+            "area_type": (
+                processed_geom.source_info.get("area_type", area_type)
+                if use_source_area_type else area_type
+            ),
+            "geometry": wkb_hex,
+            "area_metadata": processed_geom.metadata,
+            "source_type": source_type,
+            "original_filename": filename,
+            "processing_status": "completed",
+            "simplification_tolerance": simplification_tolerance,
+        }
+        for processed_geom, wkb_hex in zip(processed_geometries, wkb_hexes)
+    ]
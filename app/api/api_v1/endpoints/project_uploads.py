@@ -1,5 +1,5 @@
 import uuid
-import json
+import orjson
 import os
 import tempfile
 import shutil
@@ -7,15 +7,17 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import text, func
 import zipfile
 import geopandas as gpd
-from shapely.geometry import shape, mapping, Polygon, MultiPolygon
-from geoalchemy2.shape import from_shape
+import numpy as np
+import shapely
 
 from app.api import deps
-from app.models.projects import Project as ProjectModel, ProjectArea as ProjectAreaModel
+from app.core.config import settings
+from app.models.projects import Project as ProjectModel
 from app.schemas.projects import ProjectArea, ProjectAreaCreate
+from app.utils.project_areas import insert_project_areas, to_multipolygon_ewkb
+from app.utils.uploads import save_upload
 
 router = APIRouter()
 
@@ -38,114 +40,81 @@ async def upload_geojson(
     if not file.filename.lower().endswith('.geojson') and not file.filename.lower().endswith('.json'):
         raise HTTPException(status_code=400, detail="Invalid file format. Only GeoJSON files are accepted.")
     
-    # Create temp directory to store the uploaded file
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_file_path = os.path.join(temp_dir, file.filename)
+    # Reject oversized uploads before reading them into memory
+    if file.size is not None and file.size > settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024:
+        raise HTTPException(status_code=413, detail=f"File exceeds the {settings.MAX_UPLOAD_SIZE_MB} MB upload limit")
+    
+    try:
+        # Parse the GeoJSON straight from the upload bytes
+        geojson_data = orjson.loads(await file.read())
         
-        # Save the uploaded file
-        with open(temp_file_path, "wb") as temp_file:
-            content = await file.read()
-            temp_file.write(content)
+        # Extract geometries from GeoJSON
+        geometries = []
         
-        try:
-            # Read the GeoJSON file
-            with open(temp_file_path, "r") as f:
-                geojson_data = json.load(f)
-            
-            # Extract geometries from GeoJSON
-            geometries = []
-            
-            if geojson_data.get("type") == "FeatureCollection":
-                # Get all features' geometries
-                if geojson_data.get("features") and len(geojson_data["features"]) > 0:
-                    for feature in geojson_data["features"]:
-                        if feature.get("geometry"):
-                            geometries.append(feature.get("geometry"))
-            elif geojson_data.get("type") == "Feature":
-                if geojson_data.get("geometry"):
-                    geometries.append(geojson_data.get("geometry"))
-            elif "type" in geojson_data and geojson_data["type"] in ["Polygon", "MultiPolygon"]:
-                geometries.append(geojson_data)
-            
-            if not geometries:
-                raise HTTPException(status_code=400, detail="Invalid GeoJSON format or no geometries found")
-            
-            # Create areas for each geometry
-            created_areas = []
-            
-            for i, geometry in enumerate(geometries):
-                # Calculate area in square kilometers
-                area_sq_km = None
-                try:
-                    # Use PostGIS to calculate area
-                    geom_shape = shape(geometry)
-                    # Convert to geography type for accurate area calculation in square meters
-                    area_query = db.execute(
-                        text("SELECT ST_Area(ST_Transform(ST_GeomFromGeoJSON(:geojson), 3857))/1000000 as area_sq_km"),
-                        {"geojson": json.dumps(geometry)}
-                    ).fetchone()
-                    area_sq_km = area_query.area_sq_km if area_query else None
-                except Exception as e:
-                    # Log the error but continue
-                    print(f"Error calculating area: {e}")
-                
-                # Create a shapely geometry from the GeoJSON
-                geom_shape = shape(geometry)
-                
-                # Convert to MultiPolygon if it's a Polygon
-                if isinstance(geom_shape, Polygon):
-                    geom_shape = MultiPolygon([geom_shape])
-                
-                # Create WKB element for database storage
-                wkb_element = from_shape(geom_shape, srid=4326)  # Use SRID 4326 for WGS84
-                
-                # Create metadata with source information
-                metadata = {
-                    "source": "geojson_upload",
-                    "filename": file.filename,
-                    "feature_index": i
-                }
-                
-                # Create area name with index if multiple geometries
-                area_name = name
-                if len(geometries) > 1:
-                    area_name = f"{name} ({i+1})"
-                
-                # Create new area
-                db_area = ProjectAreaModel(
-                    id=str(uuid.uuid4()),
-                    name=area_name,
-                    area_type=area_type,
-                    geometry=wkb_element,
-                    area_metadata=metadata,
-                    project_id=project_id,
-                    source_type="geojson_upload",
-                    original_filename=file.filename,
-                    processing_status="completed",
-                    area_sq_km=area_sq_km,
-                    updated_at=func.now()
-                )
-                db.add(db_area)
-                created_areas.append(db_area)
-            
-            # Commit all areas at once
-            db.commit()
-            
-            # Refresh all areas to get their created_at timestamps
-            for area in created_areas:
-                db.refresh(area)
-            
-            # If only one area was created, return it as an object
-            # Otherwise return the list of areas
-            if len(created_areas) == 1:
-                return created_areas[0]
-            else:
-                return created_areas
-            
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=400, detail="Invalid JSON format")
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error processing GeoJSON file: {str(e)}")
+        if geojson_data.get("type") == "FeatureCollection":
+            # Get all features' geometries
+            if geojson_data.get("features") and len(geojson_data["features"]) > 0:
+                for feature in geojson_data["features"]:
+                    if feature.get("geometry"):
+                        geometries.append(feature.get("geometry"))
+        elif geojson_data.get("type") == "Feature":
+            if geojson_data.get("geometry"):
+                geometries.append(geojson_data.get("geometry"))
+        elif "type" in geojson_data and geojson_data["type"] in ["Polygon", "MultiPolygon"]:
+            geometries.append(geojson_data)
+        
+        if not geometries:
+            raise HTTPException(status_code=400, detail="Invalid GeoJSON format or no geometries found")
+        
+        # Parse and serialize all geometries in vectorized GEOS calls;
+        # area_sq_km is generated by PostGIS on insert
+        geoms = shapely.from_geojson([orjson.dumps(geometry) for geometry in geometries])
+        wkb_hexes = to_multipolygon_ewkb(geoms)
+        
+        # Create areas for each geometry
+        area_rows = []
+        
+        for i, wkb_hex in enumerate(wkb_hexes):
+            # Create metadata with source information
+            metadata = {
+                "source": "geojson_upload",
+                "filename": file.filename,
+                "feature_index": i
+            }
+            
+            # Create area name with index if multiple geometries
+            area_name = name
+            if len(geometries) > 1:
+                area_name = f"{name} ({i+1})"
+            
+            # Queue new area row
+            area_rows.append({
+                "id": str(uuid.uuid4()),
+                "name": area_name,
+                "area_type": area_type,
+                "geometry": wkb_hex,
+                "area_metadata": metadata,
+                "project_id": project_id,
+                "source_type": "geojson_upload",
+                "original_filename": file.filename,
+                "processing_status": "completed",
+            })
+        
+        # Insert all areas at once
+        created_areas = insert_project_areas(db, area_rows)
+        db.commit()
+        
+        # If only one area was created, return it as an object
+        # Otherwise return the list of areas
+        if len(created_areas) == 1:
+            return created_areas[0]
+        else:
+            return created_areas
+        
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON format")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error processing GeoJSON file: {str(e)}")
 
 
 @router.post("/{project_id}/upload/shapefile", response_model=ProjectArea)
@@ -173,9 +142,7 @@ async def upload_shapefile(
         os.makedirs(extract_dir, exist_ok=True)
         
         # Save the uploaded file
-        with open(temp_file_path, "wb") as temp_file:
-            content = await file.read()
-            temp_file.write(content)
+        await save_upload(file, temp_file_path)
         
         try:
             # Extract the zip file
@@ -202,38 +169,21 @@ async def upload_shapefile(
             if len(gdf) == 0:
                 raise HTTPException(status_code=400, detail="Shapefile contains no features")
             
+            # Repair invalid geometries in a single vectorized GEOS pass,
+            # keeping only features that are still polygonal afterwards
+            gdf = gdf[~gdf.geometry.isna()].reset_index(drop=True)
+            gdf["geometry"] = shapely.make_valid(gdf.geometry.values)
+            gdf = gdf[gdf.geometry.geom_type.isin(["Polygon", "MultiPolygon"])].reset_index(drop=True)
+            
+            # Serialize all geometries in one vectorized GEOS call;
+            # area_sq_km is generated by PostGIS on insert
+            wkb_hexes = to_multipolygon_ewkb(np.asarray(gdf.geometry.values))
+            
             # Create areas for each geometry in the shapefile
-            created_areas = []
+            area_rows = []
             
             for i, row in gdf.iterrows():
-                geom = row.geometry
-                
-                # Skip invalid geometries
-                if geom is None or not geom.is_valid:
-                    continue
-                
-                # Convert to GeoJSON
-                geojson = mapping(geom)
-                
-                # Calculate area in square kilometers
-                area_sq_km = None
-                try:
-                    # Use PostGIS to calculate area
-                    area_query = db.execute(
-                        text("SELECT ST_Area(ST_Transform(ST_GeomFromGeoJSON(:geojson), 3857))/1000000 as area_sq_km"),
-                        {"geojson": json.dumps(geojson)}
-                    ).fetchone()
-                    area_sq_km = area_query.area_sq_km if area_query else None
-                except Exception as e:
-                    # Log the error but continue
-                    print(f"Error calculating area: {e}")
-                
-                # Convert to MultiPolygon if it's a Polygon
-                if isinstance(geom, Polygon):
-                    geom = MultiPolygon([geom])
-                
-                # Create WKB element for database storage
-                wkb_element = from_shape(geom, srid=4326)  # Use SRID 4326 for WGS84
+                wkb_hex = wkb_hexes[i]
                 
                 # Extract attributes from this row
                 attributes = {k: str(v) for k, v in row.items() if k != 'geometry'}
@@ -251,30 +201,23 @@ async def upload_shapefile(
                 if len(gdf) > 1:
                     area_name = f"{name} ({i+1})"
                 
-                # Create new area
-                db_area = ProjectAreaModel(
-                    id=str(uuid.uuid4()),
-                    name=area_name,
-                    area_type=area_type,
-                    geometry=wkb_element,
-                    area_metadata=metadata,
-                    project_id=project_id,
-                    source_type="shapefile",
-                    original_filename=file.filename,
-                    processing_status="completed",
-                    area_sq_km=area_sq_km,
-                    updated_at=func.now()
-                )
-                db.add(db_area)
-                created_areas.append(db_area)
-            
-            # Commit all areas at once
+                # Queue new area row
+                area_rows.append({
+                    "id": str(uuid.uuid4()),
+                    "name": area_name,
+                    "area_type": area_type,
+                    "geometry": wkb_hex,
+                    "area_metadata": metadata,
+                    "project_id": project_id,
+                    "source_type": "shapefile",
+                    "original_filename": file.filename,
+                    "processing_status": "completed",
+                })
+            
+            # Insert all areas at once
+            created_areas = insert_project_areas(db, area_rows)
             db.commit()
             
-            # Refresh all areas to get their created_at timestamps
-            for area in created_areas:
-                db.refresh(area)
-            
             # If only one area was created, return it as an object
             # Otherwise return the list of areas
             if len(created_areas) == 1:
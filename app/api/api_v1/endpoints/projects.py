@@ -1,26 +1,93 @@
 import uuid
-import json
+import orjson
+import ijson
+import itertools
+import pyogrio
+import shapely
 import os
 import tempfile
 import shutil
 from typing import List, Optional, Union
 from fastapi import APIRouter, Depends, HTTPException, Body, UploadFile, File, Form, Query
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import text, func
-from geoalchemy2.shape import from_shape
-from shapely.geometry import shape, mapping
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy.orm import Session, selectinload, raiseload, undefer, defer
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import text, func, insert, select, values, column, literal, cast, String, Integer, JSON
+from sqlalchemy.exc import DBAPIError
+from cachetools import TTLCache
 
 from app.api import deps
+from app.utils.project_areas import attach_geojson
+from app.utils.uploads import save_upload
 from app.models.projects import Project as ProjectModel, ProjectArea as ProjectAreaModel
 from app.schemas.projects import (
-    Project, ProjectCreate, ProjectUpdate,
-    ProjectArea, ProjectAreaCreate, ProjectAreaUpdate,
+    Project, ProjectCreate, ProjectUpdate, ProjectList,
+    ProjectArea, ProjectAreaCreate, ProjectAreaUpdate, ProjectAreaList,
     ProjectWithStats, ProjectAreaWithStats
 )
 
 router = APIRouter()
 
+def _area_geojson_options(full: bool = False) -> tuple:
+    """Loader options for read paths: PostGIS-rendered GeoJSON instead of raw WKB.
+
+    The simplified display geometry is served unless `full` is set; touching
+    the raw geometry on these paths raises instead of lazy loading it.
+    """
+    geojson = ProjectAreaModel.geometry_geojson if full else ProjectAreaModel.geometry_display_geojson
+    return (undefer(geojson), defer(ProjectAreaModel.geometry, raiseload=True))
+
+
+_FULL_QUERY = Query(False, description="Return the full-resolution geometry instead of the simplified display geometry")
+
+# Building aggregates shared by the project and area stats queries
+_STATS_COLUMNS = """
+        COUNT(*) as total_buildings,
+        COUNT(*) FILTER (WHERE be.predicted_electrified = 1) as electrified_buildings,
+        COUNT(*) FILTER (WHERE be.predicted_electrified = 0 OR be.predicted_electrified IS NULL) as unelectrified_buildings,
+        AVG(be.consumption_kwh_month) as avg_consumption_kwh_month,
+        AVG(be.energy_demand_kwh) as avg_energy_demand_kwh_year"""
+
+# The same fields as stored in project_stats_mv / project_area_stats_mv
+_STATS_VIEW_COLUMNS = """
+        total_buildings,
+        electrified_buildings,
+        unelectrified_buildings,
+        avg_consumption_kwh_month,
+        avg_energy_demand_kwh_year"""
+
+# GeoJSON uploads larger than this are streamed instead of parsed whole
+_GEOJSON_STREAM_THRESHOLD = 1024 * 1024
+
+# Project statistics keyed by (project_id, areas last modified, area count)
+_project_stats_cache = TTLCache(maxsize=1024, ttl=300)
+
+# Area statistics keyed by (project_id, area_id, area last modified)
+_area_stats_cache = TTLCache(maxsize=4096, ttl=300)
+
+# Project list pages keyed by (skip, limit, projects state, areas state)
+_project_list_cache = TTLCache(maxsize=64, ttl=60)
+
+# Rendered area listings keyed by (project_id, full, areas state)
+_project_areas_cache = TTLCache(maxsize=256, ttl=300)
+
+# ProjectArea response fields other than geometry, in schema order
+_AREA_LIST_COLUMNS = (
+    ProjectAreaModel.id,
+    ProjectAreaModel.project_id,
+    ProjectAreaModel.name,
+    ProjectAreaModel.area_type,
+    ProjectAreaModel.area_metadata.label("metadata"),
+    ProjectAreaModel.source_type,
+    ProjectAreaModel.original_filename,
+    ProjectAreaModel.processing_status,
+    ProjectAreaModel.simplification_tolerance,
+    ProjectAreaModel.area_sq_km,
+    ProjectAreaModel.created_at,
+    ProjectAreaModel.updated_at,
+)
+
 
 @router.post("/", response_model=Project)
 def create_project(
@@ -46,23 +113,36 @@ def create_project(
 def list_projects(
     skip: int = 0,
     limit: int = 100,
+    full: bool = _FULL_QUERY,
     db: Session = Depends(deps.get_db),
     current_user: str = Depends(deps.get_current_user),
 ) -> List[Project]:
     """List all projects."""
-    projects = db.query(ProjectModel).offset(skip).limit(limit).all()
-    
-    # Process projects to handle special fields
-    for project in projects:
-        if hasattr(project, 'areas') and project.areas:
-            for area in project.areas:
-                # Convert WKBElement to GeoJSON dict
-                if hasattr(area.geometry, '__geo_interface__'):
-                    area.geometry = mapping(area.geometry)
-                
-                # Ensure metadata is a dict
-                if area.area_metadata is None:
-                    area.area_metadata = {}
+    # The list is the same for every user; any project or area insert,
+    # update or delete changes the cache key
+    projects_state = db.query(
+        func.max(func.coalesce(ProjectModel.updated_at, ProjectModel.created_at)),
+        func.count(ProjectModel.id)
+    ).one()
+    areas_state = db.query(
+        func.max(func.coalesce(ProjectAreaModel.updated_at, ProjectAreaModel.created_at)),
+        func.count(ProjectAreaModel.id)
+    ).one()
+    cache_key = (skip, limit, full, tuple(projects_state), tuple(areas_state))
+    
+    projects = _project_list_cache.get(cache_key)
+    if projects is None:
+        # Load all areas in one IN query instead of one lazy load per project;
+        # any other lazy load on the page raises instead of silently querying.
+        # Geometry and metadata conversion is handled by the ProjectArea schema.
+        projects = ProjectList.validate_python(
+            db.query(ProjectModel)
+            .options(selectinload(ProjectModel.areas).options(*_area_geojson_options(full)), raiseload("*"))
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        _project_list_cache[cache_key] = projects
     
     return projects
 
@@ -70,52 +150,118 @@ def list_projects(
 @router.get("/{project_id}", response_model=Project)
 def get_project(
     project_id: str,
+    full: bool = _FULL_QUERY,
     db: Session = Depends(deps.get_db),
 ) -> Project:
     """Get a project by ID."""
-    # Get project with basic info
-    project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
+    project = _get_project_with_areas(db, project_id, full)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
     return project
 
 
+def _get_project_with_areas(db: Session, project_id: str, full: bool = False) -> Optional[ProjectModel]:
+    """Load a project and its areas (as GeoJSON) in two queries."""
+    return (
+        db.query(ProjectModel)
+        .options(selectinload(ProjectModel.areas).options(*_area_geojson_options(full)))
+        .filter(ProjectModel.id == project_id)
+        .first()
+    )
+
+
 @router.get("/{project_id}/stats", response_model=ProjectWithStats)
 def get_project_stats(
     project_id: str,
+    full: bool = _FULL_QUERY,
     db: Session = Depends(deps.get_db),
 ) -> ProjectWithStats:
     """Get statistics for a project."""
-    # Get project with basic info
-    project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-    if not project:
+    # Get project with basic info and the state of its areas in one query;
+    # any area insert, update or delete changes the cache key
+    row = (
+        db.query(
+            ProjectModel,
+            func.max(func.coalesce(ProjectAreaModel.updated_at, ProjectAreaModel.created_at)),
+            func.count(ProjectAreaModel.id)
+        )
+        .outerjoin(ProjectAreaModel, ProjectAreaModel.project_id == ProjectModel.id)
+        .options(selectinload(ProjectModel.areas).options(*_area_geojson_options(full)))
+        .filter(ProjectModel.id == project_id)
+        .group_by(ProjectModel.id)
+        .first()
+    )
+    if not row:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    # Calculate statistics for all areas in the project
-    stats_query = """
+    project, areas_modified_at, area_count = row
+    cache_key = (project_id, areas_modified_at, area_count)
+    
+    stats = _project_stats_cache.get(cache_key)
+    if stats is None:
+        stats = _compute_project_stats(db, project_id, areas_modified_at, area_count)
+        _project_stats_cache[cache_key] = stats
+    
+    # Combine project info with statistics; the validated fields are passed
+    # through as-is rather than copying the ORM instance's __dict__
+    return ProjectWithStats(
+        **dict(Project.model_validate(project)),
+        **stats
+    )
+
+
+def _compute_project_stats(db: Session, project_id: str, areas_modified_at, area_count: int) -> dict:
+    """Return building statistics for a project's areas.
+    
+    Served from project_stats_mv when it was refreshed after the last area
+    change, otherwise computed live.
+    """
+    stats = db.execute(
+        text(f"""
+        SELECT {_STATS_VIEW_COLUMNS}
+        FROM project_stats_mv
+        WHERE project_id = :project_id
+          AND areas_modified_at = :areas_modified_at
+          AND area_count = :area_count
+        """),
+        {"project_id": project_id, "areas_modified_at": areas_modified_at, "area_count": area_count}
+    ).fetchone()
+    if stats is not None:
+        return _stats_to_dict(stats)
+    
+    # Calculate statistics for all areas in the project.
+    # Buildings are matched against the subdivided simplified areas: the &&
+    # bbox test lets the GiST indexes pick candidates for each small piece
+    # before ST_Intersects runs, and the IN semi-join counts each building
+    # once even where pieces or areas overlap.
+    stats_query = f"""
     SELECT 
-        COUNT(*) as total_buildings,
-        SUM(CASE WHEN be.predicted_electrified = 1 THEN 1 ELSE 0 END) as electrified_buildings,
-        SUM(CASE WHEN be.predicted_electrified = 0 OR be.predicted_electrified IS NULL THEN 1 ELSE 0 END) as unelectrified_buildings,
-        AVG(be.consumption_kwh_month) as avg_consumption_kwh_month,
-        AVG(be.energy_demand_kwh) as avg_energy_demand_kwh_year
-    FROM project_areas pa
-    JOIN buildings_energy be ON ST_Contains(pa.geometry, be.geom)
-    WHERE pa.project_id = :project_id
+        {_STATS_COLUMNS}
+    FROM buildings_energy be
+    WHERE be.id IN (
+        SELECT b.id
+        FROM project_areas pa
+        JOIN project_area_subdivisions s ON s.area_id = pa.id
+        JOIN buildings_energy b ON s.geom && b.geom AND ST_Intersects(s.geom, b.geom)
+        WHERE pa.project_id = :project_id
+    )
     """
     
     stats = db.execute(text(stats_query), {"project_id": project_id}).fetchone()
     
-    # Combine project info with statistics
-    return ProjectWithStats(
-        **project.__dict__,
-        total_buildings=stats.total_buildings or 0,
-        electrified_buildings=stats.electrified_buildings or 0,
-        unelectrified_buildings=stats.unelectrified_buildings or 0,
-        avg_consumption_kwh_month=stats.avg_consumption_kwh_month or 0,
-        avg_energy_demand_kwh_year=stats.avg_energy_demand_kwh_year or 0
-    )
+    return _stats_to_dict(stats)
+
+
+def _stats_to_dict(stats) -> dict:
+    """Map a stats row to the ProjectWithStats/ProjectAreaWithStats fields."""
+    return {
+        "total_buildings": stats.total_buildings or 0,
+        "electrified_buildings": stats.electrified_buildings or 0,
+        "unelectrified_buildings": stats.unelectrified_buildings or 0,
+        "avg_consumption_kwh_month": stats.avg_consumption_kwh_month or 0,
+        "avg_energy_demand_kwh_year": stats.avg_energy_demand_kwh_year or 0
+    }
 
 
 @router.put("/{project_id}", response_model=Project)
@@ -134,8 +280,8 @@ def update_project(
         setattr(db_project, field, value)
     
     db.commit()
-    db.refresh(db_project)
-    return db_project
+    # Reload with the areas' GeoJSON rather than lazy loading their WKB
+    return _get_project_with_areas(db, project_id)
 
 
 @router.delete("/{project_id}")
@@ -150,7 +296,7 @@ def delete_project(
     if not db_project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    # Delete the project (cascade will delete all areas)
+    # Delete the project; the database cascades the delete to its areas
     db.delete(db_project)
     db.commit()
     
@@ -160,6 +306,7 @@ def delete_project(
 @router.get("/{project_id}/areas", response_model=List[ProjectArea])
 def get_project_areas(
     project_id: str,
+    full: bool = _FULL_QUERY,
     db: Session = Depends(deps.get_db),
 ) -> List[ProjectArea]:
     """Get all areas for a project."""
@@ -168,9 +315,34 @@ def get_project_areas(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    # Get all areas for the project
-    areas = db.query(ProjectAreaModel).filter(ProjectAreaModel.project_id == project_id).all()
-    return areas
+    # Any area insert, update or delete in the project changes the cache key,
+    # so the geometries are only rendered again when they have changed
+    areas_state = db.query(
+        func.max(func.coalesce(ProjectAreaModel.updated_at, ProjectAreaModel.created_at)),
+        func.count(ProjectAreaModel.id)
+    ).filter(ProjectAreaModel.project_id == project_id).one()
+    cache_key = (project_id, full, tuple(areas_state))
+    
+    body = _project_areas_cache.get(cache_key)
+    if body is None:
+        # Trusted DB rows are written straight to JSON: no ORM instances or
+        # ProjectArea models are built, and PostGIS' GeoJSON text is embedded
+        # without being parsed. response_model is kept for the OpenAPI schema.
+        geometry = ProjectAreaModel.geometry if full else ProjectAreaModel.geometry_display
+        rows = db.execute(
+            select(*_AREA_LIST_COLUMNS, func.ST_AsGeoJSON(geometry, 6).label("geometry"))
+            .where(ProjectAreaModel.project_id == project_id)
+        ).all()
+        body = orjson.dumps(
+            [
+                {**row._asdict(), "metadata": row.metadata or {}, "geometry": orjson.Fragment(row.geometry)}
+                for row in rows
+            ],
+            option=orjson.OPT_UTC_Z,
+        )
+        _project_areas_cache[cache_key] = body
+    
+    return Response(body, media_type="application/json")
 
 
 @router.post("/{project_id}/areas", response_model=Union[ProjectArea, List[ProjectArea]])
@@ -206,75 +378,66 @@ def add_project_area(
     if not geometries:
         raise HTTPException(status_code=400, detail="Invalid geometry format or no geometries found")
     
-    # Import required libraries
-    import json
-    from shapely.geometry import shape, mapping, Polygon, MultiPolygon
-    from shapely.ops import unary_union
-    from geoalchemy2.shape import from_shape
-    import shapely.wkt
-    
-    # Create areas for each geometry
-    created_areas = []
-    
+    # Build one VALUES row per geometry
+    source_rows = []
     for i, geometry in enumerate(geometries):
-        # Calculate area in square kilometers
-        area_sq_km = None
-        try:
-            # Use PostGIS to calculate area
-            geom_shape = shape(geometry)
-            # Convert to geography type for accurate area calculation in square meters
-            area_query = db.execute(
-                text("SELECT ST_Area(ST_Transform(ST_GeomFromGeoJSON(:geojson), 3857))/1000000 as area_sq_km"),
-                {"geojson": json.dumps(geometry)}
-            ).fetchone()
-            area_sq_km = area_query.area_sq_km if area_query else None
-        except Exception as e:
-            # Log the error but continue
-            print(f"Error calculating area: {e}")
-        
-        # Create a shapely geometry from the GeoJSON
-        geom_shape = shape(geometry)
-        
-        # Convert to MultiPolygon if it's a Polygon
-        if isinstance(geom_shape, Polygon):
-            geom_shape = MultiPolygon([geom_shape])
-        
-        # Create WKB element for database storage
-        wkb_element = from_shape(geom_shape, srid=4326)  # Use SRID 4326 for WGS84
-        
-        # Create area dict excluding geometry and metadata which we'll handle separately
-        area_dict = area.dict(exclude={'geometry', 'metadata'})
-        
         # Create area name with index if multiple geometries
-        if len(geometries) > 1:
-            area_dict["name"] = f"{area_dict['name']} ({i+1})"
-        
-        # Update metadata to include feature index if multiple geometries
+        name = area.name
         metadata = area.metadata or {}
         if len(geometries) > 1:
-            metadata["feature_index"] = i
+            name = f"{area.name} ({i+1})"
+            # Update metadata to include feature index if multiple geometries
+            metadata = {**metadata, "feature_index": i}
         
-        # Create new area
-        db_area = ProjectAreaModel(
-            id=str(uuid.uuid4()),
-            **area_dict,
-            geometry=wkb_element,  # Use the converted geometry
-            area_metadata=metadata,  # Map metadata to area_metadata
-            project_id=project_id,
-            processing_status="completed",
-            area_sq_km=area_sq_km,
-            updated_at=func.now()
+        source_rows.append((i, str(uuid.uuid4()), name, metadata, orjson.dumps(geometry).decode()))
+    
+    source = values(
+        column("ord", Integer),
+        column("id", String),
+        column("name", String),
+        column("metadata", JSON),
+        column("geojson", String),
+        name="source"
+    ).data(source_rows)
+    
+    # PostGIS parses each GeoJSON once and promotes it to MultiPolygon
+    # (area_sq_km is a generated column); nothing is parsed or re-encoded
+    # on the Python side
+    geom = func.ST_SetSRID(func.ST_GeomFromGeoJSON(source.c.geojson), 4326)
+    columns = ProjectAreaModel.__table__.c
+    constants = {
+        "project_id": project_id,
+        "processing_status": "completed",
+        **area.dict(exclude={'name', 'geometry', 'metadata'}),
+    }
+    select_stmt = select(
+        source.c.id,
+        source.c.name,
+        cast(source.c.metadata, JSON),
+        func.ST_Multi(geom),
+        func.now(),
+        *[cast(literal(value), columns[key].type) for key, value in constants.items()]
+    ).order_by(source.c.ord)
+    insert_stmt = (
+        insert(ProjectAreaModel)
+        .from_select(
+            [columns.id, columns.name, columns["metadata"], columns.geometry,
+             columns.updated_at, *[columns[key] for key in constants]],
+            select_stmt
         )
-        db.add(db_area)
-        created_areas.append(db_area)
+        .returning(ProjectAreaModel)
+    )
+    
+    try:
+        # Build the responses before commit so the expired instances are never reloaded
+        created_areas = ProjectAreaList.validate_python(attach_geojson(db.scalars(insert_stmt).all()))
+    except DBAPIError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=f"Invalid geometry: {e.orig}")
     
     # Commit all areas at once
     db.commit()
     
-    # Refresh all areas to get their created_at timestamps
-    for area in created_areas:
-        db.refresh(area)
-    
     # If only one area was created, return it as an object
     # Otherwise return the list of areas
     if len(created_areas) == 1:
@@ -287,14 +450,12 @@ def add_project_area(
 def get_project_area(
     project_id: str,
     area_id: str,
+    simplify: Optional[float] = Query(None, gt=0, description="Simplification tolerance in degrees applied in PostGIS"),
+    full: bool = _FULL_QUERY,
     db: Session = Depends(deps.get_db),
 ) -> ProjectArea:
     """Get a specific project area by ID."""
-    db_area = (
-        db.query(ProjectAreaModel)
-        .filter(ProjectAreaModel.project_id == project_id, ProjectAreaModel.id == area_id)
-        .first()
-    )
+    db_area = _get_area_with_geojson(db, project_id, area_id, simplify, full)
     if not db_area:
         raise HTTPException(status_code=404, detail="Project area not found")
     
@@ -305,44 +466,93 @@ def get_project_area(
 def get_project_area_stats(
     project_id: str,
     area_id: str,
+    simplify: Optional[float] = Query(None, gt=0, description="Simplification tolerance in degrees applied in PostGIS"),
+    full: bool = _FULL_QUERY,
     db: Session = Depends(deps.get_db),
 ) -> ProjectAreaWithStats:
     """Get statistics for a specific project area."""
     # Get the project area
-    db_area = (
-        db.query(ProjectAreaModel)
-        .filter(ProjectAreaModel.project_id == project_id, ProjectAreaModel.id == area_id)
-        .first()
-    )
+    db_area = _get_area_with_geojson(db, project_id, area_id, simplify, full)
     if not db_area:
         raise HTTPException(status_code=404, detail="Project area not found")
     
-    # Calculate statistics for the area
-    stats_query = """
-    SELECT 
-        COUNT(*) as total_buildings,
-        SUM(CASE WHEN be.predicted_electrified = 1 THEN 1 ELSE 0 END) as electrified_buildings,
-        SUM(CASE WHEN be.predicted_electrified = 0 OR be.predicted_electrified IS NULL THEN 1 ELSE 0 END) as unelectrified_buildings,
-        AVG(be.consumption_kwh_month) as avg_consumption_kwh_month,
-        AVG(be.energy_demand_kwh) as avg_energy_demand_kwh_year
-    FROM buildings_energy be
-    WHERE ST_Contains(ST_GeomFromGeoJSON(:geometry), be.geom)
+    area_modified_at = db_area.updated_at or db_area.created_at
+    cache_key = (project_id, area_id, area_modified_at)
+    
+    stats = _area_stats_cache.get(cache_key)
+    if stats is None:
+        stats = _compute_area_stats(db, area_id, area_modified_at)
+        _area_stats_cache[cache_key] = stats
+    
+    # Combine area info with statistics
+    return ProjectAreaWithStats(
+        **dict(ProjectArea.model_validate(db_area)),
+        **stats
+    )
+
+
+def _get_area_with_geojson(
+    db: Session, project_id: str, area_id: str, simplify: Optional[float] = None, full: bool = False
+) -> Optional[ProjectAreaModel]:
+    """Load an area with its geometry rendered as GeoJSON by PostGIS.
+    
+    The stored display geometry is served unless `full` is set. With
+    `simplify`, the full geometry is simplified in the same query and that
+    GeoJSON is served instead.
     """
+    query = db.query(ProjectAreaModel).filter(
+        ProjectAreaModel.project_id == project_id, ProjectAreaModel.id == area_id
+    )
+    if not simplify:
+        return query.options(*_area_geojson_options(full)).first()
+    
+    row = (
+        query.add_columns(cast(func.ST_AsGeoJSON(
+            func.ST_SimplifyPreserveTopology(ProjectAreaModel.geometry, simplify), 6
+        ), JSONB))
+        .options(defer(ProjectAreaModel.geometry, raiseload=True))
+        .first()
+    )
+    if not row:
+        return None
+    db_area, geojson = row
+    set_committed_value(db_area, "geometry_geojson", geojson)
+    return db_area
+
+
+def _compute_area_stats(db: Session, area_id: str, area_modified_at) -> dict:
+    """Return building statistics for one area.
     
+    Served from project_area_stats_mv when it was refreshed after the last
+    area change, otherwise computed live.
+    """
     stats = db.execute(
-        text(stats_query), 
-        {"geometry": json.dumps(db_area.geometry)}
+        text(f"""
+        SELECT {_STATS_VIEW_COLUMNS}
+        FROM project_area_stats_mv
+        WHERE area_id = :area_id AND area_modified_at = :area_modified_at
+        """),
+        {"area_id": area_id, "area_modified_at": area_modified_at}
     ).fetchone()
+    if stats is not None:
+        return _stats_to_dict(stats)
     
-    # Combine area info with statistics
-    return ProjectAreaWithStats(
-        **db_area.__dict__,
-        total_buildings=stats.total_buildings or 0,
-        electrified_buildings=stats.electrified_buildings or 0,
-        unelectrified_buildings=stats.unelectrified_buildings or 0,
-        avg_consumption_kwh_month=stats.avg_consumption_kwh_month or 0,
-        avg_energy_demand_kwh_year=stats.avg_energy_demand_kwh_year or 0
+    # Calculate statistics for the area against its stored subdivided pieces
+    stats_query = f"""
+    SELECT 
+        {_STATS_COLUMNS}
+    FROM buildings_energy be
+    WHERE be.id IN (
+        SELECT b.id
+        FROM project_area_subdivisions s
+        JOIN buildings_energy b ON s.geom && b.geom AND ST_Intersects(s.geom, b.geom)
+        WHERE s.area_id = :area_id
     )
+    """
+    
+    stats = db.execute(text(stats_query), {"area_id": area_id}).fetchone()
+    
+    return _stats_to_dict(stats)
 
 
 @router.put("/{project_id}/areas/{area_id}", response_model=ProjectArea)
@@ -365,8 +575,8 @@ def update_project_area(
         setattr(db_area, field, value)
     
     db.commit()
-    db.refresh(db_area)
-    return db_area
+    # Reload with the GeoJSON rendered by PostGIS
+    return _get_area_with_geojson(db, project_id, db_area.id, full=True)
 
 
 @router.delete("/{project_id}/areas/{area_id}")
@@ -412,59 +622,19 @@ async def upload_geojson_area(
     if not file.filename.lower().endswith('.geojson') and not file.filename.lower().endswith('.json'):
         raise HTTPException(status_code=400, detail="File must be a GeoJSON file (.geojson or .json)")
     
-    # Read and parse the GeoJSON file
+    # Find the first Polygon or MultiPolygon geometry in the upload
     try:
-        contents = await file.read()
-        geojson_data = json.loads(contents)
+        geometry = _read_first_polygon_geometry(file)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Invalid GeoJSON file: {str(e)}")
     
-    # Extract geometry from GeoJSON
-    geometry = None
-    if geojson_data.get('type') == 'FeatureCollection':
-        # Extract first feature with a valid geometry
-        for feature in geojson_data.get('features', []):
-            if feature.get('geometry', {}).get('type') in ['Polygon', 'MultiPolygon']:
-                geometry = feature['geometry']
-                break
-    elif geojson_data.get('type') == 'Feature':
-        if geojson_data.get('geometry', {}).get('type') in ['Polygon', 'MultiPolygon']:
-            geometry = geojson_data['geometry']
-    elif geojson_data.get('type') in ['Polygon', 'MultiPolygon']:
-        geometry = geojson_data
-    
     if not geometry:
         raise HTTPException(status_code=400, detail="No valid Polygon or MultiPolygon geometry found in GeoJSON")
     
-    # Convert to MultiPolygon if it's a Polygon
-    if geometry['type'] == 'Polygon':
-        geometry = {
-            'type': 'MultiPolygon',
-            'coordinates': [geometry['coordinates']]
-        }
-    
-    # Apply simplification if requested
-    if simplify and simplification_tolerance:
-        try:
-            geom_shape = shape(geometry)
-            simplified_shape = geom_shape.simplify(simplification_tolerance, preserve_topology=True)
-            geometry = mapping(simplified_shape)
-        except Exception as e:
-            # Log the error but continue with original geometry
-            print(f"Error simplifying geometry: {e}")
-    
-    # Calculate area in square kilometers
-    area_sq_km = None
-    try:
-        # Use PostGIS to calculate area
-        area_query = db.execute(
-            text("SELECT ST_Area(ST_Transform(ST_GeomFromGeoJSON(:geojson), 3857))/1000000 as area_sq_km"),
-            {"geojson": json.dumps(geometry)}
-        ).fetchone()
-        area_sq_km = area_query.area_sq_km if area_query else None
-    except Exception as e:
-        # Log the error but continue
-        print(f"Error calculating area: {e}")
+    # Simplify if requested and convert to MultiPolygon in PostGIS
+    wkb_hex = _prepare_uploaded_geometry(
+        db, geometry, simplification_tolerance if simplify else None
+    )
     
     # Create new area
     db_area = ProjectAreaModel(
@@ -472,18 +642,74 @@ async def upload_geojson_area(
         project_id=project_id,
         name=name,
         area_type=area_type,
-        geometry=geometry,
+        geometry=wkb_hex,
         source_type="geojson_upload",
         original_filename=file.filename,
         processing_status="completed",
         simplification_tolerance=simplification_tolerance if simplify else None,
-        area_sq_km=area_sq_km,
         metadata={}
     )
     db.add(db_area)
     db.commit()
-    db.refresh(db_area)
-    return db_area
+    # Reload with the GeoJSON rendered by PostGIS
+    return _get_area_with_geojson(db, project_id, db_area.id, full=True)
+
+
+def _prepare_uploaded_geometry(
+    db: Session, geometry: dict, simplification_tolerance: Optional[float]
+) -> str:
+    """Return the hex EWKB for an uploaded geometry.
+    
+    Simplification and MultiPolygon coercion run in one PostGIS call on a
+    single parse of the GeoJSON.
+    """
+    try:
+        row = db.execute(
+            text("""
+                SELECT encode(ST_AsEWKB(g), 'hex') as geometry
+                FROM (
+                    SELECT ST_Multi(COALESCE(ST_SimplifyPreserveTopology(g0, :tolerance), g0)) as g
+                    FROM (SELECT ST_SetSRID(ST_GeomFromGeoJSON(:geojson), 4326) as g0) src
+                ) prepared
+            """),
+            {"geojson": orjson.dumps(geometry).decode(), "tolerance": simplification_tolerance}
+        ).fetchone()
+    except DBAPIError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=f"Invalid geometry: {e.orig}")
+    return row.geometry
+
+
+def _read_first_polygon_geometry(file: UploadFile) -> Optional[dict]:
+    """Return the first Polygon/MultiPolygon geometry of a GeoJSON upload.
+    
+    Large FeatureCollections are streamed with ijson so parsing stops at the
+    first matching feature instead of building the whole object tree.
+    """
+    if file.size is None or file.size > _GEOJSON_STREAM_THRESHOLD:
+        features = ijson.items(file.file, 'features.item', use_float=True)
+        first_feature = next(features, None)
+        if first_feature is not None:
+            return _first_polygon_geometry(
+                feature.get('geometry') for feature in itertools.chain([first_feature], features)
+            )
+        # Not a FeatureCollection; parse the whole document below
+        file.file.seek(0)
+    
+    geojson_data = orjson.loads(file.file.read())
+    if geojson_data.get('type') == 'FeatureCollection':
+        return _first_polygon_geometry(feature.get('geometry') for feature in geojson_data.get('features', []))
+    elif geojson_data.get('type') == 'Feature':
+        return _first_polygon_geometry([geojson_data.get('geometry')])
+    return _first_polygon_geometry([geojson_data])
+
+
+def _first_polygon_geometry(geometries) -> Optional[dict]:
+    """Return the first Polygon/MultiPolygon in an iterable, stopping there."""
+    return next(
+        (g for g in geometries if g and g.get('type') in ('Polygon', 'MultiPolygon')),
+        None
+    )
 
 
 @router.post("/{project_id}/areas/shapefile-upload", response_model=ProjectArea)
@@ -515,9 +741,7 @@ async def upload_shapefile_area(
     try:
         # Save the uploaded zip file
         zip_path = os.path.join(temp_dir, file.filename)
-        with open(zip_path, "wb") as buffer:
-            contents = await file.read()
-            buffer.write(contents)
+        await save_upload(file, zip_path)
         
         # Extract the zip file
         import zipfile
@@ -529,76 +753,47 @@ async def upload_shapefile_area(
         if not shp_files:
             raise HTTPException(status_code=400, detail="No .shp file found in the zip archive")
         
-        # Read the shapefile using Fiona
-        import fiona
-        from fiona.crs import from_epsg
-        
+        # Read the shapefile header and first feature with pyogrio
         shp_path = os.path.join(temp_dir, shp_files[0])
-        with fiona.open(shp_path) as source:
-            # Check if the shapefile contains polygon features
-            if source.schema['geometry'] not in ['Polygon', 'MultiPolygon']:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Shapefile must contain Polygon or MultiPolygon geometries, found {source.schema['geometry']}"
-                )
-            
-            # Read the first feature
-            features = list(source)
-            if not features:
-                raise HTTPException(status_code=400, detail="Shapefile contains no features")
-            
-            # Convert to GeoJSON
-            feature = features[0]
-            geometry = feature['geometry']
-            
-            # Convert to MultiPolygon if it's a Polygon
-            if geometry['type'] == 'Polygon':
-                geometry = {
-                    'type': 'MultiPolygon',
-                    'coordinates': [geometry['coordinates']]
-                }
-            
-            # Apply simplification if requested
-            if simplify and simplification_tolerance:
-                try:
-                    geom_shape = shape(geometry)
-                    simplified_shape = geom_shape.simplify(simplification_tolerance, preserve_topology=True)
-                    geometry = mapping(simplified_shape)
-                except Exception as e:
-                    # Log the error but continue with original geometry
-                    print(f"Error simplifying geometry: {e}")
-            
-            # Calculate area in square kilometers
-            area_sq_km = None
-            try:
-                # Use PostGIS to calculate area
-                area_query = db.execute(
-                    text("SELECT ST_Area(ST_Transform(ST_GeomFromGeoJSON(:geojson), 3857))/1000000 as area_sq_km"),
-                    {"geojson": json.dumps(geometry)}
-                ).fetchone()
-                area_sq_km = area_query.area_sq_km if area_query else None
-            except Exception as e:
-                # Log the error but continue
-                print(f"Error calculating area: {e}")
-            
-            # Create new area
-            db_area = ProjectAreaModel(
-                id=str(uuid.uuid4()),
-                project_id=project_id,
-                name=name,
-                area_type=area_type,
-                geometry=geometry,
-                source_type="shapefile",
-                original_filename=file.filename,
-                processing_status="completed",
-                simplification_tolerance=simplification_tolerance if simplify else None,
-                area_sq_km=area_sq_km,
-                metadata={}
+        info = pyogrio.read_info(shp_path)
+        
+        # Check if the shapefile contains polygon features
+        if info['geometry_type'] not in ['Polygon', 'MultiPolygon']:
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Shapefile must contain Polygon or MultiPolygon geometries, found {info['geometry_type']}"
             )
-            db.add(db_area)
-            db.commit()
-            db.refresh(db_area)
-            return db_area
+        
+        # Read only the first feature
+        gdf = pyogrio.read_dataframe(shp_path, max_features=1)
+        if len(gdf) == 0:
+            raise HTTPException(status_code=400, detail="Shapefile contains no features")
+        
+        # Convert to GeoJSON
+        geometry = orjson.loads(shapely.to_geojson(gdf.geometry.iloc[0]))
+        
+        # Simplify if requested and convert to MultiPolygon in PostGIS
+        wkb_hex = _prepare_uploaded_geometry(
+            db, geometry, simplification_tolerance if simplify else None
+        )
+        
+        # Create new area
+        db_area = ProjectAreaModel(
+            id=str(uuid.uuid4()),
+            project_id=project_id,
+            name=name,
+            area_type=area_type,
+            geometry=wkb_hex,
+            source_type="shapefile",
+            original_filename=file.filename,
+            processing_status="completed",
+            simplification_tolerance=simplification_tolerance if simplify else None,
+            metadata={}
+        )
+        db.add(db_area)
+        db.commit()
+        # Reload with the GeoJSON rendered by PostGIS
+        return _get_area_with_geojson(db, project_id, db_area.id, full=True)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing shapefile: {str(e)}")
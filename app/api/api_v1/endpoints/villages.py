@@ -1,14 +1,21 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from pydantic import BaseModel
+from pydantic import TypeAdapter
+from pydantic.dataclasses import dataclass
+from cachetools import TTLCache
 
 from app.api import deps
 
 router = APIRouter()
 
-class VillageSearchResult(BaseModel):
+# Village points are static reference data; cache typeahead results by (query, limit)
+_search_cache = TTLCache(maxsize=4096, ttl=600)
+
+# Slotted and frozen: results are read-only and can number in the thousands
+@dataclass(slots=True, frozen=True)
+class VillageSearchResult:
     id: str
     display_name: str  # Will contain "village name - (commune name)"
     name: str
@@ -16,6 +23,9 @@ class VillageSearchResult(BaseModel):
     longitude: float
     latitude: float
 
+# Serializes the whole result list to JSON in one pydantic-core pass
+_VILLAGE_LIST_ADAPTER = TypeAdapter(List[VillageSearchResult])
+
 @router.get("/search", response_model=List[VillageSearchResult])
 def search_villages(
     query: str = Query(..., description="Search text for village name"),
@@ -26,26 +36,34 @@ def search_villages(
     Search for villages by name, returns results with commune information.
     The display name will be in the format: 'Village Name - (Commune Name)'
     """
+    # The serialized body is cached, so repeated searches skip serialization too
+    cache_key = (query, limit)
+    body = _search_cache.get(cache_key)
+    if body is not None:
+        return Response(body, media_type="application/json")
+    
+    # The name filter uses the trigram index on immutable_unaccent(name);
+    # the commune lookup runs per surviving village, in rank order, until
+    # the limit is reached.
     search_query = text("""
         SELECT 
             v.id,
             v.name as village_name,
             a.name as commune_name,
+            format('%s - (%s)', v.name, a.name) as display_name,
             ST_X(v.geometry) as longitude,
             ST_Y(v.geometry) as latitude
         FROM village_points v
-        JOIN administrative_boundaries a ON ST_Contains(a.geom, v.geometry)
-        WHERE 
-            a.level = 'commune'
-            AND (
-                unaccent(v.name) ILIKE unaccent(:search)
-                OR unaccent(v.name) ILIKE unaccent(:partial_search)
-            )
+        CROSS JOIN LATERAL (
+            SELECT ab.name
+            FROM administrative_boundary_subdivisions s
+            JOIN administrative_boundaries ab ON ab.id = s.admin_id
+            WHERE ab.level = 'commune' AND ST_Intersects(s.geom, v.geometry)
+            LIMIT 1
+        ) a
+        WHERE immutable_unaccent(v.name) ILIKE immutable_unaccent(:partial_search)
         ORDER BY 
-            CASE 
-                WHEN unaccent(v.name) ILIKE unaccent(:search) THEN 0 
-                ELSE 1 
-            END,
+            immutable_unaccent(v.name) ILIKE immutable_unaccent(:search) DESC,
             length(v.name)
         LIMIT :limit
     """)
@@ -59,14 +77,18 @@ def search_villages(
         }
     ).fetchall()
     
-    return [
+    villages = [
         VillageSearchResult(
             id=row.id,
             name=row.village_name,
             commune_name=row.commune_name,
-            display_name=f"{row.village_name} - ({row.commune_name})",
+            display_name=row.display_name,
             longitude=row.longitude,
             latitude=row.latitude
         )
         for row in results
-    ] 
\ No newline at end of file
+    ]
+    body = _VILLAGE_LIST_ADAPTER.dump_json(villages)
+    _search_cache[cache_key] = body
+    
+    return Response(body, media_type="application/json")
@@ -21,6 +21,9 @@ class Settings(BaseSettings):
             return v
         raise ValueError(v)
 
+    # Largest file accepted by the upload endpoints
+    MAX_UPLOAD_SIZE_MB: int = 100
+
     POSTGRES_SERVER: str
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
@@ -28,6 +31,12 @@ class Settings(BaseSettings):
     POSTGRES_PORT: str
     SQLALCHEMY_DATABASE_URI: Optional[PostgresDsn] = None
 
+    # Sized to cover the threadpool that runs the sync endpoints (40 threads)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 20
+    # Seconds before a pooled connection is replaced
+    DB_POOL_RECYCLE: int = 1800
+
     @validator("SQLALCHEMY_DATABASE_URI", pre=True)
     def assemble_db_connection(cls, v: Optional[str], values: Dict[str, Any]) -> Any:
         if isinstance(v, str):
@@ -1,10 +1,10 @@
 from datetime import datetime
 from typing import Any
 
+import orjson
 from fastapi.encoders import jsonable_encoder
 from geoalchemy2.elements import WKBElement
-from shapely import wkb
-from shapely.geometry import mapping
+import shapely
 
 
 def custom_jsonable_encoder(obj: Any, **kwargs) -> Any:
@@ -13,11 +13,29 @@ def custom_jsonable_encoder(obj: Any, **kwargs) -> Any:
     # Handle WKBElement (PostGIS geometry)
     if isinstance(obj, WKBElement):
         try:
-            geom = wkb.loads(bytes(obj.data))
-            return mapping(geom)
+            # GEOS writes the GeoJSON directly instead of building it via mapping()
+            return orjson.loads(shapely.to_geojson(shapely.from_wkb(bytes(obj.data))))
         except Exception as e:
             print(f"Error converting WKBElement to GeoJSON: {e}")
             return {}
     
     # Use the default encoder for other types
     return jsonable_encoder(obj, **kwargs)
+
+
+def orjson_default(obj: Any) -> Any:
+    """orjson `default` hook for the types orjson cannot serialize natively.
+    
+    Only called for values orjson does not already handle (dicts, lists,
+    primitives, datetimes, UUIDs and numpy values are written directly), so
+    the response tree is walked once.
+    """
+    # Embed GEOS-written GeoJSON as-is instead of parsing it back into dicts
+    if isinstance(obj, WKBElement):
+        try:
+            return orjson.Fragment(shapely.to_geojson(shapely.from_wkb(bytes(obj.data))))
+        except Exception as e:
+            print(f"Error converting WKBElement to GeoJSON: {e}")
+            return {}
+    
+    return custom_jsonable_encoder(obj)
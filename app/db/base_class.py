@@ -1,5 +1,6 @@
 from typing import Any
 
+from sqlalchemy import Table, event, text
 from sqlalchemy.ext.declarative import as_declarative, declared_attr
 
 
@@ -10,4 +11,16 @@ class Base:
     # Generate __tablename__ automatically
     @declared_attr
     def __tablename__(cls) -> str:
-        return cls.__name__.lower() 
\ No newline at end of file
+        return cls.__name__.lower()
+
+
+@event.listens_for(Table, "after_create")
+def _set_column_compression(table, connection, **kw):
+    # Column(info={'compression': 'lz4'}) sets the TOAST compression method,
+    # which SQLAlchemy has no DDL for
+    for column in table.columns:
+        method = column.info.get('compression')
+        if method:
+            connection.execute(text(
+                f'ALTER TABLE {table.name} ALTER COLUMN {column.name} SET COMPRESSION {method}'
+            ))
@@ -1,3 +1,4 @@
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -6,6 +7,14 @@ from app.core.config import settings
 engine = create_engine(
     str(settings.SQLALCHEMY_DATABASE_URI),
     # For SQLite, connect_args={"check_same_thread": False}
-    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    # Recycle connections instead of pinging on every checkout
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # GeoJSON comes back from PostGIS as json/jsonb; parse it with orjson
+    # rather than the stdlib decoder
+    json_deserializer=orjson.loads,
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine) 
\ No newline at end of file
+# Objects stay loaded after commit so building responses needs no refresh
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
@@ -1,17 +1,24 @@
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api.api_v1.api import api_router
 from app.core.config import settings
-from app.core.json_encoders import custom_jsonable_encoder
+from app.core.json_encoders import orjson_default
 
-# Create a custom response class that uses our custom JSON encoder
-class CustomJSONResponse(JSONResponse):
+# Create a custom response class that serializes with orjson in a single
+# pass, falling back to our custom encoder only for unsupported types
+class CustomJSONResponse(ORJSONResponse):
     def render(self, content):
-        return super().render(custom_jsonable_encoder(content))
+        return orjson.dumps(
+            content,
+            default=orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
 
 # Configure FastAPI to use our custom response class
 app = FastAPI(
@@ -29,6 +36,9 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
+# Compress large responses (area geometries and stats payloads)
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Add exception handlers to ensure CORS headers are present in error responses
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
@@ -1,5 +1,5 @@
 from app.models.buildings_energy import BuildingsEnergy
-from app.models.administrative_boundaries import AdministrativeBoundary
+from app.models.administrative_boundaries import AdministrativeBoundary, AdministrativeBoundarySubdivision
 from app.models.building_statistics import BuildingStatistics
 from app.models.grid_components import GridNode, GridLine, PowerPlant
 from app.models.unelectrified import UnelectrifiedCluster, UnelectrifiedBuilding
@@ -18,8 +18,31 @@ class AdministrativeBoundary(Base):
     __table_args__ = (
         Index('admin_boundaries_geom_idx', 'geom', postgresql_using='gist'),
         Index('admin_boundaries_level_idx', 'level'),
-        Index('admin_boundaries_parent_idx', 'parent_id'),
+        # Covering index: child listings by parent are index-only scans
+        Index('ix_ab_parent_cover', 'parent_id', postgresql_include=['id', 'name', 'level', 'level_num']),
     )
     
     def __repr__(self):
-        return f"<AdministrativeBoundary(id={self.id}, name={self.name}, level={self.level})>" 
\ No newline at end of file
+        return f"<AdministrativeBoundary(id={self.id}, name={self.name}, level={self.level})>"
+
+
+class AdministrativeBoundarySubdivision(Base):
+    """Small pieces of an administrative boundary (ST_Subdivide).
+
+    Maintained by a trigger on administrative_boundaries; point-in-polygon
+    joins against buildings and villages use these pieces so the GiST index
+    prunes candidates tightly instead of matching a whole region's bbox.
+    """
+    __tablename__ = "administrative_boundary_subdivisions"
+
+    id = Column(Integer, primary_key=True)
+    admin_id = Column(String, ForeignKey("administrative_boundaries.id", ondelete="CASCADE"), nullable=False)
+    geom = Column(Geometry('POLYGON', srid=4326), nullable=False)
+
+    __table_args__ = (
+        Index('admin_boundary_subdivisions_geom_idx', 'geom', postgresql_using='gist'),
+        Index('admin_boundary_subdivisions_admin_idx', 'admin_id'),
+    )
+
+    def __repr__(self):
+        return f"<AdministrativeBoundarySubdivision(id={self.id}, admin_id={self.admin_id})>"
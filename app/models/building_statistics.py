@@ -1,9 +1,14 @@
 from sqlalchemy import Column, String, Integer, Float, ForeignKey, Index, TIMESTAMP
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
 
 
+# Prediction probability thresholds (percent) behind hc_counts / hc_rates
+HC_THRESHOLDS = (50, 60, 70, 80, 85, 90)
+
+
 class BuildingStatistics(Base):
     __tablename__ = "building_statistics"
 
@@ -13,29 +18,30 @@ class BuildingStatistics(Base):
     # Building counts
     total_buildings = Column(Integer, default=0)
     electrified_buildings = Column(Integer, default=0)
-    high_confidence_50 = Column(Integer, default=0)
-    high_confidence_60 = Column(Integer, default=0)
-    high_confidence_70 = Column(Integer, default=0)
-    high_confidence_80 = Column(Integer, default=0)
-    high_confidence_85 = Column(Integer, default=0)
-    high_confidence_90 = Column(Integer, default=0)
     unelectrified_buildings = Column(Integer, default=0)
+    # Electrified buildings above each HC_THRESHOLDS probability, in order
+    hc_counts = Column(ARRAY(Integer, dimensions=1))
     
     # Rates
-    electrification_rate = Column(Float, default=0)
-    high_confidence_rate_50 = Column(Float, default=0)
-    high_confidence_rate_60 = Column(Float, default=0)
-    high_confidence_rate_70 = Column(Float, default=0)
-    high_confidence_rate_80 = Column(Float, default=0)
-    high_confidence_rate_85 = Column(Float, default=0)
-    high_confidence_rate_90 = Column(Float, default=0)
+    # Stored as real: percentages and averages don't need double precision
+    electrification_rate = Column(Float(precision=24), default=0)
+    hc_rates = Column(ARRAY(Float(precision=24), dimensions=1))
     
     # Energy metrics
-    avg_consumption_kwh_month = Column(Float, default=0)
-    avg_energy_demand_kwh_year = Column(Float, default=0)
+    avg_consumption_kwh_month = Column(Float(precision=24), default=0)
+    avg_energy_demand_kwh_year = Column(Float(precision=24), default=0)
+    avg_std_consumption_kwh_month = Column(Float(precision=24), default=0)
     
     # Timestamps
     updated_at = Column(TIMESTAMP, server_default="CURRENT_TIMESTAMP", onupdate="CURRENT_TIMESTAMP")
+
+    __table_args__ = (
+        # Covering index: dashboard lookups by admin_id are index-only scans
+        Index('ix_bs_admin_cover', 'admin_id', postgresql_include=[
+            'total_buildings', 'electrified_buildings', 'electrification_rate',
+            'avg_consumption_kwh_month', 'avg_energy_demand_kwh_year',
+        ]),
+    )
     
     def __repr__(self):
         return f"<BuildingStatistics(id={self.id}, admin_id={self.admin_id}, total_buildings={self.total_buildings})>" 
\ No newline at end of file
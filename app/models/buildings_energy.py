@@ -1,6 +1,6 @@
-from sqlalchemy import Boolean, Column, Float, Integer, String, Index, Text
+from sqlalchemy import Boolean, Column, Computed, Float, ForeignKey, Integer, String, Index, Text, text
 from sqlalchemy.sql.sqltypes import TIMESTAMP
-from geoalchemy2 import Geometry
+from geoalchemy2 import Geography, Geometry
 from geoalchemy2.types import WKBElement
 
 from app.db.base_class import Base
@@ -11,13 +11,19 @@ class BuildingsEnergy(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     geom = Column(Geometry('MULTIPOLYGON', srid=4326), nullable=False)
+    # Precomputed for nearest/clustering queries in meters
+    centroid = Column(Geography('POINT', srid=4326, spatial_index=False),
+                      Computed('ST_Centroid(geom)::geography', persisted=True))
+    # Centroid coordinates as plain floats for exports and point rendering
+    lon = Column(Float, Computed('ST_X(ST_Centroid(geom))', persisted=True))
+    lat = Column(Float, Computed('ST_Y(ST_Centroid(geom))', persisted=True))
     area_in_meters = Column(Float, nullable=True)
     year = Column(Integer, nullable=False)
     energy_demand_kwh = Column(Float, nullable=True)
     has_access = Column(Boolean, nullable=True)
     building_type = Column(String, nullable=True)
     data_source = Column(String, nullable=True)
-    grid_node_id = Column(String, nullable=True)
+    grid_node_id = Column(Integer, ForeignKey("grid_nodes.node_id", ondelete="SET NULL"), nullable=True)
     origin_id = Column(String, nullable=True)
     
     # ML prediction fields
@@ -43,12 +49,24 @@ class BuildingsEnergy(Base):
     # Create indexes
     __table_args__ = (
         Index('idx_buildings_energy_geom', 'geom', postgresql_using='gist'),
-        Index('idx_buildings_energy_year', 'year'),
-        Index('idx_buildings_energy_has_access', 'has_access'),
+        Index('idx_buildings_energy_centroid', 'centroid', postgresql_using='gist'),
+        Index('idx_buildings_energy_year_brin', 'year', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}, postgresql_ops={'year': 'int4_minmax_multi_ops'}),
+        # Unelectrified subsets only, for spatial queries that filter on access
+        Index('idx_buildings_energy_geom_no_access', 'geom', postgresql_using='gist',
+              postgresql_where=text('has_access = false')),
+        Index('idx_buildings_energy_geom_predicted_unelectrified', 'geom', postgresql_using='gist',
+              postgresql_where=text('predicted_electrified = 0')),
+        # Id-ordered paging over the same subsets; a full btree on these
+        # low-cardinality columns is never chosen over a seq scan
+        Index('ix_be_no_access', 'id', postgresql_where=text('has_access = false')),
+        Index('ix_be_unelec', 'id', postgresql_where=text('predicted_electrified = 0')),
         Index('idx_buildings_energy_building_type', 'building_type'),
         Index('idx_buildings_energy_grid_node_id', 'grid_node_id'),
+        # CLUSTER target (scripts/cluster_buildings_energy.py): keeps each
+        # snapshot year's rows together, grouped by grid node
+        Index('ix_be_year_grid', 'year', 'grid_node_id'),
         Index('idx_buildings_energy_predicted_prob', 'predicted_prob'),
-        Index('idx_buildings_energy_predicted_electrified', 'predicted_electrified'),
         Index('idx_buildings_energy_consumption_kwh_month', 'consumption_kwh_month'),
     ) 
     
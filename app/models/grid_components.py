@@ -1,21 +1,50 @@
-from sqlalchemy import Column, Integer, BigInteger, Index
+from sqlalchemy import Column, Computed, Float, Integer, Index, String
 from sqlalchemy.dialects.postgresql import JSONB
-from geoalchemy2 import Geometry
+from geoalchemy2 import Geography, Geometry
 
 from app.db.base_class import Base
 
 
+# properties is TOASTed with lz4 (see app.db.base_class), which decompresses
+# several times faster than the default pglz on every row that returns it.
+#
+# Keys the map styles and filters read are stored as generated columns so
+# they stay in sync with properties and need no JSON parsing per row.
+# Non-numeric values become NULL instead of failing the write.
+def _jsonb_number(key):
+    return Computed(
+        f"CASE WHEN jsonb_typeof(properties->'{key}') = 'number' "
+        f"THEN (properties->>'{key}')::double precision END",
+        persisted=True,
+    )
+
+
+def _jsonb_text(key):
+    return Computed(f"properties->>'{key}'", persisted=True)
+
+
 class GridNode(Base):
     __tablename__ = "grid_nodes"
 
-    node_id = Column(BigInteger, primary_key=True)
+    node_id = Column(Integer, primary_key=True)
     year = Column(Integer, nullable=False)
     location = Column(Geometry('POINT', srid=4326), nullable=False)
-    properties = Column(JSONB, default={})
+    # Geography copy for distance queries in meters (KNN and ST_DWithin);
+    # location stays geometry for the vector tiles
+    location_geog = Column(Geography('POINT', srid=4326, spatial_index=False),
+                           Computed('location::geography', persisted=True))
+    properties = Column(JSONB, default={}, info={'compression': 'lz4'})
+    voltage_kv = Column(Float, _jsonb_number('voltage_kv'))
+    status = Column(String, _jsonb_text('status'))
 
     __table_args__ = (
-        Index('idx_grid_nodes_geom', 'location', postgresql_using='gist'),
-        Index('idx_grid_nodes_year', 'year'),
+        # SP-GiST suits point data: smaller and faster to build and probe than GiST
+        Index('idx_grid_nodes_geom', 'location', postgresql_using='spgist'),
+        Index('idx_grid_nodes_properties', 'properties', postgresql_using='gin',
+              postgresql_ops={'properties': 'jsonb_path_ops'}),
+        Index('idx_grid_nodes_location_geog', 'location_geog', postgresql_using='gist'),
+        Index('idx_grid_nodes_year_brin', 'year', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}, postgresql_ops={'year': 'int4_minmax_multi_ops'}),
     )
 
     def __repr__(self):
@@ -25,14 +54,19 @@ class GridNode(Base):
 class GridLine(Base):
     __tablename__ = "grid_lines"
 
-    line_id = Column(BigInteger, primary_key=True)
+    line_id = Column(Integer, primary_key=True)
     year = Column(Integer, nullable=False)
     path = Column(Geometry('LINESTRING', srid=4326), nullable=False)
-    properties = Column(JSONB, default={})
+    properties = Column(JSONB, default={}, info={'compression': 'lz4'})
+    voltage_kv = Column(Float, _jsonb_number('voltage_kv'))
+    status = Column(String, _jsonb_text('status'))
 
     __table_args__ = (
         Index('idx_grid_lines_geom', 'path', postgresql_using='gist'),
-        Index('idx_grid_lines_year', 'year'),
+        Index('idx_grid_lines_properties', 'properties', postgresql_using='gin',
+              postgresql_ops={'properties': 'jsonb_path_ops'}),
+        Index('idx_grid_lines_year_brin', 'year', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}, postgresql_ops={'year': 'int4_minmax_multi_ops'}),
     )
 
     def __repr__(self):
@@ -42,14 +76,26 @@ class GridLine(Base):
 class PowerPlant(Base):
     __tablename__ = "power_plants"
 
-    plant_id = Column(BigInteger, primary_key=True)
+    plant_id = Column(Integer, primary_key=True)
     year = Column(Integer, nullable=False)
     location = Column(Geometry('POINT', srid=4326), nullable=False)
-    properties = Column(JSONB, default={})
+    # Geography copy for distance queries in meters (KNN and ST_DWithin);
+    # location stays geometry for the vector tiles
+    location_geog = Column(Geography('POINT', srid=4326, spatial_index=False),
+                           Computed('location::geography', persisted=True))
+    properties = Column(JSONB, default={}, info={'compression': 'lz4'})
+    plant_type = Column(String, _jsonb_text('plant_type'))
+    capacity_mw = Column(Float, _jsonb_number('capacity_mw'))
+    status = Column(String, _jsonb_text('status'))
 
     __table_args__ = (
-        Index('idx_power_plants_geom', 'location', postgresql_using='gist'),
-        Index('idx_power_plants_year', 'year'),
+        # SP-GiST suits point data: smaller and faster to build and probe than GiST
+        Index('idx_power_plants_geom', 'location', postgresql_using='spgist'),
+        Index('idx_power_plants_properties', 'properties', postgresql_using='gin',
+              postgresql_ops={'properties': 'jsonb_path_ops'}),
+        Index('idx_power_plants_location_geog', 'location_geog', postgresql_using='gist'),
+        Index('idx_power_plants_year_brin', 'year', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}, postgresql_ops={'year': 'int4_minmax_multi_ops'}),
     )
 
     def __repr__(self):
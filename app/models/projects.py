@@ -1,6 +1,7 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, func, Enum, JSON, Index, Float
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, func, Enum, JSON, Index, Float, Computed, cast, text
+from sqlalchemy.dialects.postgresql import JSONB
 from geoalchemy2 import Geometry
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred, column_property
 
 from app.db.base_class import Base
 
@@ -18,8 +19,10 @@ class Project(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-    # Relationships
-    areas = relationship("ProjectArea", back_populates="project", cascade="all, delete-orphan")
+    # Relationships; passive_deletes leaves removing the areas to the
+    # ON DELETE CASCADE foreign key instead of loading them first
+    areas = relationship("ProjectArea", back_populates="project", cascade="all, delete-orphan",
+                         passive_deletes=True)
 
     def __repr__(self):
         return f"<Project(id={self.id}, name={self.name}, status={self.status})>"
@@ -33,6 +36,19 @@ class ProjectArea(Base):
     name = Column(String, nullable=False)
     area_type = Column(Enum('village', 'custom', name='area_type'), nullable=False)
     geometry = Column(Geometry('MULTIPOLYGON', srid=4326), nullable=False)
+    # ~1m simplified copy used for spatial stats joins; full geometry is kept for display/export
+    geometry_simplified = deferred(Column(
+        Geometry('MULTIPOLYGON', srid=4326),
+        Computed("ST_SimplifyPreserveTopology(geometry, 0.00001)", persisted=True)
+    ))
+    # Coarser copy served to the map by default; simplification_tolerance overrides the ~50m default
+    geometry_display = deferred(Column(
+        Geometry('MULTIPOLYGON', srid=4326),
+        Computed("ST_SimplifyPreserveTopology(geometry, COALESCE(simplification_tolerance, 0.0005))", persisted=True)
+    ))
+    # GeoJSON rendered by PostGIS; undefer one of these on read paths so WKB never has to be decoded in Python
+    geometry_geojson = column_property(cast(func.ST_AsGeoJSON(geometry, 6), JSONB), deferred=True)
+    geometry_display_geojson = column_property(cast(func.ST_AsGeoJSON(geometry_display, 6), JSONB), deferred=True)
     area_metadata = Column(JSON, name='metadata')  # For storing additional area-specific data
     
     # New fields for handling various geometry inputs
@@ -41,7 +57,10 @@ class ProjectArea(Base):
     processing_status = Column(Enum('pending', 'processing', 'completed', 'failed', name='processing_status'), 
                               nullable=False, server_default='completed')
     simplification_tolerance = Column(Float, nullable=True)  # Tolerance used if geometry was simplified
-    area_sq_km = Column(Float, nullable=True)  # Area in square kilometers
+    # Area in square kilometers, measured on the spheroid by PostGIS on every write
+    area_sq_km = Column(Float, Computed("ST_Area(geometry::geography) / 1000000", persisted=True))
+    # Fingerprint of the stored geometry, for spotting identical areas without comparing geometries
+    geometry_hash = Column(String, Computed("md5(ST_AsBinary(geometry))", persisted=True))
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -52,8 +71,35 @@ class ProjectArea(Base):
     # Create indexes
     __table_args__ = (
         Index('project_areas_geom_idx', 'geometry', postgresql_using='gist'),
-        Index('project_areas_project_idx', 'project_id'),
+        Index('project_areas_geom_simplified_idx', 'geometry_simplified', postgresql_using='gist'),
+        # (project_id, id) serves both per-project listings and single-area lookups
+        Index('project_areas_project_id_id_idx', 'project_id', 'id'),
+        Index('project_areas_geometry_hash_idx', 'geometry_hash'),
+        Index('project_areas_pid_completed_idx', 'project_id',
+              postgresql_where=text("processing_status = 'completed'")),
+    )
+
+    def __repr__(self):
+        return f"<ProjectArea(id={self.id}, name={self.name}, type={self.area_type})>"
+
+
+class ProjectAreaSubdivision(Base):
+    """Small pieces of a project area's simplified geometry (ST_Subdivide).
+
+    Maintained by a trigger on project_areas; stats queries join against
+    these pieces so the GiST index prunes candidates tightly even for very
+    large or wide areas.
+    """
+    __tablename__ = "project_area_subdivisions"
+
+    id = Column(Integer, primary_key=True)
+    area_id = Column(String, ForeignKey("project_areas.id", ondelete="CASCADE"), nullable=False)
+    geom = Column(Geometry('POLYGON', srid=4326), nullable=False)
+
+    __table_args__ = (
+        Index('project_area_subdivisions_geom_idx', 'geom', postgresql_using='gist'),
+        Index('project_area_subdivisions_area_idx', 'area_id'),
     )
 
     def __repr__(self):
-        return f"<ProjectArea(id={self.id}, name={self.name}, type={self.area_type})>" 
\ No newline at end of file
+        return f"<ProjectAreaSubdivision(id={self.id}, area_id={self.area_id})>"
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, Float, String, Index, BigInteger
+from sqlalchemy import Column, Computed, Integer, Float, String, Index, BigInteger
 from sqlalchemy.dialects.postgresql import JSONB
-from geoalchemy2 import Geometry
+from geoalchemy2 import Geography, Geometry
 
 from app.db.base_class import Base
 
@@ -11,14 +11,27 @@ class UnelectrifiedCluster(Base):
     cluster_id = Column(Integer, primary_key=True)
     year = Column(Integer, nullable=False)
     area = Column(Geometry('POLYGON', srid=4326), nullable=False)
-    properties = Column(JSONB, nullable=False)
+    # Precomputed for nearest/clustering queries in meters
+    centroid = Column(Geography('POINT', srid=4326, spatial_index=False),
+                      Computed('ST_Centroid(area)::geography', persisted=True))
+    properties = Column(JSONB, nullable=False, info={'compression': 'lz4'})
     total_buildings = Column(Integer)
     total_energy_kwh = Column(Float)
     avg_energy_kwh = Column(Float)
+    # Read by the map's distance filter; generated so it stays in sync with properties
+    distance_to_grid_km = Column(Float, Computed(
+        "CASE WHEN jsonb_typeof(properties->'distance_to_grid_km') = 'number' "
+        "THEN (properties->>'distance_to_grid_km')::double precision END",
+        persisted=True,
+    ))
 
     __table_args__ = (
         Index('unelectrified_clusters_area_idx', 'area', postgresql_using='gist'),
-        Index('unelectrified_clusters_year_idx', 'year'),
+        Index('unelectrified_clusters_centroid_idx', 'centroid', postgresql_using='gist'),
+        Index('unelectrified_clusters_properties_idx', 'properties', postgresql_using='gin',
+              postgresql_ops={'properties': 'jsonb_path_ops'}),
+        Index('unelectrified_clusters_year_brin_idx', 'year', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}, postgresql_ops={'year': 'int4_minmax_multi_ops'}),
     )
 
     def __repr__(self):
@@ -10,6 +10,7 @@ class AdminStatisticsView(ViewBase):
     """
     Read-only model for the admin_statistics_view.
     This represents a SQL view joining administrative_boundaries with building_statistics.
+    The join runs on every query; API reads go through AdminStatisticsMaterialized.
     """
     __tablename__ = "admin_statistics_view"
 
@@ -31,17 +32,18 @@ class AdminStatisticsView(ViewBase):
     unelectrified_buildings = Column(Integer)
     
     # Rates
-    electrification_rate = Column(Float)
-    high_confidence_rate_50 = Column(Float)
-    high_confidence_rate_60 = Column(Float)
-    high_confidence_rate_70 = Column(Float)
-    high_confidence_rate_80 = Column(Float)
-    high_confidence_rate_85 = Column(Float)
-    high_confidence_rate_90 = Column(Float)
+    electrification_rate = Column(Float(precision=24))
+    high_confidence_rate_50 = Column(Float(precision=24))
+    high_confidence_rate_60 = Column(Float(precision=24))
+    high_confidence_rate_70 = Column(Float(precision=24))
+    high_confidence_rate_80 = Column(Float(precision=24))
+    high_confidence_rate_85 = Column(Float(precision=24))
+    high_confidence_rate_90 = Column(Float(precision=24))
     
     # Energy metrics
-    avg_consumption_kwh_month = Column(Float)
-    avg_energy_demand_kwh_year = Column(Float)
+    avg_consumption_kwh_month = Column(Float(precision=24))
+    avg_energy_demand_kwh_year = Column(Float(precision=24))
+    avg_std_consumption_kwh_month = Column(Float(precision=24))
     
     # Geometry
     geom = Column(Geometry('MULTIPOLYGON', srid=4326))
@@ -53,7 +55,8 @@ class AdminStatisticsView(ViewBase):
 class AdminStatisticsMaterialized(ViewBase):
     """
     Read-only model for the admin_statistics_materialized materialized view.
-    This is a materialized view for better performance.
+    This is a materialized view for better performance, refreshed concurrently
+    by scripts/refresh_building_statistics.py.
     """
     __tablename__ = "admin_statistics_materialized"
 
@@ -75,17 +78,18 @@ class AdminStatisticsMaterialized(ViewBase):
     unelectrified_buildings = Column(Integer)
     
     # Rates
-    electrification_rate = Column(Float)
-    high_confidence_rate_50 = Column(Float)
-    high_confidence_rate_60 = Column(Float)
-    high_confidence_rate_70 = Column(Float)
-    high_confidence_rate_80 = Column(Float)
-    high_confidence_rate_85 = Column(Float)
-    high_confidence_rate_90 = Column(Float)
+    electrification_rate = Column(Float(precision=24))
+    high_confidence_rate_50 = Column(Float(precision=24))
+    high_confidence_rate_60 = Column(Float(precision=24))
+    high_confidence_rate_70 = Column(Float(precision=24))
+    high_confidence_rate_80 = Column(Float(precision=24))
+    high_confidence_rate_85 = Column(Float(precision=24))
+    high_confidence_rate_90 = Column(Float(precision=24))
     
     # Energy metrics
-    avg_consumption_kwh_month = Column(Float)
-    avg_energy_demand_kwh_year = Column(Float)
+    avg_consumption_kwh_month = Column(Float(precision=24))
+    avg_energy_demand_kwh_year = Column(Float(precision=24))
+    avg_std_consumption_kwh_month = Column(Float(precision=24))
     
     # Geometry
     geom = Column(Geometry('MULTIPOLYGON', srid=4326))
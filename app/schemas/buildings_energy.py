@@ -1,12 +1,29 @@
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from datetime import datetime
-from shapely.geometry import MultiPolygon
-import json
+import orjson
+
+
+def geojson_to_multipolygon_ewkb(v: Any) -> str:
+    """Parse a GeoJSON (Multi)Polygon with GEOS and return 2D hex EWKB (SRID 4326).
+
+    Accepts a dict or the raw JSON text/bytes; the coordinates are never
+    walked in Python. The hex string binds directly to a Geometry column.
+    """
+    # GEOS is only loaded once a geometry is actually validated, not on
+    # every import of app.schemas
+    import shapely
+
+    try:
+        geom = shapely.from_geojson(v if isinstance(v, (str, bytes)) else orjson.dumps(v))
+    except (shapely.errors.GEOSException, TypeError) as e:
+        raise ValueError(f"Invalid GeoJSON geometry: {e}")
+    if geom.geom_type == "Polygon":
+        geom = shapely.multipolygons([geom])
+    elif geom.geom_type != "MultiPolygon":
+        raise ValueError(f"Expected a Polygon or MultiPolygon geometry, got {geom.geom_type}")
+    return shapely.to_wkb(shapely.set_srid(geom, 4326), hex=True, include_srid=True, output_dimension=2)
 
-class GeometryModel(BaseModel):
-    type: str = "MultiPolygon"
-    coordinates: List[List[List[List[float]]]]
 
 class BuildingBase(BaseModel):
     area_in_meters: Optional[float] = None
@@ -15,7 +32,7 @@ class BuildingBase(BaseModel):
     has_access: Optional[bool] = None
     building_type: Optional[str] = None
     data_source: Optional[str] = None
-    grid_node_id: Optional[str] = None
+    grid_node_id: Optional[int] = None
     origin_id: Optional[str] = None
 
     # ML prediction fields
@@ -30,10 +47,20 @@ class BuildingBase(BaseModel):
     origin: Optional[str] = None
 
 class BuildingCreate(BuildingBase):
-    geom: Dict[str, Any]  # GeoJSON-like structure
+    geom: Any  # GeoJSON geometry in, hex EWKB out
+
+    @field_validator('geom', mode='before')
+    @classmethod
+    def parse_geom(cls, v):
+        return geojson_to_multipolygon_ewkb(v)
 
 class BuildingUpdate(BuildingBase):
-    geom: Optional[Dict[str, Any]] = None
+    geom: Optional[Any] = None
+
+    @field_validator('geom', mode='before')
+    @classmethod
+    def parse_geom(cls, v):
+        return None if v is None else geojson_to_multipolygon_ewkb(v)
 
 class BuildingInDBBase(BuildingBase):
     id: int
@@ -41,8 +68,7 @@ class BuildingInDBBase(BuildingBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class Building(BuildingInDBBase):
     pass
@@ -71,8 +97,7 @@ class BuildingStats(BaseModel):
     avg_consumption: Optional[float] = None
     confidence_levels: Optional[Dict[str, int]] = None
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 # For spatial queries
 class BoundingBox(BaseModel):
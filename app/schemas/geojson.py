@@ -0,0 +1,40 @@
+from typing import Annotated, Any, Optional, Union
+
+from pydantic import Field, PlainSerializer, PlainValidator
+
+
+def _check_dict(v: Any) -> dict:
+    if not isinstance(v, dict):
+        raise ValueError("Expected a JSON object")
+    return v
+
+
+def _check_geometry_input(v: Any) -> Union[dict, list]:
+    if isinstance(v, dict):
+        return v
+    if isinstance(v, list) and all(isinstance(item, dict) for item in v):
+        return v
+    raise ValueError("Expected a GeoJSON object or a list of GeoJSON objects")
+
+
+def _passthrough(v: Any) -> Any:
+    return v
+
+
+# GeoJSON and free-form JSON objects are taken and returned as-is: Pydantic
+# checks the outer type only and never copies or walks the nested
+# coordinate lists. Shape checks are left to GEOS/PostGIS.
+JSONDict = Annotated[
+    dict,
+    PlainValidator(_check_dict, json_schema_input_type=dict),
+    PlainSerializer(_passthrough, return_type=dict),
+]
+GeoJSONDict = JSONDict
+GeoJSONInput = Annotated[
+    Union[dict, list],
+    PlainValidator(_check_geometry_input, json_schema_input_type=Union[dict, list]),
+    PlainSerializer(_passthrough, return_type=Union[dict, list]),
+]
+
+# Simplification tolerance accepted on input, in degrees; checked by pydantic-core
+Tolerance = Annotated[Optional[float], Field(ge=0.0, le=0.01)]
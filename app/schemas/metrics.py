@@ -1,6 +1,6 @@
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class RegionBasicInfo(BaseModel):
@@ -18,8 +18,7 @@ class HighConfidenceRates(BaseModel):
     eightyfive_percent: float = Field(..., alias="85_percent")
     ninety_percent: float = Field(..., alias="90_percent")
     
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class NationalStatistics(BaseModel):
@@ -1,30 +1,31 @@
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Union
-from pydantic import BaseModel, Field, validator
-from geoalchemy2.elements import WKBElement
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
+
+from app.schemas.geojson import GeoJSONDict, JSONDict, Tolerance
 
 
 class ProjectAreaBase(BaseModel):
     name: str
     area_type: str  # 'village' or 'custom'
-    geometry: dict  # GeoJSON MultiPolygon format
-    metadata: Optional[dict] = None
+    geometry: GeoJSONDict  # GeoJSON MultiPolygon format
+    metadata: Optional[JSONDict] = None
     source_type: Optional[str] = None  # 'drawn', 'geojson_upload', 'shapefile'
 
 
 class ProjectAreaCreate(ProjectAreaBase):
     original_filename: Optional[str] = None
-    simplification_tolerance: Optional[float] = None
+    simplification_tolerance: Tolerance = None
 
 
 class ProjectAreaUpdate(ProjectAreaBase):
     name: Optional[str] = None
     area_type: Optional[str] = None
-    geometry: Optional[dict] = None
+    geometry: Optional[GeoJSONDict] = None
     source_type: Optional[str] = None
-    metadata: Optional[dict] = None
+    metadata: Optional[JSONDict] = None
     original_filename: Optional[str] = None
-    simplification_tolerance: Optional[float] = None
+    simplification_tolerance: Tolerance = None
 
 
 class ProjectArea(ProjectAreaBase):
@@ -37,37 +38,33 @@ class ProjectArea(ProjectAreaBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
+    
+    @model_validator(mode='before')
+    @classmethod
+    def from_orm_row(cls, data: Any) -> Any:
+        """Read ORM rows field by field, using the GeoJSON rendered by PostGIS.
+
+        Raw WKB is never decoded here; ORM rows are loaded with one of the
+        GeoJSON column properties, and the full geometry's wins over the
+        display (simplified) one. The metadata column is mapped as
+        area_metadata (`metadata` is the declarative MetaData).
+        """
+        loaded = getattr(data, '__dict__', None)
+        if loaded is None or 'area_metadata' not in loaded:
+            return data
+        values = {field: getattr(data, field) for field in cls.model_fields if field not in ('geometry', 'metadata')}
+        values['metadata'] = loaded['area_metadata']
+        geojson_key = next(
+            (key for key in ('geometry_geojson', 'geometry_display_geojson') if key in loaded), None
+        )
+        values['geometry'] = loaded[geojson_key] if geojson_key else data.geometry
+        return values
     
-    @validator('geometry', pre=True)
-    def validate_geometry(cls, v):
-        if isinstance(v, WKBElement):
-            from shapely import wkb
-            from shapely.geometry import mapping
-            try:
-                geom = wkb.loads(bytes(v.data))
-                return mapping(geom)
-            except Exception as e:
-                print(f"Error converting WKBElement to GeoJSON: {e}")
-                return {}
-        return v
-        
-    @validator('metadata', pre=True)
+    @field_validator('metadata', mode='before')
+    @classmethod
     def validate_metadata(cls, v):
-        if v is None:
-            return {}
-        if hasattr(v, 'items'):
-            return dict(v)
-        # Handle area_metadata from SQLAlchemy model
-        if hasattr(v, 'area_metadata'):
-            metadata = v.area_metadata
-            if metadata is None:
-                return {}
-            if hasattr(metadata, 'items'):
-                return dict(metadata)
-        return {}
+        return v or {}
 
 
 class ProjectBase(BaseModel):
@@ -94,8 +91,12 @@ class Project(ProjectBase):
     updated_at: Optional[datetime]
     areas: List[ProjectArea]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Validate a whole list of ORM rows in one call instead of one model_validate per row
+ProjectAreaList = TypeAdapter(List[ProjectArea])
+ProjectList = TypeAdapter(List[Project])
 
 
 class ProjectWithStats(Project):
@@ -111,4 +112,4 @@ class ProjectAreaWithStats(ProjectArea):
     electrified_buildings: int
     unelectrified_buildings: int
     avg_consumption_kwh_month: float
-    avg_energy_demand_kwh_year: float 
\ No newline at end of file
+    avg_energy_demand_kwh_year: float
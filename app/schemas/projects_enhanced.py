@@ -1,8 +1,11 @@
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Union
-from pydantic import BaseModel, Field, validator
+from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic.dataclasses import dataclass
 from enum import Enum
 
+from app.schemas.geojson import GeoJSONDict, GeoJSONInput, JSONDict, Tolerance
+
 
 class SourceType(str, Enum):
     """Enumeration of source types for project areas"""
@@ -47,16 +50,16 @@ class GeometryValidationInfo(BaseModel):
     was_merged: bool = False
     merged_from_count: int = 1
     was_validated: bool = True
-    validation_errors: List[str] = []
+    validation_errors: List[str] = Field(default_factory=list)
 
 
 class ProcessingMetadata(BaseModel):
     """Metadata about geometry processing"""
     feature_index: int = 0
-    properties: Dict[str, Any] = {}
+    properties: JSONDict = Field(default_factory=dict)
     processing_timestamp: str
     geometry_validation: GeometryValidationInfo
-    source_properties: Dict[str, Any] = {}
+    source_properties: JSONDict = Field(default_factory=dict)
 
 
 class SourceInfo(BaseModel):
@@ -69,34 +72,27 @@ class SourceInfo(BaseModel):
 
 class GeometryInputRequest(BaseModel):
     """Request model for enhanced geometry input"""
-    geometry: Union[Dict[str, Any], List[Dict[str, Any]]] = Field(
+    geometry: GeoJSONInput = Field(
         ..., 
         description="Geometry input (Feature, FeatureCollection, direct geometry, or list of any)"
     )
     name: str = Field(..., min_length=1, max_length=255, description="Base name for created areas")
     area_type: AreaType = Field(AreaType.CUSTOM, description="Type of area to create")
     merge_overlapping: bool = Field(False, description="Whether to merge overlapping geometries")
-    simplification_tolerance: Optional[float] = Field(
+    simplification_tolerance: Tolerance = Field(
         None, 
-        ge=0.0, 
-        le=0.01, 
         description="Tolerance for geometry simplification (0.0-0.01)"
     )
     preserve_properties: bool = Field(True, description="Whether to preserve feature properties")
     validate_only: bool = Field(False, description="Only validate, don't create areas")
 
-    @validator('name')
+    @field_validator('name')
+    @classmethod
     def validate_name(cls, v):
         if not v or not v.strip():
             raise ValueError('Name cannot be empty')
         return v.strip()
 
-    @validator('simplification_tolerance')
-    def validate_tolerance(cls, v):
-        if v is not None and (v < 0 or v > 0.01):
-            raise ValueError('Simplification tolerance must be between 0.0 and 0.01')
-        return v
-
 
 class BatchUploadRequest(BaseModel):
     """Request model for batch file upload"""
@@ -104,27 +100,28 @@ class BatchUploadRequest(BaseModel):
     area_type: AreaType = Field(AreaType.CUSTOM, description="Type of areas to create")
     merge_all: bool = Field(False, description="Merge all geometries from all files")
     merge_per_file: bool = Field(False, description="Merge geometries within each file")
-    simplification_tolerance: Optional[float] = Field(None, description="Simplification tolerance")
+    simplification_tolerance: Tolerance = Field(None, description="Simplification tolerance")
     max_files: int = Field(10, ge=1, le=50, description="Maximum number of files to process")
 
 
-class EstimatedArea(BaseModel):
+@dataclass(slots=True, frozen=True)
+class EstimatedArea:
     """Information about an estimated area"""
     name: str
     area_sq_km: float
     geometry_type: str
     has_properties: bool
     feature_index: int = 0
-    properties_preview: Dict[str, Any] = {}
+    properties_preview: Dict[str, Any] = Field(default_factory=dict)
 
 
 class GeometryValidationResponse(BaseModel):
     """Response model for geometry validation"""
     is_valid: bool
     error_message: str = ""
-    warnings: List[str] = []
-    geometry_info: Dict[str, Any] = {}
-    validation_details: Dict[str, Any] = {}
+    warnings: List[str] = Field(default_factory=list)
+    geometry_info: Dict[str, Any] = Field(default_factory=dict)
+    validation_details: Dict[str, Any] = Field(default_factory=dict)
 
 
 class GeometryAnalysisResponse(BaseModel):
@@ -132,12 +129,12 @@ class GeometryAnalysisResponse(BaseModel):
     total_features: int
     geometry_types: List[str]
     supported_types: List[str]
-    unsupported_types: List[str] = []
+    unsupported_types: List[str] = Field(default_factory=list)
     has_properties: bool
     will_create_areas: int
-    estimated_areas: List[EstimatedArea] = []
+    estimated_areas: List[EstimatedArea] = Field(default_factory=list)
     total_estimated_area_sq_km: float = 0.0
-    processing_options: Dict[str, Any] = {}
+    processing_options: Dict[str, Any] = Field(default_factory=dict)
 
 
 class ProcessedGeometryInfo(BaseModel):
@@ -154,7 +151,7 @@ class EnhancedProjectAreaBase(BaseModel):
     """Enhanced base model for project areas"""
     name: str = Field(..., min_length=1, max_length=255)
     area_type: AreaType
-    geometry: Dict[str, Any]
+    geometry: GeoJSONDict
     processing_metadata: Optional[ProcessingMetadata] = None
     source_info: Optional[SourceInfo] = None
 
@@ -169,7 +166,7 @@ class EnhancedProjectAreaUpdate(BaseModel):
     """Enhanced update model for project areas"""
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     area_type: Optional[AreaType] = None
-    geometry: Optional[Dict[str, Any]] = None
+    geometry: Optional[GeoJSONDict] = None
     processing_metadata: Optional[ProcessingMetadata] = None
     reprocess_geometry: bool = Field(False, description="Reprocess geometry with current settings")
 
@@ -184,15 +181,15 @@ class EnhancedProjectArea(EnhancedProjectAreaBase):
     area_sq_km: Optional[float] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
+    # Validated against ProcessingMetadata on the way in; read back as stored
+    processing_metadata: Optional[JSONDict] = None
     
     # Enhanced fields
-    geometry_hash: Optional[str] = None
+    geometry_hash: str
     validation_status: str = "unknown"
-    error_log: List[str] = []
+    error_log: List[str] = Field(default_factory=list)
 
-    class Config:
-        from_attributes = True
-        use_enum_values = True
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
 
 class ProjectAreaStats(BaseModel):
@@ -203,7 +200,7 @@ class ProjectAreaStats(BaseModel):
     avg_consumption_kwh_month: float = 0.0
     avg_energy_demand_kwh_year: float = 0.0
     electrification_rate: float = 0.0
-    confidence_metrics: Dict[str, float] = {}
+    confidence_metrics: Dict[str, float] = Field(default_factory=dict)
 
 
 class EnhancedProjectAreaWithStats(EnhancedProjectArea):
@@ -216,10 +213,10 @@ class BatchOperationResult(BaseModel):
     """Result of a batch operation"""
     total_files_processed: int
     successful_areas_created: int
-    failed_files: List[str] = []
-    warnings: List[str] = []
-    created_areas: List[EnhancedProjectArea] = []
-    processing_summary: Dict[str, Any] = {}
+    failed_files: List[str] = Field(default_factory=list)
+    warnings: List[str] = Field(default_factory=list)
+    created_areas: List[EnhancedProjectArea] = Field(default_factory=list)
+    processing_summary: Dict[str, Any] = Field(default_factory=dict)
 
 
 class FileUploadInfo(BaseModel):
@@ -228,7 +225,7 @@ class FileUploadInfo(BaseModel):
     file_size: int
     content_type: str
     geometry_preview: Optional[GeometryAnalysisResponse] = None
-    processing_options: Dict[str, Any] = {}
+    processing_options: Dict[str, Any] = Field(default_factory=dict)
 
 
 class BatchPreviewResponse(BaseModel):
@@ -236,26 +233,26 @@ class BatchPreviewResponse(BaseModel):
     files_info: List[FileUploadInfo]
     total_estimated_areas: int
     total_estimated_area_sq_km: float
-    recommended_settings: Dict[str, Any] = {}
-    warnings: List[str] = []
+    recommended_settings: Dict[str, Any] = Field(default_factory=dict)
+    warnings: List[str] = Field(default_factory=list)
 
 
 class GeometryOperationRequest(BaseModel):
     """Request for geometry operations"""
     operation: str = Field(..., description="Operation type (merge, split, simplify, validate)")
     area_ids: List[str] = Field(..., description="List of area IDs to operate on")
-    parameters: Dict[str, Any] = Field({}, description="Operation-specific parameters")
+    parameters: Dict[str, Any] = Field(default_factory=dict, description="Operation-specific parameters")
 
 
 class GeometryOperationResponse(BaseModel):
     """Response for geometry operations"""
     operation: str
     success: bool
-    affected_areas: List[str] = []
-    created_areas: List[EnhancedProjectArea] = []
-    deleted_areas: List[str] = []
-    messages: List[str] = []
-    operation_metadata: Dict[str, Any] = {}
+    affected_areas: List[str] = Field(default_factory=list)
+    created_areas: List[EnhancedProjectArea] = Field(default_factory=list)
+    deleted_areas: List[str] = Field(default_factory=list)
+    messages: List[str] = Field(default_factory=list)
+    operation_metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
 class AreaComparisonResult(BaseModel):
@@ -277,8 +274,8 @@ class ProjectGeometryValidationReport(BaseModel):
     valid_areas: int
     invalid_areas: int
     areas_with_warnings: int
-    validation_issues: List[Dict[str, Any]] = []
-    recommendations: List[str] = []
+    validation_issues: List[Dict[str, Any]] = Field(default_factory=list)
+    recommendations: List[str] = Field(default_factory=list)
     overall_status: str
     validation_timestamp: datetime
 
@@ -302,5 +299,5 @@ class EnhancedProjectAreaSearchResponse(BaseModel):
     total_count: int
     filtered_count: int
     areas: List[EnhancedProjectArea]
-    search_metadata: Dict[str, Any] = {}
-    aggregations: Dict[str, Any] = {}
\ No newline at end of file
+    search_metadata: Dict[str, Any] = Field(default_factory=dict)
+    aggregations: Dict[str, Any] = Field(default_factory=dict)
\ No newline at end of file
@@ -1,12 +1,15 @@
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
+
+from app.schemas.geojson import GeoJSONDict
 
 
 class VillagePointBase(BaseModel):
     name: str
     commune_id: str
-    geometry: dict  # GeoJSON Point format
+    geometry: GeoJSONDict  # GeoJSON Point format
 
 
 class VillagePointCreate(VillagePointBase):
@@ -16,7 +19,7 @@ class VillagePointCreate(VillagePointBase):
 class VillagePointUpdate(VillagePointBase):
     name: Optional[str] = None
     commune_id: Optional[str] = None
-    geometry: Optional[dict] = None
+    geometry: Optional[GeoJSONDict] = None
 
 
 class VillagePoint(VillagePointBase):
@@ -24,11 +27,11 @@ class VillagePoint(VillagePointBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
-class AdminBoundaryInfo(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AdminBoundaryInfo:
     id: str
     name: str
     level: str
@@ -37,7 +40,7 @@ class AdminBoundaryInfo(BaseModel):
 class VillagePointSearch(BaseModel):
     id: str = Field(..., description="Unique identifier of the village")
     name: str = Field(..., description="Name of the village")
-    geometry: dict = Field(..., description="GeoJSON Point geometry of the village")
+    geometry: GeoJSONDict = Field(..., description="GeoJSON Point geometry of the village")
     distance_km: Optional[float] = Field(None, description="Distance from search point in kilometers")
     
     # Administrative boundary information
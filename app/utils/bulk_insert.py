@@ -0,0 +1,75 @@
+import math
+from typing import Any, Dict, List, Union
+
+from sqlalchemy import Table, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import TextClause
+
+from app.models.buildings_energy import BuildingsEnergy
+from app.models.unelectrified import UnelectrifiedBuilding
+
+
+def unnest_insert_statement(table: Table, columns: List[str]) -> TextClause:
+    """Build an INSERT ... SELECT FROM unnest(...) taking one array per column.
+
+    The whole batch is sent as a handful of typed arrays and the rows are
+    built server side, instead of one parameter set per row. Geometry arrays
+    take hex EWKB strings.
+    """
+    dialect = postgresql.dialect()
+    arrays = ", ".join(
+        f"CAST(:{name} AS {table.c[name].type.compile(dialect=dialect)}[])"
+        for name in columns
+    )
+    return text(
+        f"INSERT INTO {table.name} ({', '.join(columns)}) "
+        f"SELECT * FROM unnest({arrays})"
+    )
+
+
+def _column_arrays(columns: List[str], rows: List[Dict[str, Any]]) -> Dict[str, list]:
+    # NaN from pandas would be stored as 'NaN' (or fail for non-float
+    # columns); missing values go in as NULL
+    return {
+        name: [
+            None if isinstance(v, float) and math.isnan(v) else v
+            for v in (row.get(name) for row in rows)
+        ]
+        for name in columns
+    }
+
+
+BUILDING_COLUMNS = [
+    "geom", "area_in_meters", "year", "energy_demand_kwh", "has_access",
+    "building_type", "data_source", "grid_node_id", "origin_id",
+    "predicted_prob", "predicted_electrified",
+    "consumption_kwh_month", "std_consumption_kwh_month", "origin",
+]
+
+UNELECTRIFIED_BUILDING_COLUMNS = [
+    c.name for c in UnelectrifiedBuilding.__table__.columns if c.name != "id"
+]
+
+# Built once at import time; only the arrays change per batch
+_INSERT_BUILDINGS = unnest_insert_statement(BuildingsEnergy.__table__, BUILDING_COLUMNS)
+_INSERT_UNELECTRIFIED_BUILDINGS = unnest_insert_statement(
+    UnelectrifiedBuilding.__table__, UNELECTRIFIED_BUILDING_COLUMNS
+)
+
+
+def bulk_insert_buildings(db: Union[Session, Connection], rows: List[Dict[str, Any]]) -> int:
+    """Insert buildings_energy rows (geom as hex EWKB) in a single statement."""
+    if not rows:
+        return 0
+    db.execute(_INSERT_BUILDINGS, _column_arrays(BUILDING_COLUMNS, rows))
+    return len(rows)
+
+
+def bulk_insert_unelectrified_buildings(db: Union[Session, Connection], rows: List[Dict[str, Any]]) -> int:
+    """Insert unelectrified_buildings rows (geom as hex EWKB) in a single statement."""
+    if not rows:
+        return 0
+    db.execute(_INSERT_UNELECTRIFIED_BUILDINGS, _column_arrays(UNELECTRIFIED_BUILDING_COLUMNS, rows))
+    return len(rows)
@@ -1,10 +1,17 @@
-from typing import List, Dict, Any, Optional, Tuple, Union
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
 from shapely.geometry import Polygon, MultiPolygon, shape, mapping
-from shapely.validation import make_valid
 from shapely.ops import unary_union
+from pyproj import Geod
+import shapely
+import numpy as np
 import json
 import uuid
+from collections import Counter
 from datetime import datetime
+from functools import cached_property
+
+
+_WGS84_GEOD = Geod(ellps="WGS84")
 
 
 class GeometryProcessingError(Exception):
@@ -16,17 +23,22 @@ class ProcessedGeometry:
     """Container for processed geometry with metadata"""
     def __init__(
         self,
-        geometry: Dict[str, Any],
-        area_sq_km: float,
+        shapely_geometry: MultiPolygon,
+        area_sq_km: Optional[float],
         name: str,
         metadata: Dict[str, Any],
         source_info: Dict[str, Any]
     ):
-        self.geometry = geometry
+        self.shapely_geometry = shapely_geometry
         self.area_sq_km = area_sq_km
         self.name = name
         self.metadata = metadata
         self.source_info = source_info
+    
+    @cached_property
+    def geometry(self) -> Dict[str, Any]:
+        """GeoJSON of the processed geometry, only built when asked for"""
+        return mapping(self.shapely_geometry)
 
 
 class GeometryProcessor:
@@ -35,17 +47,26 @@ class GeometryProcessor:
     Supports single/multiple geometries from UI drawing, GeoJSON, and Shapefiles.
     """
     
-    SUPPORTED_GEOMETRY_TYPES = ["Polygon", "MultiPolygon"]
+    SUPPORTED_GEOMETRY_TYPES = frozenset({"Polygon", "MultiPolygon"})
+    INPUT_TYPES = frozenset({"Feature", "FeatureCollection", "Polygon", "MultiPolygon", "GeometryCollection"})
     
-    def __init__(self, area_calculation_func=None):
+    def __init__(self, area_calculation_func=None, batch_area_calculation_func=None, calculate_areas=True):
         """
         Initialize the geometry processor.
         
         Args:
             area_calculation_func: Optional function to calculate area in sq km
-                                 Should accept GeoJSON geometry and return float
+                                 Should accept a shapely geometry and return float
+            batch_area_calculation_func: Optional function to calculate the areas of
+                                 all geometries at once. Should accept a list of
+                                 shapely geometries and return a list of floats
+            calculate_areas: Set to False when the geometries are stored as
+                                 project areas, whose area_sq_km is generated
+                                 by PostGIS; area_sq_km is then left as None
         """
         self.area_calculation_func = area_calculation_func
+        self.batch_area_calculation_func = batch_area_calculation_func
+        self.calculate_areas = calculate_areas
     
     def process_geometry_input(
         self,
@@ -80,57 +101,136 @@ class GeometryProcessor:
             # Normalize input to list format
             normalized_inputs = self._normalize_input(geometry_input)
             
-            # Extract geometries from normalized inputs
-            extracted_geometries = []
-            for input_item in normalized_inputs:
-                geometries = self._extract_geometries_from_input(input_item)
-                extracted_geometries.extend(geometries)
-            
-            if not extracted_geometries:
-                raise GeometryProcessingError("No valid geometries found in input")
-            
-            # Validate and clean geometries
-            valid_geometries = []
-            for geom_data in extracted_geometries:
-                try:
-                    validated = self._validate_and_clean_geometry(geom_data)
-                    if validated:
-                        valid_geometries.append(validated)
-                except Exception as e:
-                    # Log warning but continue with other geometries
-                    print(f"Warning: Skipping invalid geometry: {e}")
-                    continue
-            
-            if not valid_geometries:
-                raise GeometryProcessingError("No valid geometries after validation")
-            
-            # Apply simplification if requested
-            if simplification_tolerance:
-                valid_geometries = self._apply_simplification(valid_geometries, simplification_tolerance)
+            # Extract geometries from normalized inputs, one at a time
+            extracted_geometries = (
+                geom_data
+                for input_item in normalized_inputs
+                for geom_data in self._extract_geometries_from_input(input_item)
+            )
             
-            # Merge overlapping geometries if requested
-            if merge_overlapping and len(valid_geometries) > 1:
-                valid_geometries = self._merge_overlapping_geometries(valid_geometries)
+            return self._process_extracted_geometries(
+                extracted_geometries, base_name, area_type, source_type, source_filename,
+                merge_overlapping, simplification_tolerance
+            )
             
-            # Create ProcessedGeometry objects
-            processed_geometries = []
-            for i, geom_data in enumerate(valid_geometries):
-                processed = self._create_processed_geometry(
-                    geom_data,
-                    base_name,
-                    i,
-                    len(valid_geometries),
-                    area_type,
-                    source_type,
-                    source_filename
-                )
-                processed_geometries.append(processed)
-            
-            return processed_geometries
+        except Exception as e:
+            raise GeometryProcessingError(f"Failed to process geometry input: {str(e)}")
+    
+    def process_feature_stream(
+        self,
+        features: Iterable[Dict[str, Any]],
+        base_name: str,
+        area_type: str = "custom",
+        source_type: str = "api",
+        source_filename: Optional[str] = None,
+        merge_overlapping: bool = False,
+        simplification_tolerance: Optional[float] = None
+    ) -> List[ProcessedGeometry]:
+        """
+        Process the features of a FeatureCollection as they are produced.
+        
+        Takes any iterable of GeoJSON Features (e.g. ijson streaming a large
+        upload's 'features' array), so the whole collection is never held
+        as one object tree; only the cleaned shapely geometries are kept.
+        Arguments are the same as for process_geometry_input.
+        """
+        try:
+            return self._process_extracted_geometries(
+                self._iter_feature_geometries(features), base_name, area_type, source_type,
+                source_filename, merge_overlapping, simplification_tolerance
+            )
             
         except Exception as e:
             raise GeometryProcessingError(f"Failed to process geometry input: {str(e)}")
     
+    def _iter_feature_geometries(self, features: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield the supported geometries of a stream of Features, like a FeatureCollection's"""
+        for i, feature in enumerate(features):
+            if not isinstance(feature, dict) or feature.get("type") != "Feature":
+                continue
+            for geom_data in self._extract_geometries_from_input(feature):
+                geom_data["feature_index"] = i
+                yield geom_data
+    
+    def _process_extracted_geometries(
+        self,
+        extracted_geometries: Iterable[Dict[str, Any]],
+        base_name: str,
+        area_type: str,
+        source_type: str,
+        source_filename: Optional[str],
+        merge_overlapping: bool,
+        simplification_tolerance: Optional[float]
+    ) -> List[ProcessedGeometry]:
+        """Validate, simplify, merge and wrap extracted geometries.
+        
+        Geometries are converted to shapely as they are extracted; each
+        one's GeoJSON is dropped once it has been converted.
+        """
+        # Convert each geometry to shapely as it is extracted. From here on
+        # the pipeline works on the shapely geometry; GeoJSON is only
+        # produced if a ProcessedGeometry's .geometry is read
+        extracted_count = 0
+        converted_geometries = []
+        shapely_geoms = []
+        for geom_data in extracted_geometries:
+            extracted_count += 1
+            try:
+                shapely_geoms.append(shape(geom_data.pop("geometry")))
+                converted_geometries.append(geom_data)
+            except Exception as e:
+                # Log warning but continue with other geometries
+                print(f"Warning: Skipping invalid geometry: {e}")
+                continue
+        
+        if not extracted_count:
+            raise GeometryProcessingError("No valid geometries found in input")
+        
+        # Validate and clean geometries
+        valid_geometries = self._validate_and_clean_geometries(converted_geometries, shapely_geoms)
+        del shapely_geoms
+        
+        if not valid_geometries:
+            raise GeometryProcessingError("No valid geometries after validation")
+        
+        # Apply simplification if requested
+        if simplification_tolerance:
+            valid_geometries = self._apply_simplification(valid_geometries, simplification_tolerance)
+        
+        # Merge overlapping geometries if requested
+        if merge_overlapping and len(valid_geometries) > 1:
+            valid_geometries = self._merge_overlapping_geometries(valid_geometries)
+        
+        # Calculate all areas up front so a batch calculator runs once
+        if self.calculate_areas:
+            areas_sq_km = self._calculate_areas_sq_km([g["shapely_geometry"] for g in valid_geometries])
+        else:
+            areas_sq_km = [None] * len(valid_geometries)
+        
+        # Everything that is the same for the whole batch is built once;
+        # source_info is shared (read-only) by all the results
+        processing_timestamp = datetime.now().isoformat()
+        source_info = {
+            "source_type": source_type,
+            "source_filename": source_filename,
+            "processing_method": "geometry_processor_v1"
+        }
+        
+        # Create ProcessedGeometry objects
+        processed_geometries = []
+        multiple = len(valid_geometries) > 1
+        for i, (geom_data, area_sq_km) in enumerate(zip(valid_geometries, areas_sq_km)):
+            processed = self._create_processed_geometry(
+                geom_data,
+                area_sq_km,
+                f"{base_name} ({i + 1})" if multiple else base_name,
+                processing_timestamp,
+                source_info
+            )
+            processed_geometries.append(processed)
+        
+        return processed_geometries
+    
     def _normalize_input(self, geometry_input: Union[Dict, List]) -> List[Dict]:
         """Normalize input to a list of dictionaries"""
         if isinstance(geometry_input, list):
@@ -155,6 +255,7 @@ class GeometryProcessor:
             if not features:
                 raise GeometryProcessingError("FeatureCollection has no features")
             
+            supported = self.SUPPORTED_GEOMETRY_TYPES
             for i, feature in enumerate(features):
                 if not isinstance(feature, dict):
                     continue
@@ -163,7 +264,7 @@ class GeometryProcessor:
                     continue
                 
                 geometry = feature.get("geometry")
-                if geometry and self._is_supported_geometry_type(geometry.get("type")):
+                if geometry and geometry.get("type") in supported:
                     geometry_with_metadata = {
                         "geometry": geometry,
                         "properties": feature.get("properties", {}),
@@ -174,7 +275,7 @@ class GeometryProcessor:
         elif geom_type == "Feature":
             # Handle single Feature
             geometry = input_item.get("geometry")
-            if geometry and self._is_supported_geometry_type(geometry.get("type")):
+            if geometry and geometry.get("type") in self.SUPPORTED_GEOMETRY_TYPES:
                 geometry_with_metadata = {
                     "geometry": geometry,
                     "properties": input_item.get("properties", {}),
@@ -194,8 +295,9 @@ class GeometryProcessor:
         elif geom_type == "GeometryCollection":
             # Handle GeometryCollection
             geom_list = input_item.get("geometries", [])
+            supported = self.SUPPORTED_GEOMETRY_TYPES
             for i, geom in enumerate(geom_list):
-                if self._is_supported_geometry_type(geom.get("type")):
+                if geom.get("type") in supported:
                     geometry_with_metadata = {
                         "geometry": geom,
                         "properties": {},
@@ -208,79 +310,82 @@ class GeometryProcessor:
         
         return geometries
     
-    def _is_supported_geometry_type(self, geom_type: str) -> bool:
-        """Check if geometry type is supported"""
-        return geom_type in self.SUPPORTED_GEOMETRY_TYPES
-    
-    def _validate_and_clean_geometry(self, geom_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Validate and clean a geometry, converting Polygon to MultiPolygon"""
-        try:
-            geometry = geom_data["geometry"]
-            
-            # Create shapely geometry
-            shapely_geom = shape(geometry)
-            
-            # Validate geometry
-            if not shapely_geom.is_valid:
-                # Try to fix invalid geometry
-                shapely_geom = make_valid(shapely_geom)
-                if not shapely_geom.is_valid:
-                    raise GeometryProcessingError("Cannot fix invalid geometry")
-            
-            # Check if geometry is empty or has zero area
-            if shapely_geom.is_empty or shapely_geom.area == 0:
-                raise GeometryProcessingError("Geometry is empty or has zero area")
-            
-            # Convert to MultiPolygon if it's a Polygon
-            if isinstance(shapely_geom, Polygon):
-                shapely_geom = MultiPolygon([shapely_geom])
-            elif not isinstance(shapely_geom, MultiPolygon):
-                raise GeometryProcessingError(f"Unsupported geometry type after validation: {type(shapely_geom)}")
-            
-            # Convert back to GeoJSON
-            clean_geometry = mapping(shapely_geom)
-            
-            # Update the geometry data
-            geom_data["geometry"] = clean_geometry
-            geom_data["shapely_geometry"] = shapely_geom
-            
-            return geom_data
-            
-        except Exception as e:
-            raise GeometryProcessingError(f"Geometry validation failed: {str(e)}")
+    def _validate_and_clean_geometries(
+        self,
+        geometries: List[Dict[str, Any]],
+        shapely_geoms: List[Any]
+    ) -> List[Dict[str, Any]]:
+        """Validate and clean geometries, converting Polygons to MultiPolygons
+        
+        Validity, emptiness and area are checked with vectorized GEOS calls
+        over the whole batch; make_valid only runs on the invalid ones.
+        Geometries that cannot be fixed, or that are not polygonal after
+        fixing, are skipped with a warning.
+        """
+        if not geometries:
+            return []
+        
+        geoms = np.array(shapely_geoms, dtype=object)
+        
+        # Try to fix invalid geometries
+        usable = shapely.is_valid(geoms)
+        invalid = ~usable
+        if invalid.any():
+            geoms[invalid] = shapely.make_valid(geoms[invalid])
+            usable[invalid] = shapely.is_valid(geoms[invalid])
+        
+        # Drop empty or zero-area geometries and anything not polygonal
+        type_ids = shapely.get_type_id(geoms)
+        usable &= ~shapely.is_empty(geoms) & (shapely.area(geoms) > 0) & ((type_ids == 3) | (type_ids == 6))
+        
+        # Convert Polygons to MultiPolygons
+        is_polygon = usable & (type_ids == 3)
+        if is_polygon.any():
+            geoms[is_polygon] = shapely.multipolygons(geoms[is_polygon], indices=np.arange(is_polygon.sum()))
+        
+        skipped = len(geometries) - int(usable.sum())
+        if skipped:
+            print(f"Warning: Skipping {skipped} invalid, empty or non-polygonal geometries")
+        
+        valid_geometries = []
+        for geom_data, shapely_geom, ok in zip(geometries, geoms, usable):
+            if ok:
+                geom_data["shapely_geometry"] = shapely_geom
+                valid_geometries.append(geom_data)
+        return valid_geometries
     
     def _apply_simplification(
         self, 
         geometries: List[Dict[str, Any]], 
         tolerance: float
     ) -> List[Dict[str, Any]]:
-        """Apply simplification to geometries"""
-        simplified_geometries = []
+        """Apply simplification to geometries
         
-        for geom_data in geometries:
-            try:
-                shapely_geom = geom_data["shapely_geometry"]
-                simplified = shapely_geom.simplify(tolerance, preserve_topology=True)
-                
-                # Ensure it's still valid after simplification
-                if simplified.is_valid and not simplified.is_empty:
-                    geom_data["geometry"] = mapping(simplified)
-                    geom_data["shapely_geometry"] = simplified
-                    geom_data["simplified"] = True
-                    geom_data["simplification_tolerance"] = tolerance
-                    simplified_geometries.append(geom_data)
-                else:
-                    # Use original if simplification failed
-                    geom_data["simplified"] = False
-                    simplified_geometries.append(geom_data)
-                    
-            except Exception as e:
-                # Use original if simplification failed
+        All geometries are simplified in one vectorized GEOS call. Inputs
+        are already valid and topology-preserving simplification keeps
+        them valid, so only empty results fall back to the original.
+        """
+        try:
+            shapely_geoms = np.array([geom_data["shapely_geometry"] for geom_data in geometries], dtype=object)
+            simplified = shapely.simplify(shapely_geoms, tolerance, preserve_topology=True)
+            usable = ~shapely.is_empty(simplified)
+        except Exception as e:
+            # Use originals if simplification failed
+            print(f"Warning: Simplification failed: {e}")
+            for geom_data in geometries:
+                geom_data["simplified"] = False
+            return geometries
+        
+        for geom_data, simplified_geom, ok in zip(geometries, simplified, usable):
+            if ok:
+                geom_data["shapely_geometry"] = simplified_geom
+                geom_data["simplified"] = True
+                geom_data["simplification_tolerance"] = tolerance
+            else:
+                # Use original if simplification emptied the geometry
                 geom_data["simplified"] = False
-                simplified_geometries.append(geom_data)
-                print(f"Warning: Simplification failed: {e}")
         
-        return simplified_geometries
+        return geometries
     
     def _merge_overlapping_geometries(self, geometries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Merge overlapping geometries into single geometries"""
@@ -291,79 +396,50 @@ class GeometryProcessor:
             # Extract shapely geometries
             shapely_geoms = [geom_data["shapely_geometry"] for geom_data in geometries]
             
-            # Find overlapping groups
-            merged_groups = []
-            processed = set()
-            
-            for i, geom1 in enumerate(shapely_geoms):
-                if i in processed:
-                    continue
-                
-                # Start a new group with this geometry
-                current_group = [i]
-                current_union = geom1
-                
-                # Find all geometries that overlap with current union
-                for j, geom2 in enumerate(shapely_geoms):
-                    if j <= i or j in processed:
-                        continue
-                    
-                    if current_union.intersects(geom2):
-                        current_group.append(j)
-                        union_result = unary_union([current_union, geom2])
-                        
-                        # Ensure union result is valid and convert to MultiPolygon if needed
-                        if isinstance(union_result, Polygon):
-                            current_union = MultiPolygon([union_result])
-                        elif isinstance(union_result, MultiPolygon):
-                            current_union = union_result
-                        else:
-                            # Handle other geometry types (GeometryCollection, etc.)
-                            try:
-                                # Try to extract polygons from the result
-                                polygons = []
-                                if hasattr(union_result, 'geoms'):
-                                    for geom in union_result.geoms:
-                                        if isinstance(geom, Polygon):
-                                            polygons.append(geom)
-                                        elif isinstance(geom, MultiPolygon):
-                                            polygons.extend(geom.geoms)
-                                if polygons:
-                                    current_union = MultiPolygon(polygons)
-                                else:
-                                    # Fallback: use original union result as is
-                                    current_union = union_result
-                            except Exception:
-                                # Fallback: use original union result
-                                current_union = union_result
-                
-                # Mark all geometries in this group as processed
-                for idx in current_group:
-                    processed.add(idx)
-                
-                merged_groups.append({
-                    "indices": current_group,
-                    "merged_geometry": current_union
-                })
-            
-            # Create merged geometry data
+            # All intersecting pairs from one bulk STRtree query instead of
+            # testing every pair against a growing union
+            tree = shapely.STRtree(shapely_geoms)
+            left, right = tree.query(shapely_geoms, predicate="intersects")
+            
+            # Union-find over the pairs; each root is the smallest index in
+            # its group, so groups keep the input order
+            parent = list(range(len(shapely_geoms)))
+            
+            def find(i: int) -> int:
+                while parent[i] != i:
+                    parent[i] = parent[parent[i]]
+                    i = parent[i]
+                return i
+            
+            for i, j in zip(left.tolist(), right.tolist()):
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+            
+            groups: Dict[int, List[int]] = {}
+            for i in range(len(shapely_geoms)):
+                groups.setdefault(find(i), []).append(i)
+            
+            # One cascaded union per group of overlapping geometries. Each
+            # group's first geometry data (metadata and properties included)
+            # is reused in place rather than copied.
             merged_geometries = []
-            for group in merged_groups:
-                # Use metadata from first geometry in group
-                first_idx = group["indices"][0]
-                base_geom_data = geometries[first_idx].copy()
+            for indices in groups.values():
+                if len(indices) == 1:
+                    merged_geom = shapely_geoms[indices[0]]
+                else:
+                    merged_geom = self._polygonal_part(unary_union([shapely_geoms[k] for k in indices]))
                 
-                # Update geometry - ensure it's MultiPolygon
-                merged_geom = group["merged_geometry"]
+                # Ensure it's MultiPolygon
                 if isinstance(merged_geom, Polygon):
                     merged_geom = MultiPolygon([merged_geom])
                 
-                base_geom_data["geometry"] = mapping(merged_geom)
+                base_geom_data = geometries[indices[0]]
                 base_geom_data["shapely_geometry"] = merged_geom
                 
                 # Update metadata to indicate merge
-                base_geom_data["merged_from_count"] = len(group["indices"])
-                base_geom_data["merged_indices"] = group["indices"]
+                base_geom_data["merged_from_count"] = len(indices)
+                base_geom_data["merged_indices"] = indices
                 
                 merged_geometries.append(base_geom_data)
             
@@ -373,7 +449,35 @@ class GeometryProcessor:
             print(f"Warning: Merge failed, returning original geometries: {e}")
             return geometries
     
-    def _calculate_area_sq_km(self, geometry: Dict[str, Any]) -> float:
+    @staticmethod
+    def _polygonal_part(geometry):
+        """Return a union result as a MultiPolygon, keeping only its polygons.
+        
+        Falls back to the geometry as-is when it holds no polygons.
+        """
+        if isinstance(geometry, Polygon):
+            return MultiPolygon([geometry])
+        if isinstance(geometry, MultiPolygon):
+            return geometry
+        polygons = []
+        for geom in getattr(geometry, 'geoms', []):
+            if isinstance(geom, Polygon):
+                polygons.append(geom)
+            elif isinstance(geom, MultiPolygon):
+                polygons.extend(geom.geoms)
+        return MultiPolygon(polygons) if polygons else geometry
+    
+    def _calculate_areas_sq_km(self, geometries: List[MultiPolygon]) -> List[float]:
+        """Calculate areas in square kilometers for a list of geometries"""
+        if self.batch_area_calculation_func:
+            try:
+                return self.batch_area_calculation_func(geometries)
+            except Exception as e:
+                print(f"Warning: Batch area calculation failed: {e}")
+        
+        return [self._calculate_area_sq_km(geometry) for geometry in geometries]
+    
+    def _calculate_area_sq_km(self, geometry: MultiPolygon) -> float:
         """Calculate area in square kilometers"""
         if self.area_calculation_func:
             try:
@@ -381,45 +485,30 @@ class GeometryProcessor:
             except Exception as e:
                 print(f"Warning: Area calculation failed: {e}")
         
-        # Fallback: use shapely for approximate calculation
+        # Fallback: geodesic area on the WGS84 ellipsoid. pyproj signs each
+        # ring by its winding, so orient rings consistently (exterior CCW,
+        # holes CW) before measuring
         try:
-            shapely_geom = shape(geometry)
-            # This is very approximate - assumes WGS84 coordinates
-            area_deg_sq = shapely_geom.area
-            # Very rough conversion (1 degree ≈ 111 km at equator)
-            area_sq_km = area_deg_sq * (111.0 ** 2)
-            return area_sq_km
+            oriented = shapely.orient_polygons(geometry)
+            return abs(_WGS84_GEOD.geometry_area_perimeter(oriented)[0]) / 1e6
         except Exception:
             return 0.0
     
     def _create_processed_geometry(
         self,
         geom_data: Dict[str, Any],
-        base_name: str,
-        index: int,
-        total_count: int,
-        area_type: str,
-        source_type: str,
-        source_filename: Optional[str]
+        area_sq_km: Optional[float],
+        name: str,
+        processing_timestamp: str,
+        source_info: Dict[str, Any]
     ) -> ProcessedGeometry:
         """Create a ProcessedGeometry object from geometry data"""
         
-        geometry = geom_data["geometry"]
-        
-        # Calculate area
-        area_sq_km = self._calculate_area_sq_km(geometry)
-        
-        # Generate name
-        if total_count > 1:
-            name = f"{base_name} ({index + 1})"
-        else:
-            name = base_name
-        
         # Build metadata
         metadata = {
             "feature_index": geom_data.get("feature_index", 0),
             "properties": geom_data.get("properties", {}),
-            "processing_timestamp": datetime.now().isoformat(),
+            "processing_timestamp": processing_timestamp,
             "geometry_validation": {
                 "was_simplified": geom_data.get("simplified", False),
                 "simplification_tolerance": geom_data.get("simplification_tolerance"),
@@ -428,15 +517,8 @@ class GeometryProcessor:
             }
         }
         
-        # Build source info
-        source_info = {
-            "source_type": source_type,
-            "source_filename": source_filename,
-            "processing_method": "geometry_processor_v1"
-        }
-        
         return ProcessedGeometry(
-            geometry=geometry,
+            shapely_geometry=geom_data["shapely_geometry"],
             area_sq_km=area_sq_km,
             name=name,
             metadata=metadata,
@@ -470,7 +552,7 @@ class GeometryProcessor:
                     return False, "Missing 'type' field in GeoJSON"
                 
                 geom_type = item.get("type")
-                if geom_type not in ["Feature", "FeatureCollection", "Polygon", "MultiPolygon", "GeometryCollection"]:
+                if geom_type not in GeometryProcessor.INPUT_TYPES:
                     return False, f"Unsupported geometry type: {geom_type}"
             
             return True, ""
@@ -491,7 +573,8 @@ class GeometryProcessor:
             normalized = processor._normalize_input(geometry_input)
             
             total_features = 0
-            geometry_types = []
+            # Count per type instead of listing every feature's type
+            type_counts: Counter = Counter()
             has_properties = False
             
             for item in normalized:
@@ -503,7 +586,7 @@ class GeometryProcessor:
                     for feature in features:
                         geom = feature.get("geometry", {})
                         if geom.get("type"):
-                            geometry_types.append(geom.get("type"))
+                            type_counts[geom["type"]] += 1
                         if feature.get("properties"):
                             has_properties = True
                             
@@ -511,27 +594,28 @@ class GeometryProcessor:
                     total_features += 1
                     geom = item.get("geometry", {})
                     if geom.get("type"):
-                        geometry_types.append(geom.get("type"))
+                        type_counts[geom["type"]] += 1
                     if item.get("properties"):
                         has_properties = True
                         
-                elif geom_type in ["Polygon", "MultiPolygon"]:
+                elif geom_type in GeometryProcessor.SUPPORTED_GEOMETRY_TYPES:
                     total_features += 1
-                    geometry_types.append(geom_type)
+                    type_counts[geom_type] += 1
                     
                 elif geom_type == "GeometryCollection":
                     geoms = item.get("geometries", [])
                     total_features += len(geoms)
                     for geom in geoms:
                         if geom.get("type"):
-                            geometry_types.append(geom.get("type"))
+                            type_counts[geom["type"]] += 1
             
+            supported_types = [t for t in type_counts if t in GeometryProcessor.SUPPORTED_GEOMETRY_TYPES]
             return {
                 "total_features": total_features,
-                "geometry_types": list(set(geometry_types)),
-                "supported_types": [t for t in geometry_types if t in ["Polygon", "MultiPolygon"]],
+                "geometry_types": list(type_counts),
+                "supported_types": supported_types,
                 "has_properties": has_properties,
-                "will_create_areas": len([t for t in geometry_types if t in ["Polygon", "MultiPolygon"]])
+                "will_create_areas": sum(type_counts[t] for t in supported_types)
             }
             
         except Exception as e:
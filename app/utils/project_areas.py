@@ -0,0 +1,62 @@
+from typing import List
+
+import numpy as np
+import orjson
+import shapely
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.projects import ProjectArea as ProjectAreaModel
+from app.schemas.projects import ProjectArea, ProjectAreaList
+
+
+def insert_project_areas(db: Session, area_rows: List[dict]) -> List[ProjectArea]:
+    """Bulk insert area rows in one INSERT ... RETURNING and build the responses.
+    
+    The responses are built before the caller commits so the created rows
+    never need to be refreshed one by one.
+    """
+    if not area_rows:
+        return []
+    
+    stmt = (
+        insert(ProjectAreaModel)
+        .values(updated_at=func.now())
+        .returning(ProjectAreaModel, sort_by_parameter_order=True)
+    )
+    return ProjectAreaList.validate_python(attach_geojson(db.scalars(stmt, area_rows).all()))
+
+
+def attach_geojson(areas: List[ProjectAreaModel]) -> List[ProjectAreaModel]:
+    """Render the areas' WKB geometries as GeoJSON in one vectorized GEOS pass.
+    
+    The ProjectArea schema serves geometry_geojson when it is loaded, so
+    the per-row WKB conversion in its validator is skipped.
+    """
+    if not areas:
+        return areas
+    
+    geoms = shapely.from_wkb([bytes(area.geometry.data) for area in areas])
+    for area, geojson in zip(areas, shapely.to_geojson(geoms)):
+        set_committed_value(area, "geometry_geojson", orjson.loads(geojson))
+    return areas
+
+
+def to_multipolygon_ewkb(geoms: np.ndarray) -> np.ndarray:
+    """Return 2D hex EWKB (SRID 4326) for an array of polygonal geometries.
+    
+    Polygons are promoted to single-part MultiPolygons to match the column
+    type. ST_GeomFromEWKT accepts hex EWKB as-is, so the result can be bound
+    directly as the geometry value.
+    """
+    is_polygon = shapely.get_type_id(geoms) == 3
+    if is_polygon.any():
+        geoms = geoms.copy()
+        geoms[is_polygon] = shapely.multipolygons(
+            geoms[is_polygon], indices=np.arange(is_polygon.sum())
+        )
+    
+    return shapely.to_wkb(
+        shapely.set_srid(geoms, 4326), hex=True, include_srid=True, output_dimension=2
+    )
@@ -0,0 +1,12 @@
+from fastapi import UploadFile
+
+
+# Read uploads in 64 KB chunks so memory stays flat regardless of file size
+UPLOAD_CHUNK_SIZE = 1 << 16
+
+
+async def save_upload(file: UploadFile, path: str) -> None:
+    """Stream an uploaded file to disk without reading it into memory at once."""
+    with open(path, "wb") as buffer:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            buffer.write(chunk)
@@ -13,6 +13,9 @@ DB_PARAMS = {
 
 def check_admin_data():
     conn = psycopg2.connect(**DB_PARAMS)
+    # One read-only snapshot for all the checks, so the counts agree with
+    # each other even while an import is writing
+    conn.set_session(isolation_level="REPEATABLE READ", readonly=True)
     cursor = conn.cursor()
     
     print("=== Administrative Boundaries ===")
@@ -6,7 +6,7 @@ import psycopg2
 from psycopg2.extras import execute_values
 import geopandas as gpd
 import pandas as pd
-from io import BytesIO
+from io import BytesIO, StringIO
 
 # Database connection parameters
 DB_PARAMS = {
@@ -38,6 +38,7 @@ def create_tables():
     print("Dropping existing tables...")
     cursor.execute("""
     DROP TABLE IF EXISTS building_statistics CASCADE;
+    DROP TABLE IF EXISTS administrative_boundary_subdivisions CASCADE;
     DROP TABLE IF EXISTS administrative_boundaries CASCADE;
     """)
     
@@ -60,31 +61,34 @@ def create_tables():
         admin_id TEXT REFERENCES administrative_boundaries(id),
         total_buildings INTEGER DEFAULT 0,
         electrified_buildings INTEGER DEFAULT 0,
-        high_confidence_50 INTEGER DEFAULT 0,
-        high_confidence_60 INTEGER DEFAULT 0,
-        high_confidence_70 INTEGER DEFAULT 0,
-        high_confidence_80 INTEGER DEFAULT 0,
-        high_confidence_85 INTEGER DEFAULT 0,
-        high_confidence_90 INTEGER DEFAULT 0,
+        hc_counts INTEGER[],
         unelectrified_buildings INTEGER DEFAULT 0,
-        electrification_rate FLOAT DEFAULT 0,
-        high_confidence_rate_50 FLOAT DEFAULT 0,
-        high_confidence_rate_60 FLOAT DEFAULT 0,
-        high_confidence_rate_70 FLOAT DEFAULT 0,
-        high_confidence_rate_80 FLOAT DEFAULT 0,
-        high_confidence_rate_85 FLOAT DEFAULT 0,
-        high_confidence_rate_90 FLOAT DEFAULT 0,
-        avg_consumption_kwh_month FLOAT DEFAULT 0,
-        avg_energy_demand_kwh_year FLOAT DEFAULT 0,
+        electrification_rate REAL DEFAULT 0,
+        hc_rates REAL[],
+        avg_consumption_kwh_month REAL DEFAULT 0,
+        avg_energy_demand_kwh_year REAL DEFAULT 0,
+        avg_std_consumption_kwh_month REAL DEFAULT 0,
         updated_at TIMESTAMP DEFAULT NOW(),
         UNIQUE(admin_id)
     );
     """)
     
+    # Subdivided boundaries for point-in-polygon joins (see subdivide_admin_boundaries)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS administrative_boundary_subdivisions (
+        id SERIAL PRIMARY KEY,
+        admin_id TEXT NOT NULL REFERENCES administrative_boundaries(id) ON DELETE CASCADE,
+        geom GEOMETRY(POLYGON, 4326) NOT NULL
+    );
+    """)
+    
     # Create spatial indexes
+    cursor.execute("CREATE INDEX IF NOT EXISTS admin_boundary_subdivisions_geom_idx ON administrative_boundary_subdivisions USING GIST(geom);")
+    cursor.execute("CREATE INDEX IF NOT EXISTS admin_boundary_subdivisions_admin_idx ON administrative_boundary_subdivisions(admin_id);")
     cursor.execute("CREATE INDEX IF NOT EXISTS admin_boundaries_geom_idx ON administrative_boundaries USING GIST(geom);")
     cursor.execute("CREATE INDEX IF NOT EXISTS admin_boundaries_level_idx ON administrative_boundaries(level);")
-    cursor.execute("CREATE INDEX IF NOT EXISTS admin_boundaries_parent_idx ON administrative_boundaries(parent_id);")
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_ab_parent_cover ON administrative_boundaries(parent_id) INCLUDE (id, name, level, level_num);")
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_bs_admin_cover ON building_statistics(admin_id) INCLUDE (total_buildings, electrified_buildings, electrification_rate, avg_consumption_kwh_month, avg_energy_demand_kwh_year);")
     
     conn.commit()
     cursor.close()
@@ -97,6 +101,17 @@ def import_admin_boundaries():
     conn = psycopg2.connect(**DB_PARAMS)
     cursor = conn.cursor()
     
+    # Each level is COPYed here and then upserted with one INSERT ... SELECT;
+    # temporary tables are not WAL-logged and are emptied on every commit
+    cursor.execute("""
+    CREATE TEMP TABLE administrative_boundaries_staging (
+        id TEXT,
+        name TEXT,
+        parent_id TEXT,
+        geom_wkb TEXT
+    ) ON COMMIT DELETE ROWS
+    """)
+    
     # Process levels in order from highest (region) to lowest (commune)
     for level_name in ["region", "department", "arrondissement", "commune"]:
         print(f"Importing {level_name} boundaries...")
@@ -136,56 +151,61 @@ def import_admin_boundaries():
             g.__class__([g]) if g.geom_type == 'Polygon' else None
         )
         
-        # Insert data into the database
-        for _, row in gdf.iterrows():
-            admin_id = str(row['id']) if row['id'] is not None else None
-            name = row['name']
-            
-            # For regions, always set parent_id to NULL
-            if level_name == "region":
-                parent_id = None
-                if 'parent_id' in row and row['parent_id'] is not None and not pd.isna(row['parent_id']):
-                    print(f"Warning: Region '{name}' has parent_id '{row['parent_id']}'. Setting to NULL as regions are top-level.")
-            else:
-                # For other levels, validate parent_id exists in the database
-                parent_id = str(row['parent_id']) if row['parent_id'] is not None and not pd.isna(row['parent_id']) else None
-                
-                # Check if parent_id exists in the database
-                if parent_id is not None:
-                    cursor.execute("SELECT 1 FROM administrative_boundaries WHERE id = %s", (parent_id,))
-                    if not cursor.fetchone():
-                        print(f"Warning: {level_name} '{name}' has parent_id '{parent_id}' which is not in the database. Setting to NULL.")
-                        parent_id = None
-            
-            # Convert geometry to WKT format
-            wkt = row['geom'].wkt if row['geom'] else None
-            
-            if wkt and admin_id:
-                cursor.execute("""
-                INSERT INTO administrative_boundaries 
-                (id, name, level, level_num, parent_id, geom)
-                VALUES (%s, %s, %s, %s, %s, ST_GeomFromText(%s, 4326))
-                ON CONFLICT (id) DO UPDATE
-                SET name = EXCLUDED.name, 
-                    parent_id = EXCLUDED.parent_id,
-                    geom = EXCLUDED.geom
-                RETURNING id
-                """, (
-                    admin_id,
-                    name, 
-                    level_name, 
-                    ADMIN_LEVELS[level_name],
-                    parent_id, 
-                    wkt
-                ))
-                
-                admin_id_inserted = cursor.fetchone()[0]
-                
-                cursor.execute("""
-                INSERT INTO building_statistics (admin_id)
-                VALUES (%s)
-                ON CONFLICT (admin_id) DO NOTHING
-                """, (admin_id_inserted,))
+        # Rows without an id or a polygonal geometry are skipped; for
+        # duplicate ids the last feature wins, as with row-by-row upserts
+        gdf = gdf[gdf['id'].notna() & gdf['geom'].notna()].drop_duplicates('id', keep='last')
+        rows = pd.DataFrame({
+            'id': gdf['id'].astype(str),
+            'name': gdf['name'],
+            'parent_id': None,
+            'geom_wkb': gpd.GeoSeries(gdf['geom']).to_wkb(hex=True),
+        })
+        
+        # For regions, always set parent_id to NULL
+        if level_name == "region":
+            if 'parent_id' in gdf.columns:
+                for name, parent_id in gdf.loc[gdf['parent_id'].notna(), ['name', 'parent_id']].itertuples(index=False):
+                    print(f"Warning: Region '{name}' has parent_id '{parent_id}'. Setting to NULL as regions are top-level.")
+        else:
+            rows['parent_id'] = gdf['parent_id'].map(lambda v: None if pd.isna(v) else str(v))
+        
+        # Load the whole level with one COPY into the staging table
+        buf = StringIO()
+        rows.to_csv(buf, index=False, header=False)
+        buf.seek(0)
+        cursor.copy_expert(
+            "COPY administrative_boundaries_staging (id, name, parent_id, geom_wkb) FROM STDIN WITH (FORMAT csv)",
+            buf
+        )
+        
+        # Parents must already be in the database (earlier levels); unknown
+        # ones are reported here and set to NULL by the LEFT JOIN below
+        cursor.execute("""
+        SELECT s.name, s.parent_id
+        FROM administrative_boundaries_staging s
+        LEFT JOIN administrative_boundaries p ON p.id = s.parent_id
+        WHERE s.parent_id IS NOT NULL AND p.id IS NULL
+        """)
+        for name, parent_id in cursor.fetchall():
+            print(f"Warning: {level_name} '{name}' has parent_id '{parent_id}' which is not in the database. Setting to NULL.")
+        
+        cursor.execute("""
+        INSERT INTO administrative_boundaries 
+        (id, name, level, level_num, parent_id, geom)
+        SELECT s.id, s.name, %s, %s, p.id, ST_GeomFromWKB(decode(s.geom_wkb, 'hex'), 4326)
+        FROM administrative_boundaries_staging s
+        LEFT JOIN administrative_boundaries p ON p.id = s.parent_id
+        ON CONFLICT (id) DO UPDATE
+        SET name = EXCLUDED.name, 
+            parent_id = EXCLUDED.parent_id,
+            geom = EXCLUDED.geom
+        """, (level_name, ADMIN_LEVELS[level_name]))
+        
+        cursor.execute("""
+        INSERT INTO building_statistics (admin_id)
+        SELECT id FROM administrative_boundaries_staging
+        ON CONFLICT (admin_id) DO NOTHING
+        """)
         
         conn.commit()
         print(f"Successfully imported {level_name} boundaries")
@@ -193,6 +213,23 @@ def import_admin_boundaries():
     cursor.close()
     conn.close()
 
+# Split boundaries into small pieces so spatial joins get tight bounding boxes
+def subdivide_admin_boundaries():
+    conn = psycopg2.connect(**DB_PARAMS)
+    cursor = conn.cursor()
+    
+    cursor.execute("""
+    TRUNCATE administrative_boundary_subdivisions;
+    INSERT INTO administrative_boundary_subdivisions (admin_id, geom)
+    SELECT id, ST_Subdivide(geom, 256) FROM administrative_boundaries;
+    """)
+    
+    conn.commit()
+    cursor.close()
+    conn.close()
+    
+    print("Administrative boundaries subdivided")
+
 # Calculate statistics for each administrative area
 def calculate_statistics():
     conn = psycopg2.connect(**DB_PARAMS)
@@ -205,69 +242,56 @@ def calculate_statistics():
     SET 
         total_buildings = subquery.total_buildings,
         electrified_buildings = subquery.electrified_buildings,
-        high_confidence_50 = subquery.high_confidence_50,
-        high_confidence_60 = subquery.high_confidence_60,
-        high_confidence_70 = subquery.high_confidence_70,
-        high_confidence_80 = subquery.high_confidence_80,
-        high_confidence_85 = subquery.high_confidence_85,
-        high_confidence_90 = subquery.high_confidence_90,
+        hc_counts = subquery.hc_counts,
         unelectrified_buildings = subquery.unelectrified_buildings,
         electrification_rate = CASE 
             WHEN subquery.total_buildings > 0 
             THEN (subquery.electrified_buildings::float / subquery.total_buildings::float) * 100 
             ELSE 0 
         END,
-        high_confidence_rate_50 = CASE 
-            WHEN subquery.total_buildings > 0 
-            THEN (subquery.high_confidence_50::float / subquery.total_buildings::float) * 100 
-            ELSE 0 
-        END,
-        high_confidence_rate_60 = CASE 
-            WHEN subquery.total_buildings > 0 
-            THEN (subquery.high_confidence_60::float / subquery.total_buildings::float) * 100 
-            ELSE 0 
-        END,
-        high_confidence_rate_70 = CASE 
-            WHEN subquery.total_buildings > 0 
-            THEN (subquery.high_confidence_70::float / subquery.total_buildings::float) * 100 
-            ELSE 0 
-        END,
-        high_confidence_rate_80 = CASE 
-            WHEN subquery.total_buildings > 0 
-            THEN (subquery.high_confidence_80::float / subquery.total_buildings::float) * 100 
-            ELSE 0 
-        END,
-        high_confidence_rate_85 = CASE 
-            WHEN subquery.total_buildings > 0 
-            THEN (subquery.high_confidence_85::float / subquery.total_buildings::float) * 100 
-            ELSE 0 
-        END,
-        high_confidence_rate_90 = CASE 
-            WHEN subquery.total_buildings > 0 
-            THEN (subquery.high_confidence_90::float / subquery.total_buildings::float) * 100 
-            ELSE 0 
-        END,
+        hc_rates = ARRAY[
+            CASE WHEN subquery.total_buildings > 0 THEN (subquery.hc_counts[1]::float / subquery.total_buildings::float) * 100 ELSE 0 END,
+            CASE WHEN subquery.total_buildings > 0 THEN (subquery.hc_counts[2]::float / subquery.total_buildings::float) * 100 ELSE 0 END,
+            CASE WHEN subquery.total_buildings > 0 THEN (subquery.hc_counts[3]::float / subquery.total_buildings::float) * 100 ELSE 0 END,
+            CASE WHEN subquery.total_buildings > 0 THEN (subquery.hc_counts[4]::float / subquery.total_buildings::float) * 100 ELSE 0 END,
+            CASE WHEN subquery.total_buildings > 0 THEN (subquery.hc_counts[5]::float / subquery.total_buildings::float) * 100 ELSE 0 END,
+            CASE WHEN subquery.total_buildings > 0 THEN (subquery.hc_counts[6]::float / subquery.total_buildings::float) * 100 ELSE 0 END
+        ],
         avg_consumption_kwh_month = subquery.avg_consumption_kwh_month,
         avg_energy_demand_kwh_year = subquery.avg_energy_demand_kwh_year,
+        avg_std_consumption_kwh_month = subquery.avg_std_consumption_kwh_month,
         updated_at = NOW()
     FROM (
         SELECT 
             ab.id as admin_id,
             COUNT(be.*) as total_buildings,
             SUM(CASE WHEN be.predicted_electrified = 1 THEN 1 ELSE 0 END) as electrified_buildings,
-            SUM(CASE WHEN be.predicted_electrified = 1 AND be.predicted_prob > 0.5 THEN 1 ELSE 0 END) as high_confidence_50,
-            SUM(CASE WHEN be.predicted_electrified = 1 AND be.predicted_prob > 0.6 THEN 1 ELSE 0 END) as high_confidence_60,
-            SUM(CASE WHEN be.predicted_electrified = 1 AND be.predicted_prob > 0.7 THEN 1 ELSE 0 END) as high_confidence_70,
-            SUM(CASE WHEN be.predicted_electrified = 1 AND be.predicted_prob > 0.8 THEN 1 ELSE 0 END) as high_confidence_80,
-            SUM(CASE WHEN be.predicted_electrified = 1 AND be.predicted_prob > 0.85 THEN 1 ELSE 0 END) as high_confidence_85,
-            SUM(CASE WHEN be.predicted_electrified = 1 AND be.predicted_prob > 0.9 THEN 1 ELSE 0 END) as high_confidence_90,
+            ARRAY[
+                SUM(CASE WHEN be.predicted_electrified = 1 AND be.predicted_prob > 0.5 THEN 1 ELSE 0 END),
+                SUM(CASE WHEN be.predicted_electrified = 1 AND be.predicted_prob > 0.6 THEN 1 ELSE 0 END),
+                SUM(CASE WHEN be.predicted_electrified = 1 AND be.predicted_prob > 0.7 THEN 1 ELSE 0 END),
+                SUM(CASE WHEN be.predicted_electrified = 1 AND be.predicted_prob > 0.8 THEN 1 ELSE 0 END),
+                SUM(CASE WHEN be.predicted_electrified = 1 AND be.predicted_prob > 0.85 THEN 1 ELSE 0 END),
+                SUM(CASE WHEN be.predicted_electrified = 1 AND be.predicted_prob > 0.9 THEN 1 ELSE 0 END)
+            ]::integer[] as hc_counts,
             SUM(CASE WHEN be.predicted_electrified = 0 OR be.predicted_electrified IS NULL THEN 1 ELSE 0 END) as unelectrified_buildings,
             AVG(be.consumption_kwh_month) as avg_consumption_kwh_month,
-            AVG(be.energy_demand_kwh) as avg_energy_demand_kwh_year
+            AVG(be.energy_demand_kwh) as avg_energy_demand_kwh_year,
+            AVG(be.std_consumption_kwh_month) as avg_std_consumption_kwh_month
         FROM 
             administrative_boundaries ab
-        LEFT JOIN 
-            buildings_energy be ON ST_Contains(ab.geom, be.geom)
+        LEFT JOIN (
+            -- Assign each building to the commune containing a point on its surface
+            SELECT c.admin_id AS commune_id, b.*
+            FROM buildings_energy b
+            CROSS JOIN LATERAL (
+                SELECT s.admin_id
+                FROM administrative_boundary_subdivisions s
+                JOIN administrative_boundaries sab ON sab.id = s.admin_id
+                WHERE sab.level = 'commune' AND ST_Intersects(s.geom, ST_PointOnSurface(b.geom))
+                LIMIT 1
+            ) c
+        ) be ON be.commune_id = ab.id
         WHERE 
             ab.level = 'commune'
         GROUP BY 
@@ -288,65 +312,35 @@ def calculate_statistics():
         SET 
             total_buildings = subquery.total_buildings,
             electrified_buildings = subquery.electrified_buildings,
-            high_confidence_50 = subquery.high_confidence_50,
-            high_confidence_60 = subquery.high_confidence_60,
-            high_confidence_70 = subquery.high_confidence_70,
-            high_confidence_80 = subquery.high_confidence_80,
-            high_confidence_85 = subquery.high_confidence_85,
-            high_confidence_90 = subquery.high_confidence_90,
+            hc_counts = subquery.hc_counts,
             unelectrified_buildings = subquery.unelectrified_buildings,
             electrification_rate = CASE 
                 WHEN subquery.total_buildings > 0 
                 THEN (subquery.electrified_buildings::float / subquery.total_buildings::float) * 100 
                 ELSE 0 
             END,
-            high_confidence_rate_50 = CASE 
-                WHEN subquery.total_buildings > 0 
-                THEN (subquery.high_confidence_50::float / subquery.total_buildings::float) * 100 
-                ELSE 0 
-            END,
-            high_confidence_rate_60 = CASE 
-                WHEN subquery.total_buildings > 0 
-                THEN (subquery.high_confidence_60::float / subquery.total_buildings::float) * 100 
-                ELSE 0 
-            END,
-            high_confidence_rate_70 = CASE 
-                WHEN subquery.total_buildings > 0 
-                THEN (subquery.high_confidence_70::float / subquery.total_buildings::float) * 100 
-                ELSE 0 
-            END,
-            high_confidence_rate_80 = CASE 
-                WHEN subquery.total_buildings > 0 
-                THEN (subquery.high_confidence_80::float / subquery.total_buildings::float) * 100 
-                ELSE 0 
-            END,
-            high_confidence_rate_85 = CASE 
-                WHEN subquery.total_buildings > 0 
-                THEN (subquery.high_confidence_85::float / subquery.total_buildings::float) * 100 
-                ELSE 0 
-            END,
-            high_confidence_rate_90 = CASE 
-                WHEN subquery.total_buildings > 0 
-                THEN (subquery.high_confidence_90::float / subquery.total_buildings::float) * 100 
-                ELSE 0 
-            END,
+            hc_rates = ARRAY[
+                CASE WHEN subquery.total_buildings > 0 THEN (subquery.hc_counts[1]::float / subquery.total_buildings::float) * 100 ELSE 0 END,
+                CASE WHEN subquery.total_buildings > 0 THEN (subquery.hc_counts[2]::float / subquery.total_buildings::float) * 100 ELSE 0 END,
+                CASE WHEN subquery.total_buildings > 0 THEN (subquery.hc_counts[3]::float / subquery.total_buildings::float) * 100 ELSE 0 END,
+                CASE WHEN subquery.total_buildings > 0 THEN (subquery.hc_counts[4]::float / subquery.total_buildings::float) * 100 ELSE 0 END,
+                CASE WHEN subquery.total_buildings > 0 THEN (subquery.hc_counts[5]::float / subquery.total_buildings::float) * 100 ELSE 0 END,
+                CASE WHEN subquery.total_buildings > 0 THEN (subquery.hc_counts[6]::float / subquery.total_buildings::float) * 100 ELSE 0 END
+            ],
             avg_consumption_kwh_month = subquery.avg_consumption_kwh_month,
             avg_energy_demand_kwh_year = subquery.avg_energy_demand_kwh_year,
+            avg_std_consumption_kwh_month = subquery.avg_std_consumption_kwh_month,
             updated_at = NOW()
         FROM (
             SELECT 
                 parent.id as admin_id,
                 SUM(child_stats.total_buildings) as total_buildings,
                 SUM(child_stats.electrified_buildings) as electrified_buildings,
-                SUM(child_stats.high_confidence_50) as high_confidence_50,
-                SUM(child_stats.high_confidence_60) as high_confidence_60,
-                SUM(child_stats.high_confidence_70) as high_confidence_70,
-                SUM(child_stats.high_confidence_80) as high_confidence_80,
-                SUM(child_stats.high_confidence_85) as high_confidence_85,
-                SUM(child_stats.high_confidence_90) as high_confidence_90,
+                ARRAY[SUM(child_stats.hc_counts[1]), SUM(child_stats.hc_counts[2]), SUM(child_stats.hc_counts[3]), SUM(child_stats.hc_counts[4]), SUM(child_stats.hc_counts[5]), SUM(child_stats.hc_counts[6])]::integer[] as hc_counts,
                 SUM(child_stats.unelectrified_buildings) as unelectrified_buildings,
                 AVG(child_stats.avg_consumption_kwh_month) as avg_consumption_kwh_month,
-                AVG(child_stats.avg_energy_demand_kwh_year) as avg_energy_demand_kwh_year
+                AVG(child_stats.avg_energy_demand_kwh_year) as avg_energy_demand_kwh_year,
+                AVG(child_stats.avg_std_consumption_kwh_month) as avg_std_consumption_kwh_month
             FROM 
                 administrative_boundaries parent
             JOIN 
@@ -365,6 +359,12 @@ def calculate_statistics():
         conn.commit()
         print(f"{level_name} statistics aggregated")
     
+    # VACUUM cannot run in a transaction; it refreshes the visibility map so
+    # the covering indexes can serve index-only scans
+    conn.autocommit = True
+    cursor.execute("VACUUM (ANALYZE) building_statistics")
+    cursor.execute("VACUUM (ANALYZE) administrative_boundaries")
+    
     cursor.close()
     conn.close()
 
@@ -385,22 +385,23 @@ def create_vector_tile_views():
         ab.parent_id, 
         bs.total_buildings, 
         bs.electrified_buildings, 
-        bs.high_confidence_50,
-        bs.high_confidence_60,
-        bs.high_confidence_70,
-        bs.high_confidence_80,
-        bs.high_confidence_85,
-        bs.high_confidence_90,
+        bs.hc_counts[1] AS high_confidence_50,
+        bs.hc_counts[2] AS high_confidence_60,
+        bs.hc_counts[3] AS high_confidence_70,
+        bs.hc_counts[4] AS high_confidence_80,
+        bs.hc_counts[5] AS high_confidence_85,
+        bs.hc_counts[6] AS high_confidence_90,
         bs.unelectrified_buildings,
         bs.electrification_rate, 
-        bs.high_confidence_rate_50,
-        bs.high_confidence_rate_60,
-        bs.high_confidence_rate_70,
-        bs.high_confidence_rate_80,
-        bs.high_confidence_rate_85,
-        bs.high_confidence_rate_90,
+        bs.hc_rates[1] AS high_confidence_rate_50,
+        bs.hc_rates[2] AS high_confidence_rate_60,
+        bs.hc_rates[3] AS high_confidence_rate_70,
+        bs.hc_rates[4] AS high_confidence_rate_80,
+        bs.hc_rates[5] AS high_confidence_rate_85,
+        bs.hc_rates[6] AS high_confidence_rate_90,
         bs.avg_consumption_kwh_month, 
         bs.avg_energy_demand_kwh_year,
+        bs.avg_std_consumption_kwh_month,
         ab.geom
     FROM 
         administrative_boundaries ab
@@ -414,7 +415,9 @@ def create_vector_tile_views():
     CREATE MATERIALIZED VIEW admin_statistics_materialized AS
     SELECT * FROM admin_statistics_view;
     
-    CREATE INDEX IF NOT EXISTS admin_stats_mat_level_idx ON admin_statistics_materialized(level);
+    -- The unique index lets REFRESH MATERIALIZED VIEW CONCURRENTLY run
+    CREATE UNIQUE INDEX IF NOT EXISTS admin_stats_mat_id_idx ON admin_statistics_materialized(id);
+    CREATE INDEX IF NOT EXISTS admin_stats_mat_level_rate_idx ON admin_statistics_materialized(level, electrification_rate) INCLUDE (name, total_buildings);
     CREATE INDEX IF NOT EXISTS admin_stats_mat_geom_idx ON admin_statistics_materialized USING GIST(geom);
     """)
     
@@ -431,6 +434,9 @@ if __name__ == "__main__":
     print("Importing administrative boundaries...")
     import_admin_boundaries()
     
+    print("Subdividing administrative boundaries...")
+    subdivide_admin_boundaries()
+    
     print("Calculating statistics...")
     calculate_statistics()
     
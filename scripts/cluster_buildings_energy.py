@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Physically reorder buildings_energy by (year, grid_node_id).
+
+CLUSTER takes an ACCESS EXCLUSIVE lock and rewrites the table and all its
+indexes, so run it in a maintenance window after large imports or once
+updates have scattered rows across the heap. Restoring the order keeps the
+year BRIN ranges tight and per-grid-node aggregates reading adjacent pages.
+"""
+
+import logging
+import time
+import sys
+from pathlib import Path
+from sqlalchemy import text
+
+# Add the parent directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.db.session import engine
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def cluster_buildings_energy():
+    """CLUSTER buildings_energy on ix_be_year_grid and refresh its statistics."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        start = time.time()
+        conn.execute(text("CLUSTER buildings_energy USING ix_be_year_grid"))
+        logger.info(f"Clustered buildings_energy in {time.time() - start:.2f}s")
+
+        start = time.time()
+        conn.execute(text("ANALYZE buildings_energy"))
+        logger.info(f"Analyzed buildings_energy in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    cluster_buildings_energy()
@@ -38,7 +38,7 @@ def create_grid_nodes_table(engine):
         # Create the grid_nodes table
         conn.execute(text("""
             CREATE TABLE IF NOT EXISTS grid_nodes (
-                node_id BIGSERIAL PRIMARY KEY,
+                node_id SERIAL PRIMARY KEY,
                 location geometry(Point, 4326),
                 node_name VARCHAR(255),
                 node_type VARCHAR(50),
@@ -64,10 +64,10 @@ def create_grid_lines_table(engine):
         # Create the grid_lines table
         conn.execute(text("""
             CREATE TABLE IF NOT EXISTS grid_lines (
-                line_id BIGSERIAL PRIMARY KEY,
+                line_id SERIAL PRIMARY KEY,
                 path geometry(LineString, 4326),
-                from_node_id BIGINT,
-                to_node_id BIGINT,
+                from_node_id INTEGER,
+                to_node_id INTEGER,
                 from_node_name VARCHAR(255),
                 to_node_name VARCHAR(255),
                 voltage_kv INTEGER,
@@ -380,9 +380,9 @@ def import_power_plants(engine):
                     SELECT COUNT(*) FROM power_plants 
                     WHERE plant_name = :plant_name
                     AND ST_DWithin(
-                        location, 
-                        ST_GeomFromText(:geometry_wkt, 4326),
-                        0.01  -- ~1km at equator
+                        location_geog, 
+                        ST_GeogFromText(:geometry_wkt),
+                        1000  -- meters
                     )
                 """), {
                     'plant_name': row['plant_name'],
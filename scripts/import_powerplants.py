@@ -35,7 +35,7 @@ def create_power_plants_table(engine):
         # Create the power_plants table
         conn.execute(text("""
             CREATE TABLE IF NOT EXISTS power_plants (
-                plant_id BIGSERIAL PRIMARY KEY,
+                plant_id SERIAL PRIMARY KEY,
                 location geometry(Point, 4326),
                 plant_name VARCHAR(255),
                 year INTEGER,
@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
 import os
-import json
+import sys
 import psycopg2
-from psycopg2.extras import Json
 import argparse
 from dotenv import load_dotenv
 import glob
+from pathlib import Path
+
+import orjson
+import shapely
+from sqlalchemy import create_engine, text
+
+# Add the parent directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils.bulk_insert import bulk_insert_unelectrified_buildings
 
 # Load environment variables
 load_dotenv()
@@ -17,6 +26,32 @@ DB_HOST = "localhost"
 DB_PORT = "5438"  # This is the mapped port in docker-compose.dev.yml
 DB_NAME = os.getenv("POSTGRES_DB", "energy_model")
 
+# Table column -> GeoJSON property. Consumption uses a different naming in the
+# source files: "cons (kWh/month)" is stored as consumption_kwh_month
+PROPERTY_COLUMNS = {
+    'origin': 'origin',
+    'origin_id': 'origin_id',
+    'origin_origin_id': 'origin_origin_id',
+    'area_in_meters': 'area_in_meters',
+    'n_bldgs_1km_away': 'n_bldgs_1km_away',
+    'lulc2023_built_area_n1': 'lulc2023_built_area_N1',
+    'lulc2023_rangeland_n1': 'lulc2023_rangeland_N1',
+    'lulc2023_crops_n1': 'lulc2023_crops_N1',
+    'lulc2023_built_area_n11': 'lulc2023_built_area_N11',
+    'lulc2023_rangeland_n11': 'lulc2023_rangeland_N11',
+    'lulc2023_crops_n11': 'lulc2023_crops_N11',
+    'ntl2023_n1': 'ntl2023_N1',
+    'ntl2023_n11': 'ntl2023_N11',
+    'ookla_fixed_20230101_avg_d_kbps': 'ookla_fixed_20230101_avg_d_kbps',
+    'ookla_fixed_20230101_devices': 'ookla_fixed_20230101_devices',
+    'ookla_mobile_20230101_avg_d_kbps': 'ookla_mobile_20230101_avg_d_kbps',
+    'ookla_mobile_20230101_devices': 'ookla_mobile_20230101_devices',
+    'predicted_prob': 'predicted_prob',
+    'predicted_electrified': 'predicted_electrified',
+    'consumption_kwh_month': 'cons (kWh/month)',
+    'std_consumption_kwh_month': 'std cons (kWh/month)',
+}
+
 def import_unelectrified_buildings(directory_path, db_params=None):
     """
     Imports unelectrified buildings from multiple GeoJSON files into PostgreSQL database.
@@ -39,11 +74,12 @@ def import_unelectrified_buildings(directory_path, db_params=None):
             'port': DB_PORT
         }
     
-    # Connect to the database
+    # Connect to the database; the engine reuses the psycopg2 parameters so
+    # the batch can go through the shared unnest bulk insert
     try:
         print(f"Connecting to database: {db_params['host']}:{db_params['port']}/{db_params['dbname']}")
-        conn = psycopg2.connect(**db_params)
-        cursor = conn.cursor()
+        engine = create_engine("postgresql+psycopg2://", creator=lambda: psycopg2.connect(**db_params))
+        conn = engine.connect()
         print("Connected to the database")
     except Exception as e:
         print(f"Error connecting to database: {e}")
@@ -51,7 +87,7 @@ def import_unelectrified_buildings(directory_path, db_params=None):
     
     # First clear existing data to avoid duplicates
     try:
-        cursor.execute("DELETE FROM unelectrified_buildings")
+        conn.execute(text("DELETE FROM unelectrified_buildings"))
         print("Cleared existing buildings data")
     except Exception as e:
         print(f"Error clearing existing data: {e}")
@@ -72,85 +108,48 @@ def import_unelectrified_buildings(directory_path, db_params=None):
         print(f"Processing file: {file_name}")
         
         # Read the GeoJSON file
-        with open(file_path, 'r') as f:
+        with open(file_path, 'rb') as f:
             try:
-                geojson_data = json.load(f)
-            except json.JSONDecodeError as e:
+                geojson_data = orjson.loads(f.read())
+            except orjson.JSONDecodeError as e:
                 print(f"Error parsing GeoJSON file {file_name}: {e}")
                 continue
         
-        # Process and insert features
         features = geojson_data.get('features', [])
-        inserted_count = 0
-        error_count = 0
         
-        for feature in features:
-            try:
-                properties = feature.get('properties', {})
-                geometry = feature.get('geometry', {})
-                
-                # Extract properties with proper column names
-                origin = properties.get('origin')
-                origin_id = properties.get('origin_id')
-                origin_origin_id = properties.get('origin_origin_id')
-                area_in_meters = properties.get('area_in_meters')
-                n_bldgs_1km_away = properties.get('n_bldgs_1km_away')
-                lulc2023_built_area_n1 = properties.get('lulc2023_built_area_N1')
-                lulc2023_rangeland_n1 = properties.get('lulc2023_rangeland_N1')
-                lulc2023_crops_n1 = properties.get('lulc2023_crops_N1')
-                lulc2023_built_area_n11 = properties.get('lulc2023_built_area_N11')
-                lulc2023_rangeland_n11 = properties.get('lulc2023_rangeland_N11')
-                lulc2023_crops_n11 = properties.get('lulc2023_crops_N11')
-                ntl2023_n1 = properties.get('ntl2023_N1')
-                ntl2023_n11 = properties.get('ntl2023_N11')
-                ookla_fixed_20230101_avg_d_kbps = properties.get('ookla_fixed_20230101_avg_d_kbps')
-                ookla_fixed_20230101_devices = properties.get('ookla_fixed_20230101_devices')
-                ookla_mobile_20230101_avg_d_kbps = properties.get('ookla_mobile_20230101_avg_d_kbps')
-                ookla_mobile_20230101_devices = properties.get('ookla_mobile_20230101_devices')
-                predicted_prob = properties.get('predicted_prob')
-                predicted_electrified = properties.get('predicted_electrified')
-                
-                # Handle consumption data - note the different format in source vs table
-                # In the GeoJSON, it's "cons (kWh/month)" but in DB it's "consumption_kwh_month"
-                consumption_kwh_month = properties.get('cons (kWh/month)')
-                std_consumption_kwh_month = properties.get('std cons (kWh/month)')
-                
-                # Convert GeoJSON geometry to PostGIS format
-                geom_str = json.dumps(geometry)
-                
-                # Insert into database
-                cursor.execute("""
-                    INSERT INTO unelectrified_buildings 
-                    (origin, origin_id, origin_origin_id, area_in_meters, n_bldgs_1km_away, 
-                    lulc2023_built_area_n1, lulc2023_rangeland_n1, lulc2023_crops_n1, 
-                    lulc2023_built_area_n11, lulc2023_rangeland_n11, lulc2023_crops_n11, 
-                    ntl2023_n1, ntl2023_n11, 
-                    ookla_fixed_20230101_avg_d_kbps, ookla_fixed_20230101_devices, 
-                    ookla_mobile_20230101_avg_d_kbps, ookla_mobile_20230101_devices, 
-                    predicted_prob, predicted_electrified, consumption_kwh_month, 
-                    std_consumption_kwh_month, geom)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 
-                    ST_SetSRID(ST_GeomFromGeoJSON(%s), 4326))
-                """, (
-                    origin, origin_id, origin_origin_id, area_in_meters, n_bldgs_1km_away,
-                    lulc2023_built_area_n1, lulc2023_rangeland_n1, lulc2023_crops_n1,
-                    lulc2023_built_area_n11, lulc2023_rangeland_n11, lulc2023_crops_n11,
-                    ntl2023_n1, ntl2023_n11,
-                    ookla_fixed_20230101_avg_d_kbps, ookla_fixed_20230101_devices,
-                    ookla_mobile_20230101_avg_d_kbps, ookla_mobile_20230101_devices,
-                    predicted_prob, predicted_electrified, consumption_kwh_month,
-                    std_consumption_kwh_month, geom_str
-                ))
-                inserted_count += 1
-            except Exception as e:
+        # Parse every geometry in one vectorized GEOS call; unparseable ones
+        # come back as None and anything but a Polygon is skipped as well,
+        # since one bad row would fail the whole batch insert
+        geoms = shapely.from_geojson(
+            [orjson.dumps(feature.get('geometry')) for feature in features],
+            on_invalid='ignore',
+        )
+        geoms[shapely.get_type_id(geoms) != shapely.GeometryType.POLYGON] = None
+        geom_ewkbs = shapely.to_wkb(shapely.set_srid(geoms, 4326), hex=True, include_srid=True, output_dimension=2)
+        
+        rows = []
+        error_count = 0
+        for feature, geom_ewkb in zip(features, geom_ewkbs):
+            if geom_ewkb is None:
                 error_count += 1
-                if error_count < 10:  # Limit error output to avoid overwhelming logs
-                    print(f"Error inserting building: {e}")
-                elif error_count == 10:
-                    print("Additional errors will not be displayed...")
+                continue
+            properties = feature.get('properties', {})
+            row = {column: properties.get(source) for column, source in PROPERTY_COLUMNS.items()}
+            row['geom'] = geom_ewkb
+            rows.append(row)
+        
+        if error_count:
+            print(f"Skipped {error_count} features with invalid or non-polygon geometries")
         
-        # Commit changes for this file
-        conn.commit()
+        # Insert the whole file as one INSERT ... SELECT FROM unnest(arrays)
+        try:
+            inserted_count = bulk_insert_unelectrified_buildings(conn, rows)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"Error inserting buildings from {file_name}: {e}")
+            error_count += len(rows)
+            inserted_count = 0
         
         total_inserted += inserted_count
         total_errors += error_count
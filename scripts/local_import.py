@@ -10,22 +10,27 @@ import argparse
 from pathlib import Path
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
-from geoalchemy2 import WKTElement
 import geopandas as gpd
-from shapely.geometry import Polygon, MultiPolygon
 from dotenv import load_dotenv
 
 # Add the parent directory to the path so we can import app modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import app models
-from app.models.buildings_energy import BuildingsEnergy
+from app.utils.project_areas import to_multipolygon_ewkb
+from app.utils.bulk_insert import bulk_insert_buildings
 from app.db.base import Base
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Attribute columns copied from the GeoPackage batches; missing ones are NULL
+IMPORT_COLUMNS = [
+    "area_in_meters", "year", "energy_demand_kwh", "has_access", "building_type",
+    "data_source", "grid_node_id", "origin_id",
+]
+
 # Load environment variables
 load_dotenv()
 
@@ -95,39 +100,20 @@ def import_batch(batch_file, batch_num, total_batches):
     session = Session()
     
     try:
-        # Prepare batch of records for insert
-        records = []
-        for _, row in gdf.iterrows():
-            # Convert simple Polygons to MultiPolygons if needed
-            geom = row.geometry
-            if isinstance(geom, Polygon):
-                geom = MultiPolygon([geom])
-                
-            # Convert geometry to WKT format for PostGIS
-            geom_wkt = WKTElement(geom.wkt, srid=4326)
-            
-            # Create BuildingsEnergy object
-            building = BuildingsEnergy(
-                geom=geom_wkt,
-                area_in_meters=row.area_in_meters if hasattr(row, 'area_in_meters') else None,
-                year=row.year,
-                energy_demand_kwh=row.energy_demand_kwh if hasattr(row, 'energy_demand_kwh') else None,
-                has_access=row.has_access if hasattr(row, 'has_access') else None,
-                building_type=row.building_type if hasattr(row, 'building_type') else None,
-                data_source=row.data_source if hasattr(row, 'data_source') else None,
-                grid_node_id=row.grid_node_id if hasattr(row, 'grid_node_id') else None,
-                origin_id=row.origin_id if hasattr(row, 'origin_id') else None,
-            )
-            records.append(building)
-        
-        # Bulk insert
-        session.bulk_save_objects(records)
+        # Convert all geometries to EWKB in one vectorized pass and send the
+        # batch as one INSERT ... SELECT FROM unnest(arrays) statement
+        rows = (
+            gdf.reindex(columns=IMPORT_COLUMNS)
+            .assign(geom=to_multipolygon_ewkb(gdf.geometry.values))
+            .to_dict("records")
+        )
+        bulk_insert_buildings(session, rows)
         session.commit()
         
         elapsed_time = time.time() - start_time
-        logger.info(f"Imported {len(records)} buildings from {batch_file.name} in {elapsed_time:.2f} seconds")
+        logger.info(f"Imported {len(rows)} buildings from {batch_file.name} in {elapsed_time:.2f} seconds")
         
-        return len(records)
+        return len(rows)
     
     except Exception as e:
         session.rollback()
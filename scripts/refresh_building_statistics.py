@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Refresh the denormalized building_statistics table.
+
+Commune rows are upserted from a single GROUP BY over buildings_energy and
+then rolled up the administrative hierarchy. The admin_statistics_materialized
+view the metrics endpoints read from is refreshed afterwards. Run after
+importing buildings and on a schedule (e.g. from cron).
+"""
+
+import logging
+import time
+import sys
+from pathlib import Path
+from sqlalchemy import text
+
+# Add the parent directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.db.session import engine
+from app.models.building_statistics import HC_THRESHOLDS
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+COUNT_COLUMNS = ["total_buildings", "electrified_buildings", "unelectrified_buildings", "hc_counts"]
+AVG_COLUMNS = ["avg_consumption_kwh_month", "avg_energy_demand_kwh_year", "avg_std_consumption_kwh_month"]
+
+
+def _hc_array(element: str) -> str:
+    """ARRAY[...] with one element per threshold; element is formatted with t (percent) and i (1-based)."""
+    return "ARRAY[" + ", ".join(
+        element.format(t=t, i=i) for i, t in enumerate(HC_THRESHOLDS, start=1)
+    ) + "]"
+
+
+# Rates are derived from the counts so the response needs no per-request math
+RATE_EXPRESSIONS = {
+    "electrification_rate": "CASE WHEN s.total_buildings > 0 THEN s.electrified_buildings::float / s.total_buildings * 100 ELSE 0 END",
+    "hc_rates": _hc_array("CASE WHEN s.total_buildings > 0 THEN s.hc_counts[{i}]::float / s.total_buildings * 100 ELSE 0 END"),
+}
+
+COMMUNE_AGGREGATES = f"""
+    COUNT(be.id) AS total_buildings,
+    COUNT(be.id) FILTER (WHERE be.predicted_electrified = 1) AS electrified_buildings,
+    COUNT(be.id) FILTER (WHERE be.predicted_electrified = 0 OR be.predicted_electrified IS NULL) AS unelectrified_buildings,
+    {_hc_array("COUNT(be.id) FILTER (WHERE be.predicted_electrified = 1 AND be.predicted_prob > {t} / 100.0)")}::integer[] AS hc_counts,
+    AVG(be.consumption_kwh_month) AS avg_consumption_kwh_month,
+    AVG(be.energy_demand_kwh) AS avg_energy_demand_kwh_year,
+    AVG(be.std_consumption_kwh_month) AS avg_std_consumption_kwh_month
+"""
+
+# Each building is assigned to the one commune containing a point on its
+# surface, looked up through the subdivided boundaries
+COMMUNE_BUILDINGS = """
+    SELECT c.admin_id AS commune_id, b.*
+    FROM buildings_energy b
+    CROSS JOIN LATERAL (
+        SELECT s.admin_id
+        FROM administrative_boundary_subdivisions s
+        JOIN administrative_boundaries sab ON sab.id = s.admin_id
+        WHERE sab.level = 'commune' AND ST_Intersects(s.geom, ST_PointOnSurface(b.geom))
+        LIMIT 1
+    ) c
+"""
+
+PARENT_AGGREGATES = ",\n    ".join(
+    [f"SUM(child_stats.{c}) AS {c}" for c in COUNT_COLUMNS if c != "hc_counts"]
+    + [f"{_hc_array('SUM(child_stats.hc_counts[{i}])')}::integer[] AS hc_counts"]
+    + [f"AVG(child_stats.{c}) AS {c}" for c in AVG_COLUMNS]
+)
+
+
+def _upsert(source_query: str) -> str:
+    """Wrap a per-admin aggregate in one INSERT ... ON CONFLICT (admin_id) DO UPDATE."""
+    columns = COUNT_COLUMNS + AVG_COLUMNS + list(RATE_EXPRESSIONS)
+    rates = ",\n        ".join(RATE_EXPRESSIONS.values())
+    return f"""
+    INSERT INTO building_statistics (admin_id, {", ".join(columns)}, updated_at)
+    SELECT
+        s.admin_id,
+        {", ".join(f"s.{c}" for c in COUNT_COLUMNS + AVG_COLUMNS)},
+        {rates},
+        NOW()
+    FROM ({source_query}) s
+    ON CONFLICT (admin_id) DO UPDATE SET
+        {", ".join(f"{c} = EXCLUDED.{c}" for c in columns)},
+        updated_at = EXCLUDED.updated_at
+    """
+
+
+def refresh_building_statistics():
+    """Recompute commune statistics and roll them up to the parent levels."""
+    with engine.connect() as conn:
+        start = time.time()
+        conn.execute(text(_upsert(f"""
+            SELECT ab.id AS admin_id, {COMMUNE_AGGREGATES}
+            FROM administrative_boundaries ab
+            LEFT JOIN ({COMMUNE_BUILDINGS}) be ON be.commune_id = ab.id
+            WHERE ab.level = 'commune'
+            GROUP BY ab.id
+        """)))
+        conn.commit()
+        logger.info(f"Commune statistics refreshed in {time.time() - start:.2f}s")
+
+        for level_name in ["arrondissement", "department", "region"]:
+            start = time.time()
+            conn.execute(text(_upsert(f"""
+                SELECT parent.id AS admin_id, {PARENT_AGGREGATES}
+                FROM administrative_boundaries parent
+                JOIN administrative_boundaries child ON child.parent_id = parent.id
+                JOIN building_statistics child_stats ON child_stats.admin_id = child.id
+                WHERE parent.level = :level
+                GROUP BY parent.id
+            """)), {"level": level_name})
+            conn.commit()
+            logger.info(f"{level_name} statistics aggregated in {time.time() - start:.2f}s")
+
+        # The upserts leave every page dirty; VACUUM resets the visibility map
+        # so the covering indexes can serve index-only scans again
+        start = time.time()
+        conn.execution_options(isolation_level="AUTOCOMMIT").execute(
+            text("VACUUM (ANALYZE) building_statistics")
+        )
+        logger.info(f"Vacuumed building_statistics in {time.time() - start:.2f}s")
+
+        start = time.time()
+        conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY admin_statistics_materialized"))
+        conn.commit()
+        logger.info(f"Refreshed admin_statistics_materialized in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    refresh_building_statistics()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Refresh the precomputed project and project area building statistics.
+
+Run after importing buildings and periodically (e.g. from cron) so new or
+edited project areas are picked up. Areas changed since the last refresh
+are served from the live query until then.
+"""
+
+import logging
+import time
+import sys
+from pathlib import Path
+from sqlalchemy import text
+
+# Add the parent directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.db.session import engine
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+VIEWS = ["project_area_stats_mv", "project_stats_mv"]
+
+
+def refresh_project_stats():
+    """Refresh the stats views without blocking readers."""
+    with engine.connect() as conn:
+        for view in VIEWS:
+            start = time.time()
+            conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+            conn.commit()
+            logger.info(f"Refreshed {view} in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    refresh_project_stats()
@@ -42,7 +42,7 @@ def update_schemas(engine):
         # Create new grid_nodes table
         conn.execute(text("""
             CREATE TABLE IF NOT EXISTS grid_nodes (
-                node_id BIGSERIAL PRIMARY KEY,
+                node_id SERIAL PRIMARY KEY,
                 year INTEGER NOT NULL,
                 location geometry(Point, 4326) NOT NULL,
                 properties JSONB DEFAULT '{}'::jsonb
@@ -56,7 +56,7 @@ def update_schemas(engine):
         # Create new grid_lines table
         conn.execute(text("""
             CREATE TABLE IF NOT EXISTS grid_lines (
-                line_id BIGSERIAL PRIMARY KEY,
+                line_id SERIAL PRIMARY KEY,
                 year INTEGER NOT NULL,
                 path geometry(LineString, 4326) NOT NULL,
                 properties JSONB DEFAULT '{}'::jsonb
@@ -70,7 +70,7 @@ def update_schemas(engine):
         # Create new power_plants table
         conn.execute(text("""
             CREATE TABLE IF NOT EXISTS power_plants (
-                plant_id BIGSERIAL PRIMARY KEY,
+                plant_id SERIAL PRIMARY KEY,
                 year INTEGER NOT NULL,
                 location geometry(Point, 4326) NOT NULL,
                 properties JSONB DEFAULT '{}'::jsonb